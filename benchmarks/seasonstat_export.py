@@ -0,0 +1,71 @@
+#! python3
+# benchmarks/seasonstat_export.py
+
+"""
+Compares the export modes of :py:class:`fangraphs.leaders.leaders.SeasonStat`
+against the live `Season Stat Grid`_ page:
+
+- ``pages``: clicks through every page of the data table, re-parsing the page each time
+- ``single``: sets the data table to its largest page size and parses the table once
+- ``capture``: decodes the captured response of the data endpoint
+
+Usage::
+
+    python benchmarks/seasonstat_export.py --repeat 3 --stat Pitching
+
+.. _Season Stat Grid: https://fangraphs.com/leaders/season-stat-grid
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from fangraphs.leaders.leaders import SeasonStat
+
+
+MODES = ("pages", "single", "capture")
+
+
+def run(mode, stat):
+    """
+    Exports the leaderboard once with the export mode ``mode``.
+
+    :return: The seconds taken by the export, the rows written and the page parses
+    :rtype: tuple
+    """
+    path = f"out/benchmark-{mode}.csv"
+    with SeasonStat(capture=mode == "capture") as scraper:
+        if stat:
+            scraper.configure("stat", stat)
+        parses = scraper.parses
+        start = time.perf_counter()
+        scraper.export(path, single_pass=mode == "single")
+        elapsed = time.perf_counter() - start
+        parses = scraper.parses - parses
+    with open(path, encoding="utf-8") as file:
+        rows = sum(1 for _ in file) - 1
+    os.remove(path)
+    return elapsed, rows, parses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stat", default="")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'median (s)':>10} {'best (s)':>9} {'rows':>6} {'parses':>7}")
+    for mode in args.modes:
+        results = [run(mode, args.stat) for _ in range(args.repeat)]
+        times = [r[0] for r in results]
+        _, rows, parses = results[-1]
+        print(
+            f"{mode:<8} {statistics.median(times):>10.2f} {min(times):>9.2f} "
+            f"{rows:>6} {parses:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
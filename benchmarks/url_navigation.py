@@ -0,0 +1,62 @@
+#! python3
+# benchmarks/url_navigation.py
+
+"""
+Compares the configure latency of clicking each filter query (``configure_many``)
+against a single navigation to the URL of the filter configuration (``navigate``),
+on the live FanGraphs pages which encode their filters in the URL.
+
+Usage::
+
+    python benchmarks/url_navigation.py --repeat 3
+"""
+
+import argparse
+import statistics
+import time
+
+from fangraphs.leaders import leaders
+
+
+CONFIGURATIONS = {
+    "GameSpan": {"stat": "Pitching", "single_season": "2019"},
+    "International": {"stat": "Pitching", "single_season": "2019"},
+    "SeasonStat": {"stat": "Pitching", "start_season": "2010", "end_season": "2019"},
+}
+
+
+def run(name, mode):
+    """
+    Configures the page of the scraper class ``name`` once.
+
+    :param name: The name of the class in :py:mod:`fangraphs.leaders.leaders`
+    :param mode: ``"click"`` or ``"url"``
+    :return: The seconds taken to configure the page
+    :rtype: float
+    """
+    filters = CONFIGURATIONS[name]
+    with getattr(leaders, name)() as scraper:
+        start = time.perf_counter()
+        if mode == "url":
+            scraper.navigate(filters)
+        else:
+            scraper.configure_many(filters)
+        scraper.soup  # Parse the configured page, as configure does
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--pages", nargs="+", choices=list(CONFIGURATIONS), default=list(CONFIGURATIONS))
+    args = parser.parse_args()
+
+    print(f"{'page':<14} {'click (s)':>10} {'url (s)':>8} {'speedup':>8}")
+    for name in args.pages:
+        click = statistics.median(run(name, "click") for _ in range(args.repeat))
+        url = statistics.median(run(name, "url") for _ in range(args.repeat))
+        print(f"{name:<14} {click:>10.2f} {url:>8.2f} {click / url:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
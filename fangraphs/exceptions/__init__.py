@@ -66,3 +66,134 @@ class InvalidQuickSplit(Exception):
         self.quick_split = quick_split
         self.message = f"No quick split '{self.quick_split}` could be found"
         super().__init__(self.message)
+
+
+class BrowserPoolExhausted(Exception):
+    """
+    Raised when a page is requested from a browser pool which has no free slots.
+    """
+    def __init__(self, capacity):
+        """
+        :param capacity: The maximum number of pages which the pool can lend out
+        """
+        self.capacity = capacity
+        self.message = f"All {self.capacity} browser pool slots are in use"
+        super().__init__(self.message)
+
+
+class TableNotFound(Exception):
+    """
+    Raised when the data table of a leaderboard cannot be found in a response.
+    """
+    def __init__(self, selector):
+        """
+        :param selector: The CSS selector of the data table
+        """
+        self.selector = selector
+        self.message = f"No data table matching '{self.selector}' could be found"
+        super().__init__(self.message)
+
+
+class PostbackRejected(Exception):
+    """
+    Raised when a replayed ASP.NET postback does not return the exported data.
+    This usually occurs when the page no longer accepts the stored hidden-field state.
+    """
+    def __init__(self, target):
+        """
+        :param target: The event target of the postback
+        """
+        self.target = target
+        self.message = f"The postback of '{self.target}' did not return a CSV file"
+        super().__init__(self.message)
+
+
+class ResponseNotCaptured(Exception):
+    """
+    Raised when the data endpoint of a leaderboard did not respond since the page was opened.
+    """
+    def __init__(self, endpoint):
+        """
+        :param endpoint: The URL path of the data endpoint
+        """
+        self.endpoint = endpoint
+        self.message = f"No response from '{self.endpoint}' has been captured"
+        super().__init__(self.message)
+
+
+class CatalogNotFound(Exception):
+    """
+    Raised when the options of a filter query are listed without a page
+    and no catalog of filter query options has been saved.
+    """
+    def __init__(self, path):
+        """
+        :param path: The path of the catalog file
+        """
+        self.path = path
+        self.message = (
+            f"No option catalog was found at '{self.path}'. "
+            "Run 'python -m fangraphs.leaders.catalog' to create it"
+        )
+        super().__init__(self.message)
+
+
+class StateMismatch(Exception):
+    """
+    Raised when the tracked filter-state model of a scraper disagrees with the page.
+    """
+    def __init__(self, mismatches):
+        """
+        :param mismatches: Mapping of filter queries to their tracked and actual options
+        """
+        self.mismatches = mismatches
+        details = ", ".join(
+            f"{q}: tracked {t!r}, page {a!r}" for q, (t, a) in self.mismatches.items()
+        )
+        self.message = f"The tracked filter state does not match the page ({details})"
+        super().__init__(self.message)
+
+
+class URLStateUnsupported(Exception):
+    """
+    Raised when a filter configuration is navigated to on a page
+    which does not encode its filter configuration in the URL.
+    """
+    def __init__(self, page):
+        """
+        :param page: The name of the scraper class
+        """
+        self.page = page
+        self.message = f"{self.page} does not encode its filter configuration in the URL"
+        super().__init__(self.message)
+
+
+class ShardsFailed(Exception):
+    """
+    Raised when at least one shard of a sharded export could not be exported.
+    """
+    def __init__(self, failures):
+        """
+        :param failures: Mapping of the paths of the failed shards to their exceptions
+        """
+        self.failures = failures
+        details = ", ".join(
+            f"{p}: {e!r}" for p, e in self.failures.items()
+        )
+        self.message = f"{len(self.failures)} shard(s) could not be exported ({details})"
+        super().__init__(self.message)
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when a scheduled job is not exported before its deadline.
+    """
+    def __init__(self, path, deadline):
+        """
+        :param path: The export path of the job
+        :param deadline: The seconds which the job was allowed
+        """
+        self.path = path
+        self.deadline = deadline
+        self.message = f"The export to '{self.path}' did not finish within {self.deadline} seconds"
+        super().__init__(self.message)
@@ -5,22 +5,332 @@
 Subpackage for scraping the FanGraphs **Leaders** pages.
 """
 
-import datetime
 import os
+import re
+import time
 
 import bs4
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
+import fangraphs.exceptions
+from fangraphs import selectors
+from fangraphs.leaders import catalog, ratelimit, tables, urls
+from fangraphs.leaders.pool import get_pool
 
-class ScrapingUtilities:
+
+#: JavaScript predicate of ``page.wait_for_function``, which is true once the number of elements
+#: matching the selector ``arg[0]`` differs from the count ``arg[1]``
+ROWS_CHANGED = "([selector, count]) => document.querySelectorAll(selector).length !== count"
+
+
+def _normalize_option(option):
+    """
+    Normalizes an option for comparison: case is ignored, as is the order of multiple options.
+    """
+    if isinstance(option, (list, tuple)):
+        return sorted(str(o).lower() for o in option)
+    return str(option).lower()
+
+
+def gray_product(grid):
+    """
+    Lists every combination of the options of several filter queries,
+    ordered so that consecutive combinations differ in the option of exactly one filter query
+    (a reflected mixed-radix Gray code).
+
+    :param grid: Mapping of filter queries to the options to combine
+    :return: Mappings of each filter query to an option
+    :rtype: list
+    """
+    combinations = [{}]
+    for query, options in grid.items():
+        options = list(options)
+        combinations = [
+            {**combination, query: option}
+            for index, combination in enumerate(combinations)
+            for option in (options if index % 2 == 0 else options[::-1])
+        ]
+    return combinations
+
+
+def toggled_options(current, options):
+    """
+    Lists the options to toggle so that a filter query which holds multiple options
+    holds exactly ``options``.
+
+    :param current: The options which the filter query currently holds
+    :param options: The option, or options, which the filter query should hold
+    :return: The wanted options which are not held, then the held options which are not wanted
+    :rtype: list
+    """
+    if isinstance(options, str):
+        options = [options]
+    current = {str(o).lower() for o in current}
+    wanted = {str(o).lower() for o in options}
+    toggled = [o for o in options if str(o).lower() not in current]
+    toggled.extend(sorted(current - wanted))
+    return toggled
+
+
+def combination_name(combination):
+    """
+    :param combination: Mapping of filter queries to an option, or to a list of options
+    :return: A name which identifies the combination, e.g. ``handedness-vs L+as R_home_away-Home``
+    :rtype: str
+    """
+    return "_".join(
+        f"{q}-{'+'.join(o) if isinstance(o, (list, tuple)) else o}"
+        for q, o in combination.items()
+    )
+
+
+def export_path(name, directory="out", format=None):
+    """
+    :param name: The name of the export, e.g. a quick split or :py:func:`combination_name`
+    :param directory: The directory to export to
+    :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``
+    :return: The path to export to, with the characters which are unsafe in file names replaced
+    :rtype: str
+    """
+    name = re.sub(r"[^\w.+-]+", "-", name) + tables.FORMATS.get(format, ".csv")
+    return tables.resolve_path(os.path.join(directory, name), format)
+
+
+class FilterUtilities:
+    """
+    The bookkeeping of :py:class:`ScrapingUtilities` and :py:class:`AsyncScrapingUtilities`
+    which does not touch the page: the filter configuration and its tracked state, URLs,
+    the option catalog, the export cache, and how the filter queries are parsed from :py:attr:`soup`.
+    Subclasses set :py:attr:`address`, :py:attr:`filters`, :py:attr:`state`, :py:attr:`cache`
+    and :py:attr:`capture`.
+    The filter queries of each page are described by a subclass in :py:mod:`fangraphs.leaders.pages`.
+    """
+    #: Filter queries whose options change when the filter query of the key is configured
+    _coupled = {}
+
+    #: The class in :py:mod:`fangraphs.selectors.leaders_params` which describes the query string
+    #: of the page, if the page encodes its filter configuration in its URL
+    _params = None
+
+    #: The class in :py:mod:`fangraphs.selectors.leaders_sel` which holds the CSS selectors of the page
+    _sel = None
+
+    #: The CSS selector of the **Export Data** button of the page
+    _export_button = ".data-export"
+
+    #: If ``True``, configuring a filter query sends a request, so each click waits for the rate limiter
+    _throttle_filters = False
+
+    #: Mapping of the filter queries to their ``fangraphs.selectors`` objects, once compiled
+    _selectors = {}
+
+    @classmethod
+    def list_queries(cls):
+        """
+        Lists the possible filter queries which can be used to modify search results.
+
+        :return: Filter queries which can be used to modify search results
+        :rtype: list
+        """
+        queries = []
+        for kind in ("selections", "dropdowns", "splits", "switches"):
+            queries.extend(getattr(cls._sel, kind, {}))
+        return queries
+
+    def _compile_selectors(self):
+        """
+        Creates the ``fangraphs.selectors`` object of each filter query in :py:attr:`_selectors`.
+        """
+
+    def _filter(self, query):
+        """
+        :param query: The filter query
+        :return: The ``fangraphs.selectors`` object of the filter query
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        try:
+            return self._selectors[query.lower()]
+        except KeyError as err:
+            raise fangraphs.exceptions.InvalidFilterQuery(query) from err
+
+    def _multiple(self, query):
+        """
+        :return: ``True`` if the filter query holds multiple options and configuring an option toggles it
+        :rtype: bool
+        """
+        return False
+
+    def _parse_options(self, query):
+        """
+        Lists the options of a filter query shown in :py:attr:`soup`.
+
+        :param query: The filter query
+        :return: Options which the filter query can be configured to
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        elem = self._filter(query)
+        if isinstance(elem, selectors.Switches):
+            return ["True", "False"]
+        return elem.list_options()
+
+    def _parse_option(self, query):
+        """
+        Retrieves the option which a filter query is set to in :py:attr:`soup`.
+
+        :param query: The filter query being retrieved of its current option
+        :return: The option which the filter query is currently set to
+        :rtype: str
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        return self._filter(query).current_option()
+
+    @staticmethod
+    def _switch_option(option):
+        """
+        :param option: The option to set a switch-class filter query to
+        :return: ``"True"`` or ``"False"``
+        :rtype: str
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+        """
+        if str(option).lower() not in ("true", "false"):
+            raise fangraphs.exceptions.InvalidFilterOption(option)
+        return str(option).title()
+
+    @property
+    def parses_avoided(self):
+        """
+        The number of page changes after which :py:attr:`soup` was never read,
+        i.e. the number of parses which were skipped.
+
+        :rtype: int
+        """
+        return self.refreshes - self.parses
+
+    def _query_params(self, filters):
+        """
+        Translates a filter configuration into the query-string parameters of the page.
+
+        :param filters: Mapping of filter queries to options
+        :rtype: dict
+        """
+        return urls.query_params(self._params, filters)
+
+    def url(self, filters):
+        """
+        Builds the URL of the page configured to a filter configuration.
+
+        :param filters: Mapping of filter queries to options.
+            The filter queries which are left out keep their default options.
+        :return: The URL which encodes the filter configuration
+        :rtype: str
+        :raises FanGraphs.exceptions.URLStateUnsupported: The page does not encode its filters in its URL
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query cannot be expressed in the URL,
+            e.g. one of the ``unsupported`` filter queries of :py:attr:`_params`
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        if self._params is None:
+            raise fangraphs.exceptions.URLStateUnsupported(type(self).__name__)
+        return urls.build_url(self.address, self._query_params(filters))
+
+    def _catalog_options(self, query):
+        """
+        Lists the options of a filter query from the option catalog,
+        which is used while no page is open.
+
+        :param query: The filter query
+        :return: Options which the filter query can be configured to
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        :raises FanGraphs.exceptions.CatalogNotFound: No option catalog has been saved
+        """
+        return catalog.get_catalog().options(type(self).__name__, query)
+
+    def _validate(self, filters):
+        """
+        Checks a filter configuration against the option catalog before any filter query is configured.
+        See :py:func:`fangraphs.leaders.catalog.validate_filters`.
+
+        :param filters: Mapping of filter queries to options
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        catalog.validate_filters(type(self).__name__, filters)
+
+    def _record(self, query, option, *, multiple=False):
+        """
+        Records the option which a filter query was configured to
+        in :py:attr:`filters` and :py:attr:`state`.
+
+        :param query: The filter query
+        :param option: The option which the filter query was configured to
+        :param multiple: If ``True``, the filter query holds multiple options
+            and configuring an option toggles it
+        """
+        if multiple:
+            options = set(self.filters.get(query, ())) ^ {str(option).lower()}
+            self.filters[query] = sorted(options)
+            self.state.pop(query, None)
+        else:
+            self.filters[query] = str(option).lower()
+            self.state[query] = option
+        for coupled in self._coupled.get(query, ()):
+            self.state.pop(coupled, None)
+
+    def _from_cache(self, path):
+        """
+        Copies the cached export of the current filter configuration to ``path``.
+
+        :param path: The path to save the exported file to
+        :return: ``True`` if the export was served from :py:attr:`cache`
+        :rtype: bool
+        """
+        if self.cache is None:
+            return False
+        return self.cache.get(
+            type(self).__name__, self.filters, path, capture=self.capture
+        ) is not None
+
+    def _to_cache(self, path):
+        """
+        Stores the export of the current filter configuration in :py:attr:`cache`.
+
+        :param path: The path of the exported file
+        """
+        if self.cache is not None:
+            self.cache.put(type(self).__name__, self.filters, path, capture=self.capture)
+
+
+class ScrapingUtilities(FilterUtilities):
     """
     Manages the various objects used for scraping the FanGraphs webpages.
-    Intializes and manages ``Playwright`` browsers and pages.
+    Borrows and returns ``Playwright`` pages from a :py:class:`fangraphs.leaders.pool.BrowserPool`.
     Intializes and manages ``bs4.BeautifulSoup`` objects.
     """
-    def __init__(self, address, *, waitfor=""):
+    def __init__(self, address, *, waitfor="", api="", capture=False, pool=None,
+                 resource_filter=None, cache=None,
+                 verify=False, limiter=None, timeout=60.0):
         """
         :param address: The base URL address of the FanGraphs page
+        :param waitfor: The CSS selector to wait for after the page is changed
+        :param api: The URL path of the JSON endpoint which the page loads its data table from
+        :param capture: If ``True``, the responses of the ``api`` endpoint are captured,
+            so the leaderboard can be exported from the JSON data with :py:meth:`export_captured`
+        :param pool: The browser pool to borrow a page from.
+            If not specified, the process-wide pool from :py:func:`fangraphs.leaders.pool.get_pool` is used.
+        :param resource_filter: Aborts the page requests which it does not allow.
+            If not specified, every request is sent.
+        :type resource_filter: fangraphs.leaders.resources.ResourceFilter
+        :param cache: Serves repeated exports of the same filter configuration from disk.
+            If not specified, every export is scraped.
+        :type cache: fangraphs.leaders.cache.ExportCache
+        :param verify: If ``True``, the tracked filter state is checked against the page
+            every time the page changes
+        :param limiter: Rate limits the page loads, navigating clicks and downloads of the scraper.
+            If not specified, the process-wide limiter from
+            :py:func:`fangraphs.leaders.ratelimit.get_limiter` is used, if any.
+        :type limiter: fangraphs.leaders.ratelimit.RateLimiter
+        :param timeout: The seconds to wait for a page load before it fails, or ``0`` to wait indefinitely
         .. py:attribute:: address
             The base URL address of the FanGraphs page
             :type: str
@@ -29,78 +339,990 @@ class ScrapingUtilities:
             :type: playwright.sync_api._generated.Page
         .. py:attribute:: soup
             The ``BeautifulSoup4`` HTML parser for scraping the webpage.
+            The page is only parsed when the parser is read after the page has changed.
             :type: bs4.BeautifulSoup
+        .. py:attribute:: refreshes
+            The number of times the page has changed, each of which invalidates :py:attr:`soup`
+            :type: int
+        .. py:attribute:: parses
+            The number of times the page has actually been parsed
+            :type: int
+        .. py:attribute:: captures
+            The number of responses of the ``api`` endpoint which have been captured
+            :type: int
+        .. py:attribute:: filters
+            The filter queries which have been configured since the page was last reset,
+            mapped to their options
+            :type: dict
+        .. py:attribute:: state
+            The tracked option of each filter query which has been read or configured.
+            Filter queries are read from the page the first time they are needed.
+            :type: dict
         """
         self.address = address
         self.waitfor = waitfor
+        self.api = api
+        self.capture = capture and bool(api)
         os.makedirs("out", exist_ok=True)
 
-        self.__play = None
-        self.__browser = None
+        self.pool = pool
+        self.resource_filter = resource_filter
+        self.cache = cache
+        self.verify = verify
+        self.limiter = limiter
+        self.timeout = timeout
+        self.filters = {}
+        self.state = {}
         self.page = None
 
-        self.soup = None
+        self.__soup = None
+        self.__soup_stale = True
+        self.refreshes = 0
+        self.parses = 0
+
+        self.__response = None
+        self.__pending = 0
+        self.captures = 0
 
     def _browser_init(self):
-        self.__play = sync_playwright().start()
-        self.__browser = self.__play.chromium.launch(
-            downloads_path=os.path.abspath("out")
-        )
-        self.page = self.__browser.new_page(
-            accept_downloads=True
-        )
-        self._refresh_parser()
+        """
+        Borrows a page from the browser pool.
+        """
+        if self.pool is None:
+            self.pool = get_pool()
+        self.page = self.pool.acquire(accept_downloads=True)
+        if self.resource_filter is not None:
+            self.page.route("**/*", self.resource_filter.handle)
+        if self.capture:
+            self.page.on("request", self._on_request)
+            self.page.on("requestfinished", self._on_request_done)
+            self.page.on("requestfailed", self._on_request_done)
+            self.page.on("response", self._on_response)
+        self.__soup_stale = True
+
+    def _on_request(self, request):
+        """
+        Counts the requests to the ``api`` endpoint which are in flight.
+        """
+        if self.api in request.url:
+            self.__pending += 1
+
+    def _on_request_done(self, request):
+        """
+        Counts the requests to the ``api`` endpoint which have finished or failed.
+        """
+        if self.api in request.url:
+            self.__pending = max(self.__pending - 1, 0)
+
+    def _on_response(self, response):
+        """
+        Stores the latest successful response of the ``api`` endpoint.
+        """
+        if self.api in response.url and response.ok:
+            self.__response = response
+            self.captures += 1
+
+    def captured_rows(self, timeout=30.0):
+        """
+        Decodes the latest captured response of the ``api`` endpoint.
+        Requests to the endpoint which are still in flight are waited for first,
+        so the rows match the current filter configuration.
+
+        :param timeout: Seconds to wait for requests in flight
+        :return: The column headers and the rows of the leaderboard
+        :rtype: tuple
+        :raises FanGraphs.exceptions.ResponseNotCaptured: No response has been captured
+        """
+        deadline = time.monotonic() + timeout
+        while self.__pending and time.monotonic() < deadline:
+            self.page.wait_for_timeout(50)
+        if self.__response is None:
+            raise fangraphs.exceptions.ResponseNotCaptured(self.api)
+        return tables.json_rows(self.__response.json())
+
+    def export_captured(self, path=""):
+        """
+        Exports the current leaderboard from the captured JSON data,
+        without clicking any button or paging through the data table.
+        The file will be saved to the filepath ``path``, if specified.
+        Otherwise, the file will be saved to the filepath *out/%d.%m.%y %H.%M.%S.csv*.
+
+        :param path: The path to save the exported file to
+        :return: The path which the file was saved to
+        :rtype: str
+        :raises FanGraphs.exceptions.ResponseNotCaptured: No response has been captured
+        """
+        headers, rows = self.captured_rows()
+        return tables.write(headers, rows, tables.resolve_path(path))
+
+    @property
+    def soup(self):
+        """
+        The ``bs4.BeautifulSoup`` object of the current page.
+        The page is re-parsed only if it has changed since it was last parsed.
+
+        :rtype: bs4.BeautifulSoup
+        """
+        if self.__soup_stale and self.page is not None:
+            self.__soup = bs4.BeautifulSoup(
+                self.page.content(), features="lxml"
+            )
+            self.__soup_stale = False
+            self.parses += 1
+        return self.__soup
+
+    def _mark_stale(self):
+        """
+        Marks :py:attr:`soup` as outdated after the page was changed, without waiting for it.
+        The page is parsed again the next time :py:attr:`soup` is read.
+        """
+        self.__soup_stale = True
 
     def _refresh_parser(self):
         """
-        Re-initializes the ``bs4.BeautifulSoup`` object stored in :py:attr:`soup`.
+        Waits for the page to load and marks :py:attr:`soup` as outdated.
+        The page is parsed again the next time :py:attr:`soup` is read.
         """
         if self.waitfor:
             self.page.wait_for_selector(self.waitfor)
-        self.soup = bs4.BeautifulSoup(
-            self.page.content(), features="lxml"
-        )
+        self._mark_stale()
+        self.refreshes += 1
+        if self.verify:
+            self._check_state()
+
+    def _throttle(self):
+        """
+        Waits for a token of the rate limiter before a request is sent to FanGraphs.
+
+        :return: The seconds waited
+        :rtype: float
+        """
+        limiter = self.limiter or ratelimit.get_limiter()
+        if limiter is None:
+            return 0.0
+        return limiter.acquire()
 
     def _close_ad(self):
         """
         Closes the ad which may interfere with clicking other page elements.
+        Nothing is done if the ad requests are blocked by :py:attr:`resource_filter`.
         """
-        elem = self.page.query_selector(".ezmob-footer-close")
-        if self.soup.select("#ezmob-wrapper > div[style='display: none;']"):
+        if self.resource_filter is not None and self.resource_filter.blocks_ads:
             return
+        if self.page.query_selector("#ezmob-wrapper > div[style='display: none;']"):
+            return
+        elem = self.page.query_selector(".ezmob-footer-close")
         if elem:
             elem.click()
 
+    def current_option(self, query: str):
+        """
+        Retrieves the option which a filter query is currently set to.
+        The option is read from the page the first time, then tracked in :py:attr:`state`.
+
+        :param query: The filter query being retrieved of its current option
+        :return: The option(s) which the filter query is currently set to
+        :rtype: str or list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        if query not in self.state:
+            self.state[query] = self._read_option(query)
+        option = self.state[query]
+        return list(option) if isinstance(option, list) else option
+
+    def _unchanged(self, query, option):
+        """
+        :return: ``True`` if the filter query is already set to ``option``
+        :rtype: bool
+        """
+        current = self.current_option(query)
+        return isinstance(current, str) and current.lower() == str(option).lower()
+
+    def list_options(self, query: str):
+        """
+        Lists the possible options which a filter query can be configured to.
+        While no page is open, the options are read from the option catalog.
+
+        :param query: The filter query
+        :return: Options which the filter query can be configured to
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        :raises FanGraphs.exceptions.CatalogNotFound: No page is open and no option catalog has been saved
+        """
+        if self.page is None:
+            return self._catalog_options(query)
+        return self._parse_options(query)
+
+    def _read_option(self, query: str):
+        """
+        Reads the option which a filter query is currently set to from the page.
+        See :py:meth:`_parse_option`.
+
+        :param query: The filter query being retrieved of its current option
+        :return: The option(s) which the filter query is currently set to
+        :rtype: str or list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        return self._parse_option(query)
+
+    def _configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option, without waiting for the page to change.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :return: ``False`` if the filter query was already set to ``option``
+        :rtype: bool
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+        """
+        query = query.lower()
+        if self._unchanged(query, option):
+            return False
+        elem = self._filter(query)
+        if self._throttle_filters:
+            self._throttle()
+        if isinstance(elem, selectors.Switches):
+            option = self._switch_option(option)
+            self.page.click(elem.selector)
+        else:
+            option = elem.configure(self.page, str(option))
+        self._mark_stale()
+        self._record(query, option, multiple=self._multiple(query))
+        return True
+
+    def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        self._close_ad()
+        if self._configure(query, option):
+            self._refresh_parser()
+
+    def configure_many(self, filters: dict):
+        """
+        Configures multiple filter queries at once.
+        The page is re-parsed once, after every filter query has been configured.
+
+        :param filters: Mapping of the filter queries to configure to their options
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        self._validate(filters)
+        self._close_ad()
+        changed = [
+            query for query, option in filters.items()
+            if self._configure(query, option)
+        ]
+        if changed:
+            self._refresh_parser()
+
+    def verify_state(self):
+        """
+        Compares every tracked option in :py:attr:`state` with the option read from the page.
+
+        :return: Mapping of the mismatched filter queries to their tracked and actual options
+        :rtype: dict
+        """
+        mismatches = {}
+        for query, tracked in self.state.items():
+            actual = self._read_option(query)
+            if _normalize_option(tracked) != _normalize_option(actual):
+                mismatches[query] = (tracked, actual)
+        return mismatches
+
+    def _check_state(self):
+        """
+        :raises FanGraphs.exceptions.StateMismatch: The tracked state disagrees with the page
+        """
+        mismatches = self.verify_state()
+        if mismatches:
+            raise fangraphs.exceptions.StateMismatch(mismatches)
+
+    def navigate(self, filters):
+        """
+        Configures the page to a filter configuration with a single navigation to :py:meth:`url`,
+        instead of clicking each filter query.
+
+        :param filters: Mapping of filter queries to options.
+            The filter queries which are left out are reset to their default options.
+        :raises FanGraphs.exceptions.URLStateUnsupported: The page does not encode its filters in its URL
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query cannot be expressed in the URL,
+            e.g. one of the ``unsupported`` filter queries of :py:attr:`_params`
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        self._throttle()
+        self.page.goto(self.url(filters), timeout=self.timeout * 1000)
+        self.filters = {q.lower(): str(o).lower() for q, o in filters.items()}
+        self.state.clear()
+        self._refresh_parser()
+
     def export_data(self, selector: str, path=""):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
         The file will be saved to the filepath ``path``, if specified.
-        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
+        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*.
+        If ``path`` has a *.parquet* or *.arrow* extension, the download is read in memory
+        and written in that format.
         :param selector: The CSS selector of the **Export Data** button
         :param path: The path to save the exported data to
+        :return: The path which the file was saved to
+        :rtype: str
         """
+        path = tables.resolve_path(path)
+        if not path.endswith(".csv"):
+            headers, rows = self.download_rows(selector)
+            return tables.write(headers, rows, path)
         self._close_ad()
-        if not path or os.path.splitext(path)[1] != ".csv":
-            path = "out/{}.csv".format(
-                datetime.datetime.now().strftime("%d.%m.%y %H.%M.%S")
-            )
+        self._throttle()
         with self.page.expect_download() as down_info:
             self.page.click(selector)
         download = down_info.value
-        download_path = download.path()
-        os.rename(download_path, path)
+        os.rename(download.path(), path)
+        return path
+
+    def download_rows(self, selector: str):
+        """
+        Uses the **Export Data** button on the webpage to download the current leaderboard,
+        and reads the downloaded CSV data in memory instead of saving it to *out/*.
+
+        :param selector: The CSS selector of the **Export Data** button
+        :return: The column headers and the rows of the leaderboard
+        :rtype: tuple
+        """
+        rows = self._iter_download(selector)
+        return next(rows, []), list(rows)
+
+    def _iter_download(self, selector: str):
+        """
+        Uses the **Export Data** button on the webpage to download the current leaderboard,
+        and reads the downloaded CSV file one row at a time.
+        The downloaded file is deleted once it has been read.
+
+        :param selector: The CSS selector of the **Export Data** button
+        :return: A generator which yields the column headers, then each row
+        """
+        self._close_ad()
+        self._throttle()
+        with self.page.expect_download() as down_info:
+            self.page.click(selector)
+        download = down_info.value
+        try:
+            yield from tables.iter_csv(download.path())
+        finally:
+            download.delete()
+
+    def _iter_captured(self):
+        """
+        :return: A generator which yields the column headers, then each row,
+            of the latest captured response of the ``api`` endpoint
+        """
+        headers, rows = self.captured_rows()
+        yield headers
+        yield from rows
+
+    def fetch_table(self, *, kind="columns"):
+        """
+        Returns the leaderboard of the current filter configuration as an in-memory,
+        column-oriented table, without saving any file.
+        The type of each column is inferred, as in :py:func:`fangraphs.leaders.tables.columnar`.
+
+        :param kind: ``"columns"`` (mapping of headers to lists), ``"numpy"`` (mapping of headers
+            to NumPy arrays) or ``"arrow"`` (``pyarrow.RecordBatch``)
+        :return: The columns of the leaderboard
+        :rtype: dict or pyarrow.RecordBatch
+        """
+        rows = self.iter_rows()
+        return tables.columnar(next(rows, []), rows, kind)
+
+    def iter_rows(self):
+        """
+        Yields the rows of the current leaderboard as they are read, so large leaderboards
+        can be consumed in constant memory.
+        If the scraper was created with ``capture=True``, the rows are decoded
+        from the captured response of the data endpoint.
+        Otherwise, the download of the **Export Data** button is read one row at a time.
+
+        :return: A generator which yields the column headers, then the cells of each row
+        :rtype: generator
+        """
+        if self.capture:
+            yield from self._iter_captured()
+        else:
+            yield from self._iter_download(self._export_button)
+
+    def export(self, path="", *, format=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        The data will be exported as a CSV file and the file will be saved to *out/*.
+        The file will be saved to the filepath ``path``, if specified.
+        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
+
+        If the scraper was created with ``capture=True``, the rows are decoded
+        from the captured response of the data endpoint instead.
+
+        If the scraper was created with a ``cache``, a cached export of the same
+        filter configuration is copied to ``path`` instead.
+
+        :param path: The path to save the exported data to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``.
+            If not specified, the format is inferred from the extension of ``path``.
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        path = tables.resolve_path(path, format)
+        if self._from_cache(path):
+            return path
+        if self.capture:
+            self.export_captured(path)
+        else:
+            self.export_data(self._export_button, path)
+        self._to_cache(path)
+        return path
 
     def reset(self):
         """
-        Navigates :py:attr:`page` to :py:attr:`address`.
+        Navigates :py:attr:`page` to :py:attr:`address`,
+        which resets every filter query to its default option.
         """
-        self.page.goto(self.address, timeout=0)
+        self._throttle()
+        self.page.goto(self.address, timeout=self.timeout * 1000)
+        self.filters.clear()
+        self.state.clear()
         self._refresh_parser()
 
     def quit(self):
         """
-        Terminates the ``Playwright`` browser and context manager.
+        Returns the borrowed page to the browser pool.
+        The browser itself is kept running for other scrapers.
+        """
+        if self.page is not None:
+            self.pool.release(self.page)
+            self.page = None
+
+
+class AsyncScrapingUtilities(FilterUtilities):
+    """
+    Asynchronous counterpart of :py:class:`ScrapingUtilities`, built on ``playwright.async_api``.
+    Every method which touches the page is a coroutine,
+    so a single event loop can drive many pages concurrently.
+    """
+    def __init__(self, address, *, waitfor="", api="", capture=False, browser=None,
+                 resource_filter=None, cache=None,
+                 verify=False, limiter=None, timeout=60.0):
+        """
+        :param address: The base URL address of the FanGraphs page
+        :param waitfor: The CSS selector to wait for after the page is changed
+        :param api: The URL path of the JSON endpoint which the page loads its data table from
+        :param capture: If ``True``, the responses of the ``api`` endpoint are captured,
+            so the leaderboard can be exported from the JSON data with :py:meth:`export_captured`
+        :param browser: A running asynchronous ``Playwright`` browser to open a context in.
+            If not specified, a browser is launched and terminated with the scraper.
+        :param resource_filter: Aborts the page requests which it does not allow.
+            If not specified, every request is sent.
+        :type resource_filter: fangraphs.leaders.resources.ResourceFilter
+        :param cache: Serves repeated exports of the same filter configuration from disk.
+            If not specified, every export is scraped.
+        :type cache: fangraphs.leaders.cache.ExportCache
+        :param verify: If ``True``, the tracked filter state is checked against the page
+            every time the page changes
+        :param limiter: Rate limits the page loads, navigating clicks and downloads of the scraper.
+            If not specified, the process-wide limiter from
+            :py:func:`fangraphs.leaders.ratelimit.get_limiter` is used, if any.
+        :type limiter: fangraphs.leaders.ratelimit.RateLimiter
+        :param timeout: The seconds to wait for a page load before it fails, or ``0`` to wait indefinitely
+        .. py:attribute:: address
+            The base URL address of the FanGraphs page
+            :type: str
+        .. py:attribute:: page
+            The generated asynchronous ``Playwright`` page for browser automation.
+            :type: playwright.async_api._generated.Page
+        .. py:attribute:: soup
+            The ``BeautifulSoup4`` HTML parser for scraping the webpage.
+            It is only brought up to date by :py:meth:`_ensure_parser`.
+            :type: bs4.BeautifulSoup
+        .. py:attribute:: refreshes
+            The number of times the page has changed, each of which invalidates :py:attr:`soup`
+            :type: int
+        .. py:attribute:: parses
+            The number of times the page has actually been parsed
+            :type: int
+        .. py:attribute:: captures
+            The number of responses of the ``api`` endpoint which have been captured
+            :type: int
+        .. py:attribute:: filters
+            The filter queries which have been configured since the page was last reset,
+            mapped to their options
+            :type: dict
+        .. py:attribute:: state
+            The tracked option of each filter query which has been read or configured.
+            Filter queries are read from the page the first time they are needed.
+            :type: dict
+        """
+        self.address = address
+        self.waitfor = waitfor
+        self.api = api
+        self.capture = capture and bool(api)
+        os.makedirs("out", exist_ok=True)
+
+        self.browser = browser
+        self.resource_filter = resource_filter
+        self.cache = cache
+        self.verify = verify
+        self.limiter = limiter
+        self.timeout = timeout
+        self.filters = {}
+        self.state = {}
+        self.__play = None
+        self.__browser = None
+        self.__context = None
+        self.page = None
+
+        self.soup = None
+        self.__soup_stale = True
+        self.refreshes = 0
+        self.parses = 0
+
+        self.__response = None
+        self.__pending = 0
+        self.captures = 0
+
+    async def _browser_init(self):
+        """
+        Opens a new browser context and page,
+        launching a browser first if none was given.
+        """
+        browser = self.browser
+        if browser is None:
+            self.__play = await async_playwright().start()
+            self.__browser = await self.__play.chromium.launch(
+                downloads_path=os.path.abspath("out")
+            )
+            browser = self.__browser
+        self.__context = await browser.new_context(
+            accept_downloads=True
+        )
+        self.page = await self.__context.new_page()
+        if self.resource_filter is not None:
+            await self.page.route("**/*", self.resource_filter.handle_async)
+        if self.capture:
+            self.page.on("request", self._on_request)
+            self.page.on("requestfinished", self._on_request_done)
+            self.page.on("requestfailed", self._on_request_done)
+            self.page.on("response", self._on_response)
+        self.__soup_stale = True
+
+    def _on_request(self, request):
+        """
+        Counts the requests to the ``api`` endpoint which are in flight.
+        """
+        if self.api in request.url:
+            self.__pending += 1
+
+    def _on_request_done(self, request):
+        """
+        Counts the requests to the ``api`` endpoint which have finished or failed.
+        """
+        if self.api in request.url:
+            self.__pending = max(self.__pending - 1, 0)
+
+    def _on_response(self, response):
+        """
+        Stores the latest successful response of the ``api`` endpoint.
+        """
+        if self.api in response.url and response.ok:
+            self.__response = response
+            self.captures += 1
+
+    async def captured_rows(self, timeout=30.0):
+        """
+        Decodes the latest captured response of the ``api`` endpoint.
+        Requests to the endpoint which are still in flight are waited for first,
+        so the rows match the current filter configuration.
+
+        :param timeout: Seconds to wait for requests in flight
+        :return: The column headers and the rows of the leaderboard
+        :rtype: tuple
+        :raises FanGraphs.exceptions.ResponseNotCaptured: No response has been captured
+        """
+        deadline = time.monotonic() + timeout
+        while self.__pending and time.monotonic() < deadline:
+            await self.page.wait_for_timeout(50)
+        if self.__response is None:
+            raise fangraphs.exceptions.ResponseNotCaptured(self.api)
+        return tables.json_rows(await self.__response.json())
+
+    async def export_captured(self, path=""):
+        """
+        Exports the current leaderboard from the captured JSON data,
+        without clicking any button or paging through the data table.
+        The file will be saved to the filepath ``path``, if specified.
+        Otherwise, the file will be saved to the filepath *out/%d.%m.%y %H.%M.%S.csv*.
+
+        :param path: The path to save the exported file to
+        :return: The path which the file was saved to
+        :rtype: str
+        :raises FanGraphs.exceptions.ResponseNotCaptured: No response has been captured
+        """
+        headers, rows = await self.captured_rows()
+        return tables.write(headers, rows, tables.resolve_path(path))
+
+    async def _ensure_parser(self):
+        """
+        Re-parses the page into :py:attr:`soup` if the page has changed since it was last parsed.
+
+        :return: The up-to-date parser
+        :rtype: bs4.BeautifulSoup
+        """
+        if self.__soup_stale and self.page is not None:
+            self.soup = bs4.BeautifulSoup(
+                await self.page.content(), features="lxml"
+            )
+            self.__soup_stale = False
+            self.parses += 1
+        return self.soup
+
+    def _mark_stale(self):
+        """
+        Marks :py:attr:`soup` as outdated after the page was changed, without waiting for it.
+        The page is parsed again the next call to :py:meth:`_ensure_parser`.
+        """
+        self.__soup_stale = True
+
+    async def _refresh_parser(self):
+        """
+        Waits for the page to load and marks :py:attr:`soup` as outdated.
+        The page is parsed again by the next call to :py:meth:`_ensure_parser`.
+        """
+        if self.waitfor:
+            await self.page.wait_for_selector(self.waitfor)
+        self._mark_stale()
+        self.refreshes += 1
+        if self.verify:
+            await self._check_state()
+
+    async def _throttle(self):
+        """
+        Waits for a token of the rate limiter before a request is sent to FanGraphs.
+
+        :return: The seconds waited
+        :rtype: float
+        """
+        limiter = self.limiter or ratelimit.get_limiter()
+        if limiter is None:
+            return 0.0
+        return await limiter.acquire_async()
+
+    async def _close_ad(self):
+        """
+        Closes the ad which may interfere with clicking other page elements.
+        Nothing is done if the ad requests are blocked by :py:attr:`resource_filter`.
+        """
+        if self.resource_filter is not None and self.resource_filter.blocks_ads:
+            return
+        if await self.page.query_selector("#ezmob-wrapper > div[style='display: none;']"):
+            return
+        elem = await self.page.query_selector(".ezmob-footer-close")
+        if elem:
+            await elem.click()
+
+    async def current_option(self, query: str):
+        """
+        Retrieves the option which a filter query is currently set to.
+        The option is read from the page the first time, then tracked in :py:attr:`state`.
+
+        :param query: The filter query being retrieved of its current option
+        :return: The option(s) which the filter query is currently set to
+        :rtype: str or list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        if query not in self.state:
+            self.state[query] = await self._read_option(query)
+        option = self.state[query]
+        return list(option) if isinstance(option, list) else option
+
+    async def _unchanged(self, query, option):
+        """
+        :return: ``True`` if the filter query is already set to ``option``
+        :rtype: bool
+        """
+        current = await self.current_option(query)
+        return isinstance(current, str) and current.lower() == str(option).lower()
+
+    async def list_options(self, query: str):
+        """
+        Lists the possible options which a filter query can be configured to.
+        While no page is open, the options are read from the option catalog.
+
+        :param query: The filter query
+        :return: Options which the filter query can be configured to
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        :raises FanGraphs.exceptions.CatalogNotFound: No page is open and no option catalog has been saved
+        """
+        if self.page is None:
+            return self._catalog_options(query)
+        await self._ensure_parser()
+        return self._parse_options(query)
+
+    async def _read_option(self, query: str):
+        """
+        Reads the option which a filter query is currently set to from the page.
+        See :py:meth:`_parse_option`.
+
+        :param query: The filter query being retrieved of its current option
+        :return: The option(s) which the filter query is currently set to
+        :rtype: str or list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        await self._ensure_parser()
+        return self._parse_option(query)
+
+    async def _configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option, without waiting for the page to change.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :return: ``False`` if the filter query was already set to ``option``
+        :rtype: bool
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+        """
+        query = query.lower()
+        await self._ensure_parser()
+        if await self._unchanged(query, option):
+            return False
+        elem = self._filter(query)
+        if self._throttle_filters:
+            await self._throttle()
+        if isinstance(elem, selectors.Switches):
+            option = self._switch_option(option)
+            await self.page.click(elem.selector)
+        else:
+            option = await elem.configure_async(self.page, str(option))
+        self._mark_stale()
+        self._record(query, option, multiple=self._multiple(query))
+        return True
+
+    async def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        await self._close_ad()
+        if await self._configure(query, option):
+            await self._refresh_parser()
+
+    async def configure_many(self, filters: dict):
+        """
+        Configures multiple filter queries at once.
+        The page is re-parsed once, after every filter query has been configured.
+
+        :param filters: Mapping of the filter queries to configure to their options
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        self._validate(filters)
+        await self._close_ad()
+        changed = [
+            query for query, option in filters.items()
+            if await self._configure(query, option)
+        ]
+        if changed:
+            await self._refresh_parser()
+
+    async def verify_state(self):
+        """
+        Compares every tracked option in :py:attr:`state` with the option read from the page.
+
+        :return: Mapping of the mismatched filter queries to their tracked and actual options
+        :rtype: dict
+        """
+        mismatches = {}
+        for query, tracked in self.state.items():
+            actual = await self._read_option(query)
+            if _normalize_option(tracked) != _normalize_option(actual):
+                mismatches[query] = (tracked, actual)
+        return mismatches
+
+    async def _check_state(self):
+        """
+        :raises FanGraphs.exceptions.StateMismatch: The tracked state disagrees with the page
+        """
+        mismatches = await self.verify_state()
+        if mismatches:
+            raise fangraphs.exceptions.StateMismatch(mismatches)
+
+    async def navigate(self, filters):
+        """
+        Configures the page to a filter configuration with a single navigation to :py:meth:`url`,
+        instead of clicking each filter query.
+
+        :param filters: Mapping of filter queries to options.
+            The filter queries which are left out are reset to their default options.
+        :raises FanGraphs.exceptions.URLStateUnsupported: The page does not encode its filters in its URL
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query cannot be expressed in the URL,
+            e.g. one of the ``unsupported`` filter queries of :py:attr:`_params`
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        await self._throttle()
+        await self.page.goto(self.url(filters), timeout=self.timeout * 1000)
+        self.filters = {q.lower(): str(o).lower() for q, o in filters.items()}
+        self.state.clear()
+        await self._refresh_parser()
+
+    async def export_data(self, selector: str, path=""):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        The data will be exported as a CSV file and the file will be saved to *out/*.
+        The file will be saved to the filepath ``path``, if specified.
+        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*.
+        If ``path`` has a *.parquet* or *.arrow* extension, the download is read in chunks
+        and written in that format.
+        :param selector: The CSS selector of the **Export Data** button
+        :param path: The path to save the exported data to
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        path = tables.resolve_path(path)
+        if not path.endswith(".csv"):
+            return await tables.write_async(self._iter_download(selector), path)
+        await self._close_ad()
+        await self._throttle()
+        async with self.page.expect_download() as down_info:
+            await self.page.click(selector)
+        download = await down_info.value
+        await download.save_as(path)
+        return path
+
+    async def download_rows(self, selector: str):
+        """
+        Uses the **Export Data** button on the webpage to download the current leaderboard,
+        and reads the downloaded CSV data in memory instead of saving it to *out/*.
+
+        :param selector: The CSS selector of the **Export Data** button
+        :return: The column headers and the rows of the leaderboard
+        :rtype: tuple
+        """
+        return await tables.collect_async(self._iter_download(selector))
+
+    async def _iter_download(self, selector: str):
+        """
+        Uses the **Export Data** button on the webpage to download the current leaderboard,
+        and reads the downloaded CSV file one row at a time.
+        The downloaded file is deleted once it has been read.
+
+        :param selector: The CSS selector of the **Export Data** button
+        :return: A generator which yields the column headers, then each row
+        """
+        await self._close_ad()
+        await self._throttle()
+        async with self.page.expect_download() as down_info:
+            await self.page.click(selector)
+        download = await down_info.value
+        try:
+            for row in tables.iter_csv(await download.path()):
+                yield row
+        finally:
+            await download.delete()
+
+    async def _iter_captured(self):
+        """
+        :return: A generator which yields the column headers, then each row,
+            of the latest captured response of the ``api`` endpoint
+        """
+        headers, rows = await self.captured_rows()
+        yield headers
+        for row in rows:
+            yield row
+
+    async def fetch_table(self, *, kind="columns"):
+        """
+        Returns the leaderboard of the current filter configuration as an in-memory,
+        column-oriented table, without saving any file.
+        The type of each column is inferred, as in :py:func:`fangraphs.leaders.tables.columnar`.
+
+        :param kind: ``"columns"`` (mapping of headers to lists), ``"numpy"`` (mapping of headers
+            to NumPy arrays) or ``"arrow"`` (``pyarrow.RecordBatch``)
+        :return: The columns of the leaderboard
+        :rtype: dict or pyarrow.RecordBatch
+        """
+        headers, rows = await tables.collect_async(self.iter_rows())
+        return tables.columnar(headers, rows, kind)
+
+    async def iter_rows(self):
+        """
+        Yields the rows of the current leaderboard as they are read, so large leaderboards
+        can be consumed in constant memory.
+        If the scraper was created with ``capture=True``, the rows are decoded
+        from the captured response of the data endpoint.
+        Otherwise, the download of the **Export Data** button is read one row at a time.
+
+        :return: An asynchronous generator which yields the column headers,
+            then the cells of each row
+        :rtype: async_generator
+        """
+        if self.capture:
+            async for row in self._iter_captured():
+                yield row
+        else:
+            async for row in self._iter_download(self._export_button):
+                yield row
+
+    async def export(self, path="", *, format=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`ScrapingUtilities.export`.
+
+        :param path: The path to save the exported data to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``.
+            If not specified, the format is inferred from the extension of ``path``.
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        path = tables.resolve_path(path, format)
+        if self._from_cache(path):
+            return path
+        if self.capture:
+            await self.export_captured(path)
+        else:
+            await self.export_data(self._export_button, path)
+        self._to_cache(path)
+        return path
+
+    async def reset(self):
+        """
+        Navigates :py:attr:`page` to :py:attr:`address`,
+        which resets every filter query to its default option.
+        """
+        await self._throttle()
+        await self.page.goto(self.address, timeout=self.timeout * 1000)
+        self.filters.clear()
+        self.state.clear()
+        await self._refresh_parser()
+
+    async def quit(self):
+        """
+        Closes the browser context of :py:attr:`page`.
+        The browser is terminated only if it was launched by the scraper.
         """
-        self.__browser.close()
-        self.__play.stop()
+        if self.__context is not None:
+            await self.__context.close()
+            self.__context = None
+            self.page = None
+        if self.__browser is not None:
+            await self.__browser.close()
+            await self.__play.stop()
+            self.__browser = None
+            self.__play = None
@@ -0,0 +1,483 @@
+#! python3
+# FanGraphs/leaders/async_leaders.py
+
+"""
+Asynchronous scrapers for the webpages under the FanGraphs **Leaders** tab.
+
+Each class mirrors the class of the same name in :py:mod:`fangraphs.leaders.leaders`,
+but is used as an asynchronous context manager and its page-driving methods are coroutines::
+
+    async with MajorLeague() as scraper:
+        await scraper.configure("stat", "Pitching")
+        await scraper.export("out/pitching.csv")
+
+Both share the filter queries of each page, described in :py:mod:`fangraphs.leaders.pages`.
+"""
+
+import asyncio
+
+import fangraphs.exceptions
+from fangraphs.leaders import (
+    ROWS_CHANGED, AsyncScrapingUtilities, combination_name, export_path, gray_product, tables,
+    toggled_options
+)
+from fangraphs.leaders.pages import (
+    GameSpanPage, InternationalPage, MajorLeaguePage, SeasonStatPage, SplitsPage, WARPage
+)
+
+
+class GameSpan(GameSpanPage, AsyncScrapingUtilities):
+    """
+    Asynchronous scraper for the FanGraphs `60-Game Span Leaderboards`_ page.
+
+    .. _60-Game Span Leaderboards: https://www.fangraphs.com/leaders/special/60-game-span
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        self._compile_selectors()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+
+class International(InternationalPage, AsyncScrapingUtilities):
+    """
+    Asynchronous scraper for the FanGraphs `KBO Leaderboards`_ page.
+
+    .. _KBO Leaderboards: https://www.fangraphs.com/leaders/international
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        self._compile_selectors()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+
+class MajorLeague(MajorLeaguePage, AsyncScrapingUtilities):
+    """
+    Asynchronous scraper for the FanGraphs `Major League Leaderboards`_ page.
+
+    .. _Major League Leaderboards: https://fangraphs.com/leaders.aspx
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        self._compile_selectors()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def configure(self, query: str, option: str, *, autoupdate=True):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :param autoupdate: If ``True``, any buttons attached to the filter query will be clicked
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        await self._close_ad()
+        if not await self._configure(query, option):
+            return
+        if autoupdate:
+            await self._click_buttons([query])
+        await self._refresh_parser()
+
+    async def configure_many(self, filters: dict, *, autoupdate=True):
+        """
+        Configures multiple filter queries at once.
+        Buttons shared by several filter queries (e.g. ``season1`` and ``season2``) are clicked once,
+        after every filter query has been configured, and the page is re-parsed once.
+
+        :param filters: Mapping of the filter queries to configure to their options
+        :param autoupdate: If ``True``, the buttons attached to the filter queries will be clicked
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        self._validate(filters)
+        await self._close_ad()
+        changed = [
+            query for query, option in filters.items()
+            if await self._configure(query, option)
+        ]
+        if autoupdate:
+            await self._click_buttons(changed)
+        if changed:
+            await self._refresh_parser()
+
+    async def _click_buttons(self, queries):
+        """
+        Clicks the buttons attached to the filter queries, once each.
+
+        :param queries: The configured filter queries
+        """
+        for button in self._buttons(queries):
+            await self._throttle()
+            await self.page.click(button)
+
+
+class SeasonStat(SeasonStatPage, AsyncScrapingUtilities):
+    """
+    Asynchronous scraper for the FanGraphs `Season Stat Grid`_ page.
+
+    .. _Season Stat Grid: https://fangraphs.com/leaders/season-stat-grid
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        self._compile_selectors()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _page_rows(self):
+        """
+        Clicks through every page of the data table, re-parsing the page each time.
+
+        :return: An asynchronous generator which yields the column headers,
+            then the cells of each row of every page
+        :rtype: async_generator
+        """
+        await self._ensure_parser()
+        total_pages = self._parse_page_total()
+        yield self._parse_headers()
+        for page in range(total_pages):
+            if page:
+                await self._throttle()
+                await self.page.click(self._sel.next_page)
+                await self._refresh_parser()
+            await self._ensure_parser()
+            for row in self._parse_rows():
+                yield row
+
+    async def _expand_table(self):
+        """
+        Sets the data table to its largest page size.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat._expand_table`.
+
+        :return: ``True`` if the entire leaderboard fits on one page of the data table
+        :rtype: bool
+        """
+        sel = self._sel
+        if await self.page.query_selector(sel.page_size) is None:
+            return False
+        if int(await self.page.inner_text(sel.page_total)) == 1:
+            return True
+        sizes = await self.page.eval_on_selector_all(
+            f"{sel.page_size} > option", "options => options.map(o => o.value)"
+        )
+        sizes = [s for s in sizes if s.isdigit()]
+        if not sizes:
+            return False
+        largest = max(sizes, key=int)
+        if await self.page.input_value(sel.page_size) != largest:
+            rows = f"{sel.table} tbody tr"
+            count = await self.page.eval_on_selector_all(rows, "rows => rows.length")
+            await self.page.select_option(sel.page_size, largest)
+            await self.page.wait_for_function(
+                ROWS_CHANGED, arg=[rows, count], timeout=self.timeout * 1000
+            )
+            await self._refresh_parser()
+        return int(await self.page.inner_text(sel.page_total)) == 1
+
+    async def export(self, path="", *, single_pass=True, format=None):
+        """
+        Scrapes and saves the data from the table of the current leaderboards.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat.export`.
+
+        :param path: The path to save the exported file to
+        :param single_pass: If ``True``, the data table is set to its largest page size
+            and all rows are read in one pass, if they fit on one page.
+            Otherwise, every page of the data table is clicked through and parsed.
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``.
+            If not specified, the format is inferred from the extension of ``path``.
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        path = tables.resolve_path(path, format)
+        if self._from_cache(path):
+            return path
+        await tables.write_async(self.iter_rows(single_pass=single_pass), path)
+        self._to_cache(path)
+        return path
+
+    async def iter_rows(self, *, single_pass=True):
+        """
+        Yields the rows of the current leaderboard as they are read, so large leaderboards
+        can be consumed in constant memory.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat.iter_rows`.
+
+        :param single_pass: If ``True``, the data table is set to its largest page size
+            and all rows are read in one pass, if they fit on one page.
+        :return: An asynchronous generator which yields the column headers,
+            then the cells of each row
+        :rtype: async_generator
+        """
+        await self._close_ad()
+        if self.capture:
+            async for row in self._iter_captured():
+                yield row
+        elif single_pass and await self._expand_table():
+            html = await self.page.inner_html(self._sel.table)
+            for row in self._table_rows(html):
+                yield row
+        else:
+            async for row in self._page_rows():
+                yield row
+
+
+class Splits(SplitsPage, AsyncScrapingUtilities):
+    """
+    Asynchronous scraper for the FanGraphs `Splits Leaderboards`_ page.
+
+    .. _Splits Leaderboards: https://fangraphs.com/leaders/splits-leaderboards
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        self._compile_selectors()
+
+        if self.setup:
+            await self.set_filter_group("Show All")
+            await self.configure("auto_pt", "False", autoupdate=True)
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def configure(self, query: str, option: str, *, autoupdate=False):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        await self._close_ad()
+        changed = await self._configure(query, option)
+        if autoupdate:
+            await self.update()
+        elif changed:
+            await self._refresh_parser()
+
+    async def configure_many(self, filters: dict, *, autoupdate=True):
+        """
+        Configures multiple filter queries at once.
+        The filter queries are submitted with a single click of the **Update** button,
+        and the page is re-parsed once.
+
+        :param filters: Mapping of the filter queries to configure to their options
+        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        self._validate(filters)
+        await self._close_ad()
+        changed = [
+            query for query, option in filters.items()
+            if await self._configure(query, option)
+        ]
+        if autoupdate:
+            await self.update()
+        elif changed:
+            await self._refresh_parser()
+
+    async def update(self):
+        """
+        Clicks the **Update** button of the page.
+        All configured filters are submitted and the page is refreshed.
+
+        :raises FanGraphs.exceptions.FilterUpdateIncapability: No filter queries to update
+        """
+        elem = await self.page.query_selector("#button-update")
+        if elem is None:
+            raise fangraphs.exceptions.FilterUpdateIncapability()
+        await self._close_ad()
+        await self._throttle()
+        await elem.click()
+        await self._refresh_parser()
+
+    async def list_filter_groups(self):
+        """
+        Lists the possible groups of filter queries which can be used
+
+        :return: Names of the groups of filter queries
+        :rtype: list
+        """
+        await self._ensure_parser()
+        return self._parse_filter_groups()
+
+    async def set_filter_group(self, group="Show All"):
+        """
+        Configures the available filters to a specified group of filters
+
+        :param group: The name of the group of filters
+        :raises FanGraphs.exceptions.InvalidFilterGroup: Invalid argument ``group``
+        """
+        await self._ensure_parser()
+        index = self._filter_group_index(group)
+        await self._close_ad()
+        elems = await self.page.query_selector_all(".fgBin.splits-bin-controller div")
+        await elems[index].click()
+        self._mark_stale()
+
+    async def reset_filters(self):
+        """
+        Resets filters to the original option(s).
+        See :py:meth:`fangraphs.leaders.leaders.Splits.reset_filters`.
+        """
+        elem = await self.page.query_selector(
+            "#stack-buttons .fgButton.small:nth-last-child(1)"
+        )
+        if elem is None:
+            return
+        await self._close_ad()
+        await elem.click()
+        self._mark_stale()
+        self._forget_reset_filters()
+
+    async def set_to_quick_split(self, quick_split: str, autoupdate=True):
+        """
+        Invokes the configuration of a quick split.
+        All filter queries affected by :py:meth:`reset_filters` are reset prior to configuration.
+        This action is performed by the FanGraphs API and cannot be prevented.
+
+        :param quick_split: The quick split to invoke
+        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
+        :raises FanGraphs.exceptions.InvalidQuickSplit: Invalid argument ``quick_split``
+        """
+        quick_split, selector = self._quick_split(quick_split)
+        await self._close_ad()
+        await self._throttle()
+        await self.page.click(selector)
+        self._forget_reset_filters()
+        self._mark_stale()
+        self._record("quick_split", quick_split)
+        if autoupdate:
+            await self.update()
+
+    async def export_quick_splits(self, quick_splits=None, directory="out", *, format=None, pages=1):
+        """
+        Exports the leaderboard of each quick split in one session.
+        With ``pages`` greater than 1, the quick splits are spread over up to ``pages`` pages
+        in new contexts of the same browser, which are exported concurrently.
+        The additional pages are created with ``setup=False``, since quick splits do not require it,
+        and with the other options of this scraper, e.g. its ``limiter`` and ``timeout``.
+
+        :param quick_splits: The quick splits to export.
+            If not specified, every quick split is exported.
+        :param directory: The directory to export the leaderboards to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``
+        :param pages: The maximum number of pages to export the quick splits with at once
+        :return: The quick split and the path of the export, for each quick split,
+            in the order of ``quick_splits``
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidQuickSplit: Invalid quick split in ``quick_splits``
+        """
+        quick_splits = self._check_quick_splits(quick_splits)
+        chunks = [quick_splits[i::max(1, pages)] for i in range(max(1, pages))]
+        chunks = [c for c in chunks if c]
+        if len(chunks) <= 1:
+            return await self._export_quick_splits(quick_splits, directory, format)
+        browser = self.browser or self.page.context.browser
+
+        async def fan_out(chunk):
+            async with type(self)(
+                setup=False, browser=browser, capture=self.capture,
+                resource_filter=self.resource_filter, cache=self.cache,
+                verify=self.verify, limiter=self.limiter, timeout=self.timeout
+            ) as scraper:
+                return await scraper._export_quick_splits(chunk, directory, format)
+
+        results = await asyncio.gather(
+            self._export_quick_splits(chunks[0], directory, format),
+            *(fan_out(chunk) for chunk in chunks[1:])
+        )
+        exports = dict(e for chunk in results for e in chunk)
+        return [(q, exports[q]) for q in quick_splits]
+
+    async def _export_quick_splits(self, quick_splits, directory, format):
+        """
+        Invokes and exports each quick split in turn, on this scraper's page.
+
+        :rtype: list
+        """
+        exports = []
+        for quick_split in quick_splits:
+            await self.set_to_quick_split(quick_split)
+            path = export_path(quick_split, directory, format)
+            await self.export(path)
+            exports.append((quick_split, path))
+        return exports
+
+    async def _set_options(self, query: str, options):
+        """
+        Configures a filter query to exactly the option(s) ``options``.
+        See :py:meth:`fangraphs.leaders.leaders.Splits._set_options`.
+
+        :param query: The filter query
+        :param options: The option, or options, to set the filter query to
+        :return: ``True`` if any option was changed
+        :rtype: bool
+        """
+        query = query.lower()
+        if not self._multiple(query):
+            return await self._configure(query, options)
+        if query not in self.filters:
+            self.filters[query] = sorted(
+                str(o).lower() for o in await self.current_option(query)
+            )
+        toggled = toggled_options(self.filters[query], options)
+        for option in toggled:
+            await self._configure(query, option)
+        return bool(toggled)
+
+    async def export_grid(self, grid: dict, directory="out", *, format=None):
+        """
+        Exports the leaderboard of every combination of the options of several filter queries.
+        See :py:meth:`fangraphs.leaders.leaders.Splits.export_grid`.
+
+        :param grid: Mapping of filter queries to the options to combine
+        :param directory: The directory to export the leaderboards to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``
+        :return: The combination of options and the path of the export, for each combination,
+            in export order
+        :rtype: list
+        """
+        exports = []
+        for combination in gray_product(grid):
+            await self._close_ad()
+            changed = [
+                query for query, options in combination.items()
+                if await self._set_options(query, options)
+            ]
+            if changed:
+                await self.update()
+            path = export_path(combination_name(combination), directory, format)
+            await self.export(path)
+            exports.append((combination, path))
+        return exports
+
+
+class WAR(WARPage, AsyncScrapingUtilities):
+    """
+    Asynchronous scraper for the FanGraphs `Combined WAR Leaderboards`_ page.
+
+    .. _Combined WAR Leaderboards: https://www.fangraphs.com/warleaders.aspx
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        self._compile_selectors()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
@@ -0,0 +1,201 @@
+#! python3
+# FanGraphs/leaders/batch.py
+
+"""
+Concurrent batch exports of many filter configurations of a single **Leaders** page.
+
+A single Chromium browser is launched, and the jobs of the batch are spread over
+up to ``contexts`` isolated browser contexts, each driven by the asynchronous
+scrapers in :py:mod:`fangraphs.leaders.async_leaders`.
+"""
+
+import asyncio
+import os
+import time
+
+from playwright.async_api import async_playwright
+
+import fangraphs.exceptions
+from fangraphs.leaders import async_leaders, catalog
+
+
+class BatchJob:
+    """
+    A single export of a batch: the filter queries to configure and the export path.
+    """
+    def __init__(self, filters=None, path=""):
+        """
+        :param filters: Mapping of filter queries to the options to configure them to
+        :param path: The path to export the leaderboard to
+        """
+        self.filters = dict(filters or {})
+        self.path = path
+
+    def __repr__(self):
+        return f"BatchJob(filters={self.filters!r}, path={self.path!r})"
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Converts a job specification into a :py:class:`BatchJob`.
+        A specification is either a :py:class:`BatchJob`,
+        a ``dict`` with the keys ``filters`` and (optionally) ``path``,
+        or a plain ``dict`` of filter queries.
+
+        :param spec: The job specification
+        :rtype: BatchJob
+        """
+        if isinstance(spec, cls):
+            return spec
+        if "filters" in spec:
+            return cls(spec["filters"], spec.get("path", ""))
+        return cls(spec)
+
+
+class BatchResult:
+    """
+    The outcome of a single :py:class:`BatchJob`.
+
+    .. py:attribute:: index
+        The position of the job in the batch
+        :type: int
+    .. py:attribute:: path
+        The path which the leaderboard was exported to
+        :type: str
+    .. py:attribute:: error
+        The exception raised by the job, or ``None`` if the export succeeded
+        :type: Exception or None
+    .. py:attribute:: elapsed
+        Wall-clock seconds spent on the job
+        :type: float
+    .. py:attribute:: attempts
+        The number of times the job was attempted
+        :type: int
+    """
+    def __init__(self, index, job, path, error=None, elapsed=0.0, attempts=1):
+        self.index = index
+        self.job = job
+        self.path = path
+        self.error = error
+        self.elapsed = elapsed
+        self.attempts = attempts
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, path={self.path!r}, {status})"
+
+    @property
+    def ok(self):
+        """
+        ``True`` if the job was exported without error.
+
+        :rtype: bool
+        """
+        return self.error is None
+
+
+def resolve_scraper(scraper):
+    """
+    Returns the asynchronous scraper class which corresponds to ``scraper``.
+    Synchronous classes from :py:mod:`fangraphs.leaders.leaders` are mapped to the class of the
+    same name in :py:mod:`fangraphs.leaders.async_leaders`.
+
+    :param scraper: A leaders class, or the name of one
+    :rtype: type
+    """
+    name = scraper if isinstance(scraper, str) else scraper.__name__
+    try:
+        return getattr(async_leaders, name)
+    except AttributeError as err:
+        raise ValueError(f"No leaders scraper named '{name}'") from err
+
+
+def _default_path(scraper, index, directory="out"):
+    return os.path.join(directory, f"{scraper.__name__}-{index:05d}.csv")
+
+
+async def run_job(scraper, browser, job, path, **options):
+    """
+    Exports a single job in a new browser context of ``browser``.
+
+    :param scraper: The asynchronous scraper class
+    :param browser: The running asynchronous ``Playwright`` browser
+    :param job: The job to export
+    :type job: BatchJob
+    :param path: The path to export the leaderboard to
+    :param options: Keyword arguments passed to ``scraper``
+    """
+    async with scraper(browser=browser, **options) as leaderboard:
+        for query, option in job.filters.items():
+            await leaderboard.configure(query, option)
+        await leaderboard.export(path)
+
+
+async def export_batch_async(scraper, jobs, *, contexts=4, browser=None, **options):
+    """
+    Coroutine of :py:func:`export_batch`.
+
+    :param scraper: A leaders class, or the name of one
+    :param jobs: The job specifications, see :py:meth:`BatchJob.from_spec`
+    :param contexts: The maximum number of browser contexts open at once
+    :param browser: A running asynchronous ``Playwright`` browser.
+        If not specified, a browser is launched for the batch.
+    :param options: Keyword arguments passed to each scraper, e.g. ``resource_filter``
+    :return: The result of each job, in the order of ``jobs``
+    :rtype: list
+    """
+    scraper = resolve_scraper(scraper)
+    jobs = [BatchJob.from_spec(j) for j in jobs]
+    semaphore = asyncio.Semaphore(max(1, contexts))
+
+    async def worker(index, job, browser):
+        path = job.path or _default_path(scraper, index)
+        try:
+            catalog.validate_filters(scraper.__name__, job.filters)
+        except (fangraphs.exceptions.InvalidFilterQuery, fangraphs.exceptions.InvalidFilterOption) as err:
+            return BatchResult(index, job, path, err, attempts=0)
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                await run_job(scraper, browser, job, path, **options)
+            except Exception as err:
+                return BatchResult(index, job, path, err, time.monotonic() - start)
+            return BatchResult(index, job, path, None, time.monotonic() - start)
+
+    if browser is not None:
+        return list(await asyncio.gather(
+            *(worker(i, j, browser) for i, j in enumerate(jobs))
+        ))
+    async with async_playwright() as play:
+        browser = await play.chromium.launch(
+            downloads_path=os.path.abspath("out")
+        )
+        try:
+            return list(await asyncio.gather(
+                *(worker(i, j, browser) for i, j in enumerate(jobs))
+            ))
+        finally:
+            await browser.close()
+
+
+def export_batch(scraper, jobs, *, contexts=4, **options):
+    """
+    Exports the leaderboard of ``scraper`` once for each job,
+    spreading the jobs over up to ``contexts`` isolated browser contexts of a single browser.
+
+    A failing job does not stop the batch; its exception is recorded in its :py:class:`BatchResult`.
+    The filters of each job are validated against the option catalog
+    (see :py:func:`fangraphs.leaders.catalog.validate_filters`) before a browser context is opened for it,
+    so a job with an invalid option fails without being attempted.
+    Jobs without a path are exported to *out/<ClassName>-<index>.csv*.
+
+    :param scraper: A leaders class, or the name of one
+    :param jobs: The job specifications, see :py:meth:`BatchJob.from_spec`
+    :param contexts: The maximum number of browser contexts open at once
+    :param options: Keyword arguments passed to each scraper, e.g. ``resource_filter``
+    :return: The result of each job, in the order of ``jobs``
+    :rtype: list
+    """
+    return asyncio.run(
+        export_batch_async(scraper, jobs, contexts=contexts, **options)
+    )
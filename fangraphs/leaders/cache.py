@@ -0,0 +1,296 @@
+#! python3
+# FanGraphs/leaders/cache.py
+
+"""
+On-disk cache of exported leaderboards.
+
+An export is keyed by the name of the scraper class, its normalized filter configuration
+and whether it was exported from the captured JSON data, whose columns differ from the **Export Data** file.
+Leaderboards of completed seasons never change, so they never expire.
+Any other leaderboard expires after a time-to-live, since the current season is still being played.
+The cache is bounded in size; the least recently used exports are evicted first.
+
+Several caches, in one or many processes, may share a directory:
+the index is re-read and rewritten while a lock file is held, so no cache loses the entries of another.
+
+*Note: The file lock requires* ``fcntl`` *(POSIX). Without it, the index is only safe to share
+between the threads of one process.*
+"""
+
+import contextlib
+import datetime
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+_YEAR = re.compile(r"^\d{4}$")
+
+#: The season queries of each scraper class, grouped by the range they bound.
+#: Every season query defaults to the current season, so a range with an unset bound includes it.
+SEASON_BOUNDS = {
+    "GameSpan": (("single_season",), ("season1", "season2")),
+    "International": (("single_season",), ("season1", "season2")),
+    "MajorLeague": (("single_season",), ("season1", "season2")),
+    "SeasonStat": (("start_season", "end_season"),),
+    "WAR": (("season",),),
+}
+
+
+class ExportCache:
+    """
+    Size-bounded LRU cache of exported files, stored in a directory on disk.
+    The index of the cache is stored in the same directory as *index.json*,
+    so the cache persists across processes.
+    """
+    def __init__(self, directory="out/.cache", *, ttl=60.0, max_size=256 * 2 ** 20,
+                 current_season=None):
+        """
+        :param directory: The directory to store the cached files in
+        :param ttl: Minutes after which an export which includes the current season expires
+        :param max_size: The maximum total size of the cached files, in bytes
+        :param current_season: The season which is still being played.
+            If not specified, the current year is used.
+        .. py:attribute:: hits
+            The number of lookups which were served from the cache
+            :type: int
+        .. py:attribute:: misses
+            The number of lookups which were not in the cache, or had expired
+            :type: int
+        .. py:attribute:: evictions
+            The number of exports which were removed to bound the size of the cache
+            :type: int
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+        self.current_season = current_season or datetime.date.today().year
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.__index_path = os.path.join(self.directory, "index.json")
+        self.__lock_path = os.path.join(self.directory, "index.lock")
+        self.__lock = threading.Lock()
+        self.__index = self.__load_index()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __load_index(self):
+        try:
+            with open(self.__index_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def __save_index(self):
+        temp = f"{self.__index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(self.__index, file, indent=1)
+        os.replace(temp, self.__index_path)
+
+    @contextlib.contextmanager
+    def __locked_index(self):
+        """
+        Holds the lock of the index while it is re-read from disk, updated and written back,
+        so the entries written by other caches in the same directory are kept.
+        """
+        with self.__lock, open(self.__lock_path, "a", encoding="utf-8") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self.__index = self.__load_index()
+                yield self.__index
+                self.__save_index()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def normalize(filters):
+        """
+        Normalizes a filter configuration, so equivalent configurations compare equal.
+        Queries and options are lower-cased and multiple options are sorted.
+
+        :param filters: Mapping of filter queries to options
+        :rtype: dict
+        """
+        normalized = {}
+        for query, option in filters.items():
+            if isinstance(option, (list, tuple, set)):
+                option = sorted(str(o).lower() for o in option)
+            else:
+                option = str(option).lower()
+            normalized[query.lower()] = option
+        return dict(sorted(normalized.items()))
+
+    def key(self, page, filters, extension=".csv", *, capture=False):
+        """
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param extension: The extension of the exported file
+        :param capture: ``True`` if the export was derived from the captured JSON data
+        :return: The cache key of the export
+        :rtype: str
+        """
+        payload = json.dumps([page, self.normalize(filters), extension, bool(capture)])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def seasons(self, filters, page=None):
+        """
+        Lists the seasons which a filter configuration selects.
+        The season queries of ``page`` which are left at their default select the current season:
+        every season query if none is configured,
+        or the unset bound of a range whose other bound is configured.
+
+        :param filters: Mapping of filter queries to options
+        :param page: The name of the scraper class, see :py:data:`SEASON_BOUNDS`
+        :return: The seasons which the filter configuration selects
+        :rtype: list
+        """
+        filters = self.normalize(filters)
+        seasons = []
+        for query, option in filters.items():
+            if "season" not in query:
+                continue
+            options = option if isinstance(option, list) else [option]
+            seasons.extend(int(o) for o in options if _YEAR.match(o))
+        groups = SEASON_BOUNDS.get(page, ())
+        configured = [g for g in groups if any(q in filters for q in g)]
+        if groups and not configured or any(q not in filters for g in configured for q in g):
+            seasons.append(self.current_season)
+        return seasons
+
+    def expiry(self, filters, page=None):
+        """
+        :param filters: Mapping of filter queries to options
+        :param page: The name of the scraper class
+        :return: The time at which an export of the configuration expires,
+            or ``None`` if the configuration only covers completed seasons
+        :rtype: float or None
+        """
+        seasons = self.seasons(filters, page)
+        if seasons and max(seasons) < self.current_season:
+            return None
+        return time.time() + self.ttl * 60
+
+    @property
+    def size(self):
+        """
+        The total size of the cached files, in bytes.
+
+        :rtype: int
+        """
+        self.__index = self.__load_index()
+        return sum(e["size"] for e in self.__index.values())
+
+    def stats(self):
+        """
+        :return: The hits, misses, evictions, number of entries and size of the cache
+        :rtype: dict
+        """
+        size = self.size
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.__index),
+            "size": size,
+        }
+
+    def __remove(self, key):
+        entry = self.__index.pop(key)
+        try:
+            os.remove(os.path.join(self.directory, entry["file"]))
+        except FileNotFoundError:
+            pass
+
+    def get(self, page, filters, path, *, capture=False):
+        """
+        Copies the cached export of a filter configuration to ``path``.
+
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param path: The path to copy the cached file to
+        :param capture: ``True`` if the export is derived from the captured JSON data
+        :return: ``path``, or ``None`` if the export is not cached or has expired
+        :rtype: str or None
+        """
+        key = self.key(page, filters, os.path.splitext(path)[1], capture=capture)
+        with self.__locked_index() as index:
+            entry = index.get(key)
+            source = os.path.join(self.directory, entry["file"]) if entry else ""
+            expired = entry is not None and entry["expires"] is not None \
+                and entry["expires"] < time.time()
+            if entry is None or expired or not os.path.exists(source):
+                if entry is not None:
+                    self.__remove(key)
+                self.misses += 1
+                return None
+            shutil.copyfile(source, path)
+            entry["used"] = time.time()
+        self.hits += 1
+        return path
+
+    def put(self, page, filters, path, *, capture=False):
+        """
+        Stores a copy of the export of a filter configuration.
+        The least recently used exports are evicted if the cache grows beyond :py:attr:`max_size`.
+
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param path: The path of the exported file
+        :param capture: ``True`` if the export was derived from the captured JSON data
+        """
+        extension = os.path.splitext(path)[1]
+        key = self.key(page, filters, extension, capture=capture)
+        name = key + extension
+        temp = os.path.join(self.directory, f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(path, temp)
+        with self.__locked_index() as index:
+            os.replace(temp, os.path.join(self.directory, name))
+            index[key] = {
+                "file": name,
+                "page": page,
+                "filters": self.normalize(filters),
+                "capture": bool(capture),
+                "size": os.path.getsize(path),
+                "expires": self.expiry(filters, page),
+                "used": time.time(),
+            }
+            self.__evict()
+
+    def evict(self):
+        """
+        Removes the least recently used exports until the cache fits in :py:attr:`max_size`.
+        """
+        with self.__locked_index():
+            self.__evict()
+
+    def __evict(self):
+        entries = sorted(self.__index, key=lambda k: self.__index[k]["used"])
+        size = sum(e["size"] for e in self.__index.values())
+        for key in entries:
+            if size <= self.max_size:
+                break
+            size -= self.__index[key]["size"]
+            self.__remove(key)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Removes every cached export.
+        """
+        with self.__locked_index() as index:
+            for key in list(index):
+                self.__remove(key)
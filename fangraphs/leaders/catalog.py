@@ -0,0 +1,232 @@
+#! python3
+# FanGraphs/leaders/catalog.py
+
+"""
+Persisted catalog of the options of every filter query of the **Leaders** scrapers.
+
+Listing the options of a filter query normally requires a browser and a loaded page.
+The catalog is a versioned JSON snapshot of those options, so that ``list_options``
+and option validation can be answered without opening a page.
+``configure_many`` and the batch exports validate their filter configurations against the catalog
+(see :py:func:`validate_filters`), so an invalid option fails before any page is loaded.
+The catalog is refreshed from the live pages with::
+
+    python -m fangraphs.leaders.catalog
+"""
+
+import argparse
+import datetime
+import json
+import os
+
+import fangraphs.exceptions
+
+#: Version of the catalog file format. Catalogs of other versions are ignored.
+VERSION = 1
+#: Default path of the catalog file
+PATH = "out/catalog.json"
+
+_catalog = None
+_loaded = {}
+
+
+class Catalog:
+    """
+    The options of the filter queries of each scraper class, keyed by the name of the class.
+    """
+    def __init__(self, classes, *, created="", path=""):
+        """
+        :param classes: Mapping of class names to mappings of filter queries to options
+        :param created: ISO 8601 timestamp of the snapshot
+        :param path: The file which the catalog was loaded from
+        """
+        self.classes = classes
+        self.created = created
+        self.path = path
+
+    @classmethod
+    def load(cls, path=PATH):
+        """
+        Loads a catalog file.
+
+        :param path: The path of the catalog file
+        :return: The catalog, or ``None`` if the file does not exist or has another version
+        :rtype: Catalog or None
+        """
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != VERSION:
+            return None
+        return cls(data["classes"], created=data.get("created", ""), path=path)
+
+    def save(self, path=""):
+        """
+        Writes the catalog to a file.
+
+        :param path: The path of the catalog file.
+            If not specified, the path which the catalog was loaded from is used.
+        :return: The path which the catalog was saved to
+        :rtype: str
+        """
+        path = path or self.path or PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": VERSION, "created": self.created, "classes": self.classes},
+                file, indent=1
+            )
+        os.replace(temp, path)
+        self.path = path
+        return path
+
+    def options(self, page, query):
+        """
+        Lists the options of a filter query.
+
+        :param page: The name of the scraper class
+        :param query: The filter query
+        :return: Options which the filter query can be configured to
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: The catalog has no options for ``query``
+        """
+        try:
+            return list(self.classes[page][query.lower()])
+        except KeyError as err:
+            raise fangraphs.exceptions.InvalidFilterQuery(query) from err
+
+    def validate(self, page, query, option):
+        """
+        Checks that ``option`` is an option of a filter query.
+
+        :param page: The name of the scraper class
+        :param query: The filter query
+        :param option: The option to check
+        :raises FanGraphs.exceptions.InvalidFilterQuery: The catalog has no options for ``query``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+        """
+        options = [str(o).lower() for o in self.options(page, query)]
+        if str(option).lower() not in options:
+            raise fangraphs.exceptions.InvalidFilterOption(option)
+
+
+def get_catalog(path=None):
+    """
+    Returns the process-wide catalog, loading it from :py:data:`PATH` on first use.
+    If ``path`` is specified, the catalog file at ``path`` is returned instead.
+    Each catalog file is loaded once, and kept by its path.
+
+    :param path: The path of the catalog file
+    :rtype: Catalog
+    :raises FanGraphs.exceptions.CatalogNotFound: No catalog of the current version exists
+    """
+    global _catalog
+    if path is None:
+        if _catalog is None:
+            _catalog = get_catalog(PATH)
+        return _catalog
+    if _catalog is not None and _catalog.path == path:
+        return _catalog
+    if path not in _loaded:
+        loaded = Catalog.load(path)
+        if loaded is None:
+            raise fangraphs.exceptions.CatalogNotFound(path)
+        _loaded[path] = loaded
+    return _loaded[path]
+
+
+def set_catalog(catalog):
+    """
+    Replaces the process-wide catalog returned by :py:func:`get_catalog`.
+    The catalog files loaded by path are loaded again on next use.
+
+    :param catalog: The new catalog, or ``None`` to load the catalog file again on next use
+    :type catalog: Catalog or None
+    """
+    global _catalog
+    _catalog = catalog
+    _loaded.clear()
+
+
+def validate_filters(page, filters):
+    """
+    Checks every option of a filter configuration against the process-wide catalog, without opening a page.
+    Nothing is checked if no catalog has been saved, or if the catalog has no options of ``page``.
+    The catalog should be refreshed when new seasons are added to the pages.
+
+    :param page: The name of the scraper class
+    :param filters: Mapping of filter queries to an option, or to a list of options
+    :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+    :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+    """
+    try:
+        saved = get_catalog()
+    except fangraphs.exceptions.CatalogNotFound:
+        return
+    if page not in saved.classes:
+        return
+    for query, option in filters.items():
+        options = option if isinstance(option, (list, tuple, set)) else [option]
+        for opt in options:
+            saved.validate(page, query, opt)
+
+
+def snapshot(scraper_cls, **kwargs):
+    """
+    Lists the options of every filter query of a scraper class from the live page.
+
+    :param scraper_cls: The class in :py:mod:`fangraphs.leaders.leaders`
+    :param kwargs: Keyword arguments passed to ``scraper_cls``
+    :return: Mapping of filter queries to options
+    :rtype: dict
+    """
+    with scraper_cls(**kwargs) as scraper:
+        return {
+            query: scraper.list_options(query) for query in scraper.list_queries()
+        }
+
+
+def refresh(path=PATH, classes=None, **kwargs):
+    """
+    Snapshots the options of every scraper class in :py:mod:`fangraphs.leaders.leaders`
+    and saves the catalog to ``path``.
+    The classes which are not refreshed keep their options from the existing catalog.
+
+    :param path: The path of the catalog file
+    :param classes: The names of the classes to refresh. If not specified, every class is refreshed.
+    :param kwargs: Keyword arguments passed to each scraper class
+    :return: The refreshed catalog
+    :rtype: Catalog
+    """
+    from fangraphs.leaders import leaders
+
+    catalog = Catalog.load(path) or Catalog({}, path=path)
+    names = classes or [
+        "GameSpan", "International", "MajorLeague", "SeasonStat", "Splits", "WAR"
+    ]
+    for name in names:
+        catalog.classes[name] = snapshot(getattr(leaders, name), **kwargs)
+    catalog.created = datetime.datetime.now().isoformat(timespec="seconds")
+    catalog.save(path)
+    set_catalog(catalog)
+    return catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Refresh the catalog of filter query options from the live pages."
+    )
+    parser.add_argument("classes", nargs="*", help="The scraper classes to refresh")
+    parser.add_argument("--path", default=PATH, help="The path of the catalog file")
+    args = parser.parse_args(argv)
+    catalog = refresh(args.path, args.classes or None)
+    for name, queries in sorted(catalog.classes.items()):
+        print(f"{name}: {len(queries)} queries")
+    print(f"Saved to {catalog.path}")
+
+
+if __name__ == "__main__":
+    main()
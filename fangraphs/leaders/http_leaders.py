@@ -0,0 +1,454 @@
+#! python3
+# FanGraphs/leaders/http_leaders.py
+
+"""
+Browserless scrapers which fetch leaderboards over plain HTTP.
+
+Some FanGraphs **Leaders** pages encode their entire filter configuration in the query string.
+For those pages, the configuration is turned into a request URL and the data table is
+fetched and parsed directly, without launching a browser.
+
+The **Export Data** buttons of the ASP.NET pages are WebForms postbacks.
+With ``postback=True``, the hidden form fields (``__VIEWSTATE``, ``__EVENTVALIDATION``, ...)
+are extracted from the page once and the postback is replayed over HTTP,
+which returns the same CSV file as the button.
+The state is reused by the exports of every filter configuration of the session.
+"""
+
+import os
+from urllib.parse import urlparse, parse_qs
+
+import bs4
+import requests
+from requests.adapters import HTTPAdapter
+
+import fangraphs.exceptions
+from fangraphs.leaders import ratelimit, tables, urls
+from fangraphs.selectors import leaders_params
+
+
+_session = None
+
+
+def get_session():
+    """
+    Returns the process-wide ``requests.Session`` shared by the HTTP scrapers.
+    The session keeps a pool of connections alive between requests.
+
+    :rtype: requests.Session
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+        _session.headers["User-Agent"] = "Mozilla/5.0 (compatible; fangraphs-export)"
+    return _session
+
+
+def parse_table(html, selector):
+    """
+    Parses the headers and rows of a data table.
+
+    :param html: The HTML of the page
+    :param selector: The CSS selector of the ``table`` element
+    :return: The column headers and the cells of each row of the table
+    :rtype: tuple
+    :raises FanGraphs.exceptions.TableNotFound: No table matches ``selector``
+    """
+    soup = bs4.BeautifulSoup(html, features="lxml")
+    table = soup.select_one(selector)
+    if table is None:
+        raise fangraphs.exceptions.TableNotFound(selector)
+    headers = [
+        e.getText(strip=True) for e in table.select("thead th.rgHeader")
+    ]
+    rows = []
+    for row in table.select("tbody > tr"):
+        if "rgNoRecords" in (row.get("class") or []):
+            continue
+        rows.append(row.select("td"))
+    return headers, rows
+
+
+def parse_hidden_fields(html):
+    """
+    Extracts the ASP.NET hidden form fields of a page.
+
+    :param html: The HTML of the page
+    :return: Mapping of the names of the hidden fields to their values
+    :rtype: dict
+    """
+    soup = bs4.BeautifulSoup(html, features="lxml")
+    return {
+        e.get("name"): e.get("value", "")
+        for e in soup.select("input[type='hidden'][name^='__']")
+    }
+
+
+class HTTPScrapingUtilities:
+    """
+    Manages the objects used for scraping FanGraphs webpages over plain HTTP.
+    Subclasses set :py:attr:`_params` to the class in :py:mod:`fangraphs.selectors.leaders_params`
+    which describes the query string of the page.
+    """
+    _params = None
+
+    def __init__(self, address, *, session=None, timeout=30.0, postback=False, cache=None,
+                 limiter=None):
+        """
+        :param address: The base URL address of the FanGraphs page
+        :param session: The session to send requests with.
+            If not specified, the session from :py:func:`get_session` is used.
+        :param timeout: Seconds to wait for a response
+        :param postback: If ``True``, :py:meth:`export` replays the **Export Data** postback
+            instead of parsing the data table
+        :param cache: Serves repeated exports of the same filter configuration from disk.
+            If not specified, every export is requested.
+        :type cache: fangraphs.leaders.cache.ExportCache
+        :param limiter: Rate limits the requests of the scraper.
+            If not specified, the process-wide limiter from
+            :py:func:`fangraphs.leaders.ratelimit.get_limiter` is used, if any.
+        :type limiter: fangraphs.leaders.ratelimit.RateLimiter
+        """
+        self.address = address
+        self.session = session or get_session()
+        self.timeout = timeout
+        self.postback = postback
+        self.cache = cache
+        self.limiter = limiter
+        os.makedirs("out", exist_ok=True)
+
+        self.filters = {}
+        self.__form_state = None
+        self.postbacks = 0
+        self.state_requests = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.reset()
+
+    def _throttle(self):
+        """
+        Waits for a token of the rate limiter before a request is sent to FanGraphs.
+
+        :return: The seconds waited
+        :rtype: float
+        """
+        limiter = self.limiter or ratelimit.get_limiter()
+        if limiter is None:
+            return 0.0
+        return limiter.acquire()
+
+    def _get(self, url):
+        """
+        Sends a ``GET`` request.
+
+        :param url: The URL to request
+        :rtype: requests.Response
+        """
+        self._throttle()
+        res = self.session.get(url, timeout=self.timeout)
+        res.raise_for_status()
+        return res
+
+    def _form_state(self, url, *, refresh=False):
+        """
+        Returns the hidden form fields of the page.
+        The page is only requested the first time the state is needed, from ``url``;
+        the state is then reused by the postbacks of every later filter configuration of the session,
+        since each postback is sent to the URL of its own configuration.
+        If the page rejects the reused state, :py:meth:`_replay_postback` requests it again from ``url``.
+
+        :param url: The URL of the page
+        :param refresh: If ``True``, the page is requested again
+        :rtype: dict
+        """
+        if refresh or self.__form_state is None:
+            self.__form_state = parse_hidden_fields(self._get(url).text)
+            self.state_requests += 1
+        return self.__form_state
+
+    def _replay_postback(self, url, target):
+        """
+        Replays an ASP.NET postback of the page at ``url`` and returns the response body.
+        The stored hidden-field state is reused; if the page rejects it,
+        either with an error status (as ASP.NET does for a stale ``__VIEWSTATE``) or by not returning a CSV file,
+        the state is requested once more and the postback is retried.
+
+        :param url: The URL of the page
+        :param target: The ``__EVENTTARGET`` of the postback
+        :return: The body of the response
+        :rtype: bytes
+        :raises FanGraphs.exceptions.PostbackRejected: The response is not a CSV file
+        :raises requests.HTTPError: The retried postback has an error status
+        """
+        for refresh in (False, True):
+            data = dict(self._form_state(url, refresh=refresh))
+            data["__EVENTTARGET"] = target
+            data["__EVENTARGUMENT"] = ""
+            self._throttle()
+            res = self.session.post(url, data=data, timeout=self.timeout)
+            self.postbacks += 1
+            if not res.ok and not refresh:
+                continue
+            res.raise_for_status()
+            disposition = res.headers.get("Content-Disposition", "")
+            if "csv" in res.headers.get("Content-Type", "") or "attachment" in disposition:
+                return res.content
+        raise fangraphs.exceptions.PostbackRejected(target)
+
+    @classmethod
+    def list_queries(cls):
+        """
+        Lists the possible filter queries which can be used to modify search results.
+
+        :return: Filter queries which can be used to modify search results
+        :rtype: list
+        """
+        queries = []
+        queries.extend(list(cls._params.params))
+        queries.extend(list(cls._params.aliases))
+        queries.extend(list(cls._params.composite))
+        return queries
+
+    def _validate(self, query: str, option: str):
+        """
+        Checks that ``option`` is a valid option of ``query``.
+
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+        """
+        if query in self._params.params:
+            values = self._params.params[query][1]
+            if values and option not in values:
+                raise fangraphs.exceptions.InvalidFilterOption(option)
+
+    def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+        """
+        query, option = query.lower(), str(option).lower()
+        if query not in self.list_queries():
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        self._validate(query, option)
+        self.filters[query] = option
+
+    def current_option(self, query: str):
+        """
+        Retrieves the option which a filter query has been configured to.
+
+        :param query: The filter query
+        :return: The configured option, or ``None`` if the query has its default option
+        :rtype: str or None
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        if query not in self.list_queries():
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        return self.filters.get(query)
+
+    @classmethod
+    def query_params(cls, filters):
+        """
+        Translates a filter configuration into the query-string parameters of the page
+        with :py:func:`fangraphs.leaders.urls.query_params`.
+
+        :param filters: Mapping of filter queries to options
+        :return: The query-string parameters
+        :rtype: dict
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query cannot be expressed in the URL
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        return urls.query_params(cls._params, filters)
+
+    def url(self):
+        """
+        :return: The URL which encodes the current filter configuration
+        :rtype: str
+        """
+        return urls.build_url(self.address, self.query_params(self.filters))
+
+    @staticmethod
+    def _export_rows(headers, cells):
+        """
+        Converts parsed table cells into rows of text.
+        """
+        return headers, [[c.getText(strip=True) for c in row] for row in cells]
+
+    def fetch(self):
+        """
+        Requests and parses the leaderboard of the current filter configuration.
+
+        :return: The column headers and the rows of the leaderboard
+        :rtype: tuple
+        """
+        res = self._get(self.url())
+        headers, cells = parse_table(res.text, self._params.table)
+        return self._export_rows(headers, cells)
+
+    def iter_rows(self):
+        """
+        Yields the rows of the leaderboard of the current filter configuration,
+        from the **Export Data** postback if it is replayed, otherwise from the data table.
+
+        :return: A generator which yields the column headers, then the cells of each row
+        :rtype: generator
+        """
+        if self.postback:
+            headers, rows = tables.read_csv(
+                self._replay_postback(self.url(), self._params.postback)
+            )
+        else:
+            headers, rows = self.fetch()
+        yield headers
+        yield from rows
+
+    def fetch_table(self, *, kind="columns"):
+        """
+        Returns the leaderboard of the current filter configuration as an in-memory,
+        column-oriented table, without saving any file.
+        The type of each column is inferred, as in :py:func:`fangraphs.leaders.tables.columnar`.
+
+        :param kind: ``"columns"`` (mapping of headers to lists), ``"numpy"`` (mapping of headers
+            to NumPy arrays) or ``"arrow"`` (``pyarrow.RecordBatch``)
+        :return: The columns of the leaderboard
+        :rtype: dict or pyarrow.RecordBatch
+        """
+        rows = self.iter_rows()
+        return tables.columnar(next(rows, []), rows, kind)
+
+    def export(self, path="", *, format=None):
+        """
+        Exports the leaderboard of the current filter configuration.
+        The data will be exported with the same columns as the **Export Data** button,
+        as a CSV file unless ``path`` or ``format`` specify a columnar format.
+        The file will be saved to the filepath ``path``, if specified.
+        Otherwise, the file will be saved to the filepath *out/%d.%m.%y %H.%M.%S.csv*.
+        If the scraper was created with a ``cache``, a cached export of the same
+        filter configuration is copied to ``path`` instead.
+
+        :param path: The path to save the exported file to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``.
+            If not specified, the format is inferred from the extension of ``path``.
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        path = tables.resolve_path(path, format)
+        page = type(self).__name__
+        if self.cache is not None and self.cache.get(page, self.filters, path):
+            return path
+        if self.postback and path.endswith(".csv"):
+            content = self._replay_postback(self.url(), self._params.postback)
+            with open(path, "wb") as file:
+                file.write(content)
+        else:
+            rows = self.iter_rows()
+            tables.write(next(rows, []), rows, path)
+        if self.cache is not None:
+            self.cache.put(page, self.filters, path)
+        return path
+
+    def reset(self):
+        """
+        Resets every filter query to its default option.
+        """
+        self.filters.clear()
+
+
+class MajorLeague(HTTPScrapingUtilities):
+    """
+    Browserless scraper for the FanGraphs `Major League Leaderboards`_ page.
+    The filter queries and options are the same as :py:class:`fangraphs.leaders.leaders.MajorLeague`.
+
+    The following filter queries cannot be expressed in the query string:
+
+    - ``hof``
+    - ``rookies``
+
+    .. _Major League Leaderboards: https://fangraphs.com/leaders.aspx
+    """
+    _params = leaders_params.MajorLeague
+
+    address = "https://www.fangraphs.com/leaders.aspx"
+
+    def __init__(self, *, address="", **kwargs):
+        """
+        :param address: The URL address to request instead of :py:attr:`address`
+        :param kwargs: Keyword arguments passed to :py:class:`HTTPScrapingUtilities`
+        """
+        super().__init__(address or self.address, **kwargs)
+
+    def _validate(self, query: str, option: str):
+        super()._validate(query, option)
+        if query == "group" and option not in self._params.groups:
+            raise fangraphs.exceptions.InvalidFilterOption(option)
+        if query == "split_teams" and option not in ("true", "false"):
+            raise fangraphs.exceptions.InvalidFilterOption(option)
+
+    @classmethod
+    def query_params(cls, filters):
+        filters = {k.lower(): str(v).lower() for k, v in filters.items()}
+        params = super().query_params(filters)
+        if "age1" in filters or "age2" in filters:
+            params["age"] = "{},{}".format(
+                filters.get("age1", "14"), filters.get("age2", "58")
+            )
+        params["team"] += cls._params.groups[filters.get("group", "player stats")]
+        if filters.get("split_teams") == "true":
+            params["team"] += ",to"
+        return params
+
+    @staticmethod
+    def _export_rows(headers, cells):
+        """
+        Converts parsed table cells into the columns of the **Export Data** CSV file:
+        the ``#`` column is dropped and a ``playerid`` column is appended.
+        """
+        rank = headers.index("#") if "#" in headers else None
+        columns = [h for i, h in enumerate(headers) if i != rank]
+        columns.append("playerid")
+        rows = []
+        for row in cells:
+            values = [
+                c.getText(strip=True) for i, c in enumerate(row) if i != rank
+            ]
+            playerid = ""
+            for link in (c.select_one("a[href*='playerid=']") for c in row):
+                if link is not None:
+                    playerid = parse_qs(urlparse(link["href"]).query)["playerid"][0]
+                    break
+            values.append(playerid)
+            rows.append(values)
+        return columns, rows
+
+
+class WAR(HTTPScrapingUtilities):
+    """
+    Browserless scraper for the FanGraphs `Combined WAR Leaderboards`_ page.
+    The filter queries are the same as :py:class:`fangraphs.leaders.leaders.WAR`.
+
+    The following filter queries cannot be expressed in the query string:
+
+    - ``team``
+    - ``type``
+
+    .. _Combined WAR Leaderboards: https://www.fangraphs.com/warleaders.aspx
+    """
+    _params = leaders_params.WAR
+
+    address = "https://www.fangraphs.com/warleaders.aspx"
+
+    def __init__(self, *, address="", **kwargs):
+        """
+        :param address: The URL address to request instead of :py:attr:`address`
+        :param kwargs: Keyword arguments passed to :py:class:`HTTPScrapingUtilities`
+        """
+        super().__init__(address or self.address, **kwargs)
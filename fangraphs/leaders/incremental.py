@@ -0,0 +1,254 @@
+#! python3
+# FanGraphs/leaders/incremental.py
+
+"""
+Incremental exports of a range of seasons, which only export the seasons that can still change.
+
+Each season of a filter configuration is a partition, stored once in a :py:class:`PartitionStore`.
+The manifest of the store records the content hash of every partition.
+A refresh only exports the open partitions (the current season and any partition never exported),
+replaces a stored partition only if its content changed,
+and rebuilds the combined output only if one of its partitions changed.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import json
+import os
+import time
+
+import fangraphs.exceptions
+from fangraphs.leaders import batch, seasons
+from fangraphs.leaders.cache import ExportCache
+
+
+def file_hash(path):
+    """
+    :param path: The path of the file
+    :return: The SHA-256 hash of the contents of the file
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(2 ** 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PartitionStore:
+    """
+    Directory of exported partitions, keyed by the name of the scraper class,
+    the normalized filter configuration and the season.
+    The manifest of the store is stored in the same directory as *manifest.json*.
+    """
+    def __init__(self, directory="out/partitions", *, current_season=None):
+        """
+        :param directory: The directory to store the partitions in
+        :param current_season: The season which is still being played.
+            If not specified, the current year is used.
+        """
+        self.directory = directory
+        self.current_season = current_season or datetime.date.today().year
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.__manifest_path = os.path.join(self.directory, "manifest.json")
+        self.manifest = self.__load_manifest()
+
+    def __load_manifest(self):
+        try:
+            with open(self.__manifest_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"partitions": {}, "outputs": {}}
+
+    def save(self):
+        """
+        Writes the manifest of the store.
+        """
+        temp = f"{self.__manifest_path}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(self.manifest, file, indent=1)
+        os.replace(temp, self.__manifest_path)
+
+    @staticmethod
+    def key(page, filters, season):
+        """
+        :param page: The name of the scraper class
+        :param filters: Mapping of the filter queries other than the season range to their options
+        :param season: The season of the partition
+        :return: The key of the partition
+        :rtype: str
+        """
+        payload = json.dumps([page, ExportCache.normalize(filters), int(season)])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def output_path(self, page, filters, start, end):
+        """
+        :param page: The name of the scraper class
+        :param filters: Mapping of the filter queries other than the season range to their options
+        :param start: The first season of the range
+        :param end: The last season of the range
+        :return: The default path of the combined output of a range of seasons,
+            which is the same for every refresh of the same configuration
+        :rtype: str
+        """
+        payload = json.dumps([page, ExportCache.normalize(filters), int(start), int(end)])
+        name = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "outputs", f"{page}-{name}.csv")
+
+    def get(self, page, filters, season):
+        """
+        :return: The manifest entry of a partition, or ``None`` if it is not stored
+        :rtype: dict or None
+        """
+        entry = self.manifest["partitions"].get(self.key(page, filters, season))
+        if entry is not None and not os.path.exists(self.path(entry)):
+            return None
+        return entry
+
+    def path(self, entry):
+        """
+        :param entry: The manifest entry of a partition
+        :return: The path of the stored partition
+        :rtype: str
+        """
+        return os.path.join(self.directory, entry["file"])
+
+    def is_open(self, page, filters, season):
+        """
+        A partition is open if it has never been stored, or if its season is still being played.
+
+        :rtype: bool
+        """
+        entry = self.get(page, filters, season)
+        return entry is None or int(season) >= self.current_season
+
+    def put(self, page, filters, season, source):
+        """
+        Stores an exported partition, moving ``source`` into the store.
+        A stored partition is only replaced if the content hash of ``source`` differs.
+
+        :param page: The name of the scraper class
+        :param filters: Mapping of the filter queries other than the season range to their options
+        :param season: The season of the partition
+        :param source: The path of the exported partition
+        :return: ``True`` if the partition is new or changed
+        :rtype: bool
+        """
+        key = self.key(page, filters, season)
+        digest = file_hash(source)
+        entry = self.get(page, filters, season)
+        now = time.time()
+        if entry is not None and entry["sha256"] == digest:
+            os.remove(source)
+            entry["checked"] = now
+            return False
+        name = key + os.path.splitext(source)[1]
+        os.replace(source, os.path.join(self.directory, name))
+        self.manifest["partitions"][key] = {
+            "file": name,
+            "page": page,
+            "filters": ExportCache.normalize(filters),
+            "season": int(season),
+            "sha256": digest,
+            "exported": now,
+            "checked": now,
+        }
+        return True
+
+    @staticmethod
+    def signature(entries):
+        """
+        :param entries: The manifest entries of the partitions of an output, in order
+        :return: The combined hash of the partitions, which changes if any partition changes
+        :rtype: str
+        """
+        return hashlib.sha256(
+            "".join(e["sha256"] for e in entries).encode("utf-8")
+        ).hexdigest()
+
+
+async def refresh_async(scraper, filters, start, end, path="", *, store=None, contexts=4,
+                        browser=None, **options):
+    """
+    Coroutine of :py:func:`refresh`.
+
+    :param browser: A running asynchronous ``Playwright`` browser.
+        If not specified, a browser is launched for the open partitions.
+    """
+    name = scraper if isinstance(scraper, str) else scraper.__name__
+    store = store or PartitionStore()
+    staging = os.path.join(store.directory, "staging")
+    jobs = seasons.shard_jobs(name, filters, start, end, directory=staging)
+    years = [season for season, _ in seasons.season_shards(start, end)]
+    os.makedirs(staging, exist_ok=True)
+
+    pending = [
+        (season, job) for season, job in zip(years, jobs)
+        if store.is_open(name, filters, season)
+    ]
+    results = []
+    if pending:
+        results = await batch.export_batch_async(
+            name, [job for _, job in pending], contexts=contexts, browser=browser, **options
+        )
+    changed, failures = [], {}
+    for (season, _), result in zip(pending, results):
+        if not result.ok:
+            failures[result.path] = result.error
+        elif store.put(name, filters, season, result.path):
+            changed.append(season)
+    store.save()
+    if failures:
+        raise fangraphs.exceptions.ShardsFailed(failures)
+
+    entries = [store.get(name, filters, season) for season in years]
+    signature = store.signature(entries)
+    path = path or store.output_path(name, filters, start, end)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    output = os.path.abspath(path)
+    rewritten = not (
+        os.path.exists(output) and store.manifest["outputs"].get(output) == signature
+    )
+    if rewritten:
+        path = seasons.merge([store.path(e) for e in entries], path)
+        store.manifest["outputs"][output] = signature
+        store.save()
+    return {
+        "path": path,
+        "fetched": [season for season, _ in pending],
+        "changed": changed,
+        "rewritten": rewritten,
+    }
+
+
+def refresh(scraper, filters, start, end, path="", *, store=None, contexts=4, **options):
+    """
+    Incrementally exports the leaderboard of a range of seasons, one partition per season.
+
+    Only the open partitions are exported: seasons never exported before, and the current season.
+    A stored partition is only replaced if its content hash changed,
+    and the combined output at ``path`` is only rewritten if one of its partitions changed
+    (or the output does not exist).
+
+    :param scraper: A leaders class, or the name of one
+    :param filters: Mapping of the filter queries other than the season range to their options
+    :param start: The first season of the range
+    :param end: The last season of the range
+    :param path: The path to save the combined leaderboard to.
+        If not specified, :py:meth:`PartitionStore.output_path` is used, so every refresh of the same
+        configuration rewrites the same output.
+    :param store: The store of the partitions. If not specified, *out/partitions* is used.
+    :type store: PartitionStore or None
+    :param contexts: The maximum number of partitions exported at once
+    :param options: Keyword arguments passed to each scraper, e.g. ``resource_filter``
+    :return: The path of the combined output (``path``), the seasons which were exported (``fetched``),
+        the seasons whose content changed (``changed``) and whether the output was rewritten (``rewritten``)
+    :rtype: dict
+    :raises ValueError: ``scraper`` has no range of seasons which can be split by season
+    :raises FanGraphs.exceptions.ShardsFailed: At least one partition could not be exported
+    """
+    return asyncio.run(refresh_async(
+        scraper, filters, start, end, path, store=store, contexts=contexts, **options
+    ))
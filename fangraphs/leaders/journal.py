@@ -0,0 +1,246 @@
+#! python3
+# FanGraphs/leaders/journal.py
+
+"""
+Checkpointing of long batch exports, so an interrupted batch resumes where it stopped.
+
+Every job of a batch is recorded in a SQLite :py:class:`JobJournal` with its configuration,
+status, output path and the content hash of its output.
+A job is exported to a temporary file next to its output path, which is only renamed to the output path
+once the export has finished, so an output file is never left partially written.
+When the batch is run again, the jobs whose output is recorded as complete (and still has the recorded hash)
+are skipped, and only the unfinished jobs are exported.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+
+from fangraphs.leaders import batch, scheduler
+from fangraphs.leaders.cache import ExportCache
+from fangraphs.leaders.incremental import file_hash
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    page TEXT NOT NULL,
+    filters TEXT NOT NULL,
+    path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    sha256 TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated REAL NOT NULL
+)
+"""
+
+
+def partial_path(path):
+    """
+    :param path: The output path of a job
+    :return: The temporary path which the job is exported to before it is renamed to ``path``.
+        The extension of ``path`` is kept, so the export format is the same.
+    :rtype: str
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root}.partial{extension}"
+
+
+class JobJournal:
+    """
+    Journal of the jobs of batch exports, stored in a SQLite database.
+    A job is keyed by the name of the scraper class, its normalized filter configuration and its output path.
+    The status of a job is ``"pending"``, ``"failed"`` or ``"complete"``.
+    """
+    def __init__(self, path="out/journal.sqlite3"):
+        """
+        :param path: The path of the SQLite database
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        self.connection.close()
+
+    @staticmethod
+    def key(page, filters, path):
+        """
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param path: The output path of the job
+        :return: The key of the job
+        :rtype: str
+        """
+        return json.dumps([page, ExportCache.normalize(filters), os.path.abspath(path)])
+
+    def add(self, page, filters, path):
+        """
+        Records a job as pending, unless it is already recorded.
+
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param path: The output path of the job
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO jobs (key, page, filters, path, status, updated) "
+                "VALUES (?, ?, ?, ?, 'pending', ?)",
+                (self.key(page, filters, path), page, json.dumps(filters, sort_keys=True), path, time.time())
+            )
+
+    def get(self, page, filters, path):
+        """
+        :return: The record of a job, or ``None`` if it is not recorded
+        :rtype: dict or None
+        """
+        row = self.connection.execute(
+            "SELECT * FROM jobs WHERE key = ?", (self.key(page, filters, path),)
+        ).fetchone()
+        return None if row is None else dict(row)
+
+    def entries(self, status=None):
+        """
+        :param status: Only the jobs with this status are returned. If not specified, every job is returned.
+        :return: The records of the jobs, in the order in which they were recorded
+        :rtype: list
+        """
+        if status is None:
+            rows = self.connection.execute("SELECT * FROM jobs ORDER BY rowid")
+        else:
+            rows = self.connection.execute("SELECT * FROM jobs WHERE status = ? ORDER BY rowid", (status,))
+        return [dict(r) for r in rows]
+
+    def is_complete(self, page, filters, path):
+        """
+        A job is complete if it is recorded as complete,
+        and its output still exists with the recorded content hash.
+
+        :rtype: bool
+        """
+        entry = self.get(page, filters, path)
+        return (
+            entry is not None and entry["status"] == "complete"
+            and os.path.exists(path) and file_hash(path) == entry["sha256"]
+        )
+
+    def complete(self, page, filters, path, source, attempts=1):
+        """
+        Moves the finished export of a job to its output path and records the job as complete.
+
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param path: The output path of the job
+        :param source: The path which the job was exported to
+        :param attempts: The number of attempts of the job by this run
+        :return: The content hash of the output
+        :rtype: str
+        """
+        digest = file_hash(source)
+        os.replace(source, path)
+        with self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET status = 'complete', sha256 = ?, attempts = attempts + ?, error = NULL, "
+                "updated = ? WHERE key = ?",
+                (digest, attempts, time.time(), self.key(page, filters, path))
+            )
+        return digest
+
+    def fail(self, page, filters, path, error, attempts=1):
+        """
+        Records a job as failed.
+
+        :param page: The name of the scraper class
+        :param filters: Mapping of filter queries to options
+        :param path: The output path of the job
+        :param error: The exception raised by the job
+        :param attempts: The number of attempts of the job by this run
+        """
+        with self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET status = 'failed', attempts = attempts + ?, error = ?, updated = ? "
+                "WHERE key = ?",
+                (attempts, repr(error), time.time(), self.key(page, filters, path))
+            )
+
+
+async def export_resumable_async(scraper, jobs, *, journal=None, browser=None, **options):
+    """
+    Coroutine of :py:func:`export_resumable`.
+
+    :param browser: A running asynchronous ``Playwright`` browser.
+        If not specified, a browser is launched for the unfinished jobs.
+    """
+    scraper = batch.resolve_scraper(scraper)
+    name = scraper.__name__
+    if journal is None:
+        with JobJournal() as journal:
+            return await export_resumable_async(scraper, jobs, journal=journal, browser=browser, **options)
+    jobs = [batch.BatchJob.from_spec(j) for j in jobs]
+    paths = [job.path or batch._default_path(scraper, i) for i, job in enumerate(jobs)]
+
+    results = [None] * len(jobs)
+    pending = []
+    for index, (job, path) in enumerate(zip(jobs, paths)):
+        journal.add(name, job.filters, path)
+        if journal.is_complete(name, job.filters, path):
+            results[index] = batch.BatchResult(index, job, path, attempts=0)
+        else:
+            pending.append(index)
+
+    def record(result):
+        index = pending[result.index]
+        job, path = jobs[index], paths[index]
+        if result.ok:
+            journal.complete(name, job.filters, path, result.path, result.attempts)
+        else:
+            journal.fail(name, job.filters, path, result.error, result.attempts)
+            if os.path.exists(result.path):
+                os.remove(result.path)
+        results[index] = batch.BatchResult(
+            index, job, path, result.error, result.elapsed, result.attempts
+        )
+
+    if pending:
+        await scheduler.schedule_async(
+            name, [batch.BatchJob(jobs[i].filters, partial_path(paths[i])) for i in pending],
+            on_result=record, browser=browser, **options
+        )
+    return results
+
+
+def export_resumable(scraper, jobs, *, journal=None, **options):
+    """
+    Exports the leaderboard of ``scraper`` once for each job with :py:func:`fangraphs.leaders.scheduler.schedule`,
+    recording every job in ``journal`` as soon as it finishes.
+
+    If the batch is interrupted, running it again with the same jobs and journal skips the complete jobs.
+    Each output file is written exactly once: a job is exported to :py:func:`partial_path` and renamed to its
+    output path when it finishes, so an output file is either absent or complete.
+
+    :param scraper: A leaders class, or the name of one
+    :param jobs: The job specifications, see :py:meth:`fangraphs.leaders.batch.BatchJob.from_spec`.
+        Jobs without a path are exported to *out/<ClassName>-<index>.csv*, so their order must not change between runs.
+    :param journal: The journal of the batch. If not specified, *out/journal.sqlite3* is used.
+    :type journal: JobJournal or None
+    :param options: Keyword arguments passed to :py:func:`fangraphs.leaders.scheduler.schedule`,
+        e.g. ``deadline`` or ``retry``, and to each scraper
+    :return: The result of each job, in the order of ``jobs``. Skipped jobs have no attempts.
+    :rtype: list
+    """
+    return asyncio.run(export_resumable_async(scraper, jobs, journal=journal, **options))
@@ -3,355 +3,69 @@
 
 """
 Scrpaer for the webpages under the FanGaphs **Leaders** tab.
+The filter queries of each page are described in :py:mod:`fangraphs.leaders.pages`.
 """
 
-import csv
-import datetime
-import os
-
 import fangraphs.exceptions
-from fangraphs.leaders import ScrapingUtilities
-from fangraphs import selectors
-from fangraphs.selectors import leaders_sel
+from fangraphs.leaders import (
+    ROWS_CHANGED, ScrapingUtilities, combination_name, export_path, gray_product, tables,
+    toggled_options
+)
+from fangraphs.leaders.pages import (
+    GameSpanPage, InternationalPage, MajorLeaguePage, SeasonStatPage, SplitsPage, WARPage
+)
 
 
-class GameSpan(ScrapingUtilities):
+class GameSpan(GameSpanPage, ScrapingUtilities):
     """
     Scraper for the FanGraphs `60-Game Span Leaderboards`_ page.
 
     .. _60-Game Span Leaderboards: https://www.fangraphs.com/leaders/special/60-game-span
     """
-    __selections = {}
-    __dropdowns = {}
-    __waitfor = leaders_sel.GameSpan.waitfor
-
-    address = "https://fangraphs.com/leaders/special/60-game-span"
-
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
-
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
+        self._compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
-        for cat, sel in leaders_sel.GameSpan.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
-            )
-        for cat, sel in leaders_sel.GameSpan.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > a")
-            )
-
-    @classmethod
-    def list_queries(cls):
-        """
-        Lists the possible filter queries which can be used to modify search results.
-
-        :return: Filter queries which can be used to modify search results
-        :rtype: list
-        """
-        queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
-        return queries
-
-    def list_options(self, query: str):
-        """
-        Lists the possible options which a filter query can be configured to.
-
-        :param query: The filter query
-        :return: Options which the filter query can be configured to
-        :rtype: list
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return options
-
-    def current_option(self, query: str):
-        """
-        Retrieves the option which a filter query is currently set to.
-
-        :param query: The filter query being retrieved of its current option
-        :return: The option which the filter query is currently set to
-        :rtype: str
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=3)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return option
-
-    def configure(self, query: str, option: str):
-        """
-        Configures a filter query to a specified option.
 
-        :param query: The filter query to be configured
-        :param option: The option to set the filter query to
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        self._refresh_parser()
-
-    def export(self, path=""):
-        """
-        Uses the **Export Data** button on the webpage to export the current leaderboard.
-        The data will be exported as a CSV file and the file will be saved to *out/*.
-        The file will be saved to the filepath ``path``, if specified.
-        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
-
-        :param path: The path to save the exported data to
-        """
-        self.export_data(".data-export", path)
-
-
-class International(ScrapingUtilities):
+class International(InternationalPage, ScrapingUtilities):
     """
     Scraper for the FanGraphs `KBO Leaderboards`_ page.
 
     .. _KBO Leaderboards: https://www.fangraphs.com/leaders/international
     """
-    __selections = {}
-    __dropdowns = {}
-    __switches = {}
-    __waitfor = leaders_sel.International.waitfor
-
-    address = "https://www.fangraphs.com/leaders/international"
-
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
-
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
+        self._compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
-        for cat, sel in leaders_sel.International.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
-            )
-        for cat, sel in leaders_sel.International.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > a")
-            )
-        for cat, sel in leaders_sel.International.switches.items():
-            self.__switches.setdefault(
-                cat, selectors.Switches(self.soup, sel)
-            )
-
-    @classmethod
-    def list_queries(cls):
-        """
-        Lists the possible filter queries which can be used to modify search results.
-
-        :return: Filter queries which can be used to modify search results
-        :rtype: list
-        """
-        queries = []
-        queries.extend(cls.__selections)
-        queries.extend(cls.__dropdowns)
-        queries.extend(cls.__switches)
-        return queries
-
-    def list_options(self, query: str):
-        """
-        Retrieves the option which a filter query is currently set to.
-
-        :param query: The filter query being retrieved of its current option
-        :return: The option which the filter query is currently set to
-        :rtype: str
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        elif query in self.__switches:
-            options = ["True", "False"]
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return options
-
-    def current_option(self, query: str):
-        """
-
-        :param query:
-        :return:
-        """
-        query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=3)
-        elif query in self.__switches:
-            option = "True" if ",to" in self.page.url else "False"
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return option
-
-    def configure(self, query: str, option: str):
-        """
-        Configures a filter query to a specified option.
-
-        :param query: The filter query to be configured
-        :param option: The option to set the filter query to
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        elif query in self.__switches:
-            options = [o.lower() for o in self.list_options(query)]
-            if option not in options:
-                raise fangraphs.exceptions.InvalidFilterOption(option)
-            if option == self.current_option(query):
-                return
-            self.page.click(self.__switches[query])
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        self._refresh_parser()
-
-    def export(self, path=""):
-        """
-        Uses the **Export Data** button on the webpage to export the current leaderboard.
-        The data will be exported as a CSV file and the file will be saved to *out/*.
-        The file will be saved to the filepath ``path``, if specified.
-        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
-
-        :param path: The path to save the exported data to
-        """
-        self.export_data(".data-export", path)
-
 
-class MajorLeague(ScrapingUtilities):
+class MajorLeague(MajorLeaguePage, ScrapingUtilities):
     """
     Scraper for the FanGraphs `Major League Leaderboards`_ page.
 
     Note that the Splits Leaderboard is not covered.
-    Instead, it is covered by :py:class:`SplitsLeaderboards`.
+    Instead, it is covered by :py:class:`Splits`.
 
     .. _Major League Leaderboards: https://fangraphs.com/leaders.aspx
     """
-    __selections = {}
-    __dropdowns = {}
-    __switches = {}
-    __buttons = leaders_sel.MajorLeague.buttons
-
-    address = "https://fangraphs.com/leaders.aspx"
-
-    def __init__(self):
-        super().__init__(self.address, waitfor="")
-
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
+        self._compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
-        for cat, sel in leaders_sel.MajorLeague.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel, "> div > ul > li")
-            )
-        for cat, sel in leaders_sel.MajorLeague.dropdowns.items():
-            options = leaders_sel.MajorLeague.dropdown_options[cat]
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > ul > li", options)
-            )
-        for cat, sel in leaders_sel.MajorLeague.switches.items():
-            self.__switches.setdefault(
-                cat, selectors.Switches(self.soup, sel)
-            )
-
-    @classmethod
-    def list_queries(cls):
-        """
-        Lists the possible filter queries which can be used to modify search results.
-
-        :return: Filter queries which can be used to modify search results
-        :rtype: list
-        """
-        queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
-        queries.extend(list(cls.__switches))
-        return queries
-
-    def list_options(self, query: str):
-        """
-        Lists the possible options which a filter query can be configured to.
-
-        :param query: The filter query
-        :return: Options which the filter query can be configured to
-        :rtype: list
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__switches:
-            options = ["True", "False"]
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        elif query in self.__selections:
-            options = self.__selections[query].list_options()
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return options
-
-    def current_option(self, query: str):
-        """
-        Retrieves the option which a filter query is currently set to.
-
-        :param query: The filter query being retrieved of its current option
-        :return: The option which the filter query is currently set to
-        :rtype: str
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__switches:
-            option = self.__switches[query].current_option(opt_type=1)
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=1)
-        elif query in self.__selections:
-            option = self.__selections[query].current_option()
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return option
-
     def configure(self, query: str, option: str, *, autoupdate=True):
         """
         Configures a filter query to a specified option.
@@ -361,161 +75,109 @@ class MajorLeague(ScrapingUtilities):
         :param autoupdate: If ``True``, any buttons attached to the filter query will be clicked
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
-        query, option = query.lower(), str(option).lower()
         self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        elif query in self.__switches:
-            options = [o.lower() for o in self.list_options(query)]
-            if option.lower() not in options:
-                raise fangraphs.exceptions.InvalidFilterOption(option)
-            if option != self.current_option(query).title():
-                self.page.click(self.__switches[query])
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        if query in self.__buttons and autoupdate:
-            self.page.click(self.__buttons[query])
+        if not self._configure(query, option):
+            return
+        if autoupdate:
+            self._click_buttons([query])
         self._refresh_parser()
 
-    def export(self, path=""):
+    def configure_many(self, filters: dict, *, autoupdate=True):
         """
-        Uses the **Export Data** button on the webpage to export the current leaderboard.
-        The data will be exported as a CSV file and the file will be saved to *out/*.
-        The file will be saved to the filepath ``path``, if specified.
-        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
+        Configures multiple filter queries at once.
+        Buttons shared by several filter queries (e.g. ``season1`` and ``season2``) are clicked once,
+        after every filter query has been configured, and the page is re-parsed once.
 
-        :param path: The path to save the exported data to
+        :param filters: Mapping of the filter queries to configure to their options
+        :param autoupdate: If ``True``, the buttons attached to the filter queries will be clicked
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
         """
-        self.export_data("#LeaderBoard1_cmdCSV", path)
+        self._validate(filters)
+        self._close_ad()
+        changed = [
+            query for query, option in filters.items()
+            if self._configure(query, option)
+        ]
+        if autoupdate:
+            self._click_buttons(changed)
+        if changed:
+            self._refresh_parser()
 
+    def _click_buttons(self, queries):
+        """
+        Clicks the buttons attached to the filter queries, once each.
+
+        :param queries: The configured filter queries
+        """
+        for button in self._buttons(queries):
+            self._throttle()
+            self.page.click(button)
 
-class SeasonStat(ScrapingUtilities):
+
+class SeasonStat(SeasonStatPage, ScrapingUtilities):
     """
     Scraper for the FanGraphs `Season Stat Grid`_ page.
 
     .. _Season Stat Grid: https://fangraphs.com/leaders/season-stat-grid
     """
-    __selections = {}
-    __dropdowns = {}
-    __waitfor = leaders_sel.SeasonStat.waitfor
-
-    address = "https://fangraphs.com/leaders/season-stat-grid"
-
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
-
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
+        self._compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
-        for cat, sel in leaders_sel.SeasonStat.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
-            )
-        for cat, sel in leaders_sel.SeasonStat.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> ul > li")
-            )
-
-    @classmethod
-    def list_queries(cls):
-        """
-        Lists the possible filter queries which can be sued to modify search results.
-
-        :return: Filter queries which can be used to modify search results
-        :type: list
-        """
-        queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
-        return queries
-
-    def list_options(self, query: str):
+    def _page_rows(self):
         """
-        Lists the possible options which a filter query can be configured to.
+        Clicks through every page of the data table, re-parsing the page each time.
 
-        :param query: The filter query
-        :return: Options which the filter query can be configured to
-        :rtyp: list
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Argument ``query`` is invalid
+        :return: A generator which yields the column headers, then the cells of each row of every page
+        :rtype: generator
         """
-        query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return options
-
-    def current_option(self, query: str):
-        """
-        Retrieves the option which a filter query is currently configured to.
-
-        :param query: The filter query
-        :return: The option which the filter query is currently configured to
-        :rtype: str
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Argument ``query`` is invalid
-        """
-        query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=2)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return option
-
-    def configure(self, query: str, option: str):
-        """
-        Configures a filter query to a specified option.
-
-        :param query: The filter query
-        :param option: The option to configure ``query`` to
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        self._refresh_parser()
-
-    def _write_table_headers(self, writer: csv.writer):
-        """
-        Writes the headers of the data table to the CSV file.
-
-        :param writer: The ``csv.writer`` object
-        """
-        elems = self.soup.select(".table-scroll thead tr th")
-        headers = [e.getText() for e in elems]
-        writer.writerow(headers)
+        total_pages = self._parse_page_total()
+        yield self._parse_headers()
+        for page in range(total_pages):
+            if page:
+                self._throttle()
+                self.page.click(self._sel.next_page)
+                self._refresh_parser()
+            yield from self._parse_rows()
 
-    def _write_table_rows(self, writer: csv.writer):
+    def _expand_table(self):
         """
-        Iterates through the rows of the current data table.
-        The data in each row is written to the CSV file.
+        Sets the data table to its largest page size.
+        The page total is only read again once the grid has re-rendered with more rows,
+        since the pager still shows the previous total right after the page size is selected.
 
-        :param writer: The ``csv.writer`` object
+        :return: ``True`` if the entire leaderboard fits on one page of the data table
+        :rtype: bool
         """
-        row_elems = self.soup.select(".table-scroll tbody tr")
-        for row in row_elems:
-            elems = row.select("td")
-            items = [e.getText() for e in elems]
-            writer.writerow(items)
+        sel = self._sel
+        if self.page.query_selector(sel.page_size) is None:
+            return False
+        if int(self.page.inner_text(sel.page_total)) == 1:
+            return True
+        sizes = self.page.eval_on_selector_all(
+            f"{sel.page_size} > option", "options => options.map(o => o.value)"
+        )
+        sizes = [s for s in sizes if s.isdigit()]
+        if not sizes:
+            return False
+        largest = max(sizes, key=int)
+        if self.page.input_value(sel.page_size) != largest:
+            rows = f"{sel.table} tbody tr"
+            count = self.page.eval_on_selector_all(rows, "rows => rows.length")
+            self.page.select_option(sel.page_size, largest)
+            self.page.wait_for_function(
+                ROWS_CHANGED, arg=[rows, count], timeout=self.timeout * 1000
+            )
+            self._refresh_parser()
+        return int(self.page.inner_text(sel.page_total)) == 1
 
-    def export(self, path=""):
+    def export(self, path="", *, single_pass=True, format=None):
         """
         Scrapes and saves the data from the table of the current leaderboards.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -527,144 +189,70 @@ class SeasonStat(ScrapingUtilities):
         This is unlike other forms of export where a button is clicked.
         Thus, there will be no record of a download when the data is exported.*
 
+        If the scraper was created with ``capture=True``, the rows are decoded
+        from the captured response of the data endpoint instead.
+
+        If the scraper was created with a ``cache``, a cached export of the same
+        filter configuration is copied to ``path`` instead.
+
         :param path: The path to save the exported file to
+        :param single_pass: If ``True``, the data table is set to its largest page size
+            and all rows are read in one pass, if they fit on one page.
+            Otherwise, every page of the data table is clicked through and parsed.
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``.
+            If not specified, the format is inferred from the extension of ``path``.
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        path = tables.resolve_path(path, format)
+        if self._from_cache(path):
+            return path
+        rows = self.iter_rows(single_pass=single_pass)
+        tables.write(next(rows, []), rows, path)
+        self._to_cache(path)
+        return path
+
+    def iter_rows(self, *, single_pass=True):
+        """
+        Yields the rows of the current leaderboard as they are read, so large leaderboards
+        can be consumed in constant memory.
+        The data table is read one page at a time.
+        If the scraper was created with ``capture=True``, the rows are decoded
+        from the captured response of the data endpoint instead.
+
+        :param single_pass: If ``True``, the data table is set to its largest page size
+            and all rows are read in one pass, if they fit on one page.
+        :return: A generator which yields the column headers, then the cells of each row
+        :rtype: generator
         """
         self._close_ad()
-        if not path or os.path.splitext(path)[1] != ".csv":
-            path = "out/{}.csv".format(
-                datetime.datetime.now().strftime("%d.%m.%y %H.%M.%S")
-            )
-        total_pages = int(
-            self.soup.select(
-                ".table-page-control:nth-last-child(1) > .table-control-total"
-            )[0].getText()
-        )
-        with open(path, "w", newline="") as file:
-            writer = csv.writer(file)
-            self._write_table_headers(writer)
-            for _ in range(0, total_pages):
-                self._write_table_rows(writer)
-                self.page.click(
-                    ".table-page-control:nth-last-child(1) > .next"
-                )
-                self._refresh_parser()
+        if self.capture:
+            yield from self._iter_captured()
+        elif single_pass and self._expand_table():
+            yield from self._table_rows(self.page.inner_html(self._sel.table))
+        else:
+            yield from self._page_rows()
 
 
-class Splits(ScrapingUtilities):
+class Splits(SplitsPage, ScrapingUtilities):
     """
     Scraper for the FanGraphs `Splits Leaderboards`_ page.
 
     .. _Splits Leaderboards: https://fangraphs.com/leaders/splits-leaderboards
     """
-    __selections = {}
-    __dropdowns = {}
-    __splits = {}
-    __quick_splits = leaders_sel.Splits.quick_splits
-    __switches = {}
-    __waitfor = leaders_sel.Splits.waitfor
-
-    address = "https://fangraphs.com/leaders/splits-leaderboards"
-
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
-
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
+        self._compile_selectors()
 
-        self.set_filter_group("Show All")
-        self.configure("auto_pt", "False", autoupdate=True)
+        if self.setup:
+            self.set_filter_group("Show All")
+            self.configure("auto_pt", "False", autoupdate=True)
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
-        for cat, sel in leaders_sel.Splits.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
-            )
-        for cat, sel in leaders_sel.Splits.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> ul > li")
-            )
-        for cat, sel in leaders_sel.Splits.splits.items():
-            self.__splits.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> ul > li")
-            )
-        for cat, sel in leaders_sel.Splits.switches.items():
-            self.__switches.setdefault(
-                cat, selectors.Switches(self.soup, sel)
-            )
-
-    @classmethod
-    def list_queries(cls):
-        """
-        Lists the possible filter queries which can be used to modify search results.
-
-        :return: Filter queries which can be used to modify search results
-        :rtype: list
-        """
-        queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
-        queries.extend(list(cls.__splits))
-        queries.extend(list(cls.__switches))
-        return queries
-
-    def list_options(self, query: str):
-        """
-        Lists the possible options which a filter query can be configured to.
-
-        :param query: The filter query
-        :return: Options which the filter query can be configured to
-        :rtype: list
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        elif query in self.__splits:
-            options = self.__splits[query].list_options()
-        elif query in self.__switches:
-            options = ["True", "False"]
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return options
-
-    def current_option(self, query: str):
-        """
-        Retrieves the option(s) which a filter query is currently set to.
-
-        Most dropdown- and split-class filter queries can be configured to multiple options.
-        For those filter classes, a list is returned, while other filter classes return a string.
-
-        - Selection-class: ``str``
-        - Dropdown-class: ``list``
-        - Split-class: ``list``
-        - Switch-class: ``str``
-
-        :param query: The filter query being retrieved of its current option
-        :return: The option(s) which the filter query is currently set to
-        :rtype: str or list
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=2, multiple=True)
-        elif query in self.__splits:
-            option = self.__splits[query].current_option(opt_type=2, multiple=True)
-        elif query in self.__switches:
-            option = self.__switches[query].current_option(opt_type=2)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return option
-
     def configure(self, query: str, option: str, *, autoupdate=False):
         """
         Configures a filter query to a specified option.
@@ -675,24 +263,33 @@ class Splits(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         self._close_ad()
-        query = query.lower()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        elif query in self.__splits:
-            self.__splits[query].configure(self.page, option)
-        elif query in self.__switches:
-            options = [o.lower() for o in self.list_options(query)]
-            if option.lower() not in options:
-                raise fangraphs.exceptions.InvalidFilterOption(option)
-            if option != self.current_option(query)[0].title():
-                self.page.click(self.__switches[query])
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        changed = self._configure(query, option)
         if autoupdate:
             self.update()
-        self._refresh_parser()
+        elif changed:
+            self._refresh_parser()
+
+    def configure_many(self, filters: dict, *, autoupdate=True):
+        """
+        Configures multiple filter queries at once.
+        The filter queries are submitted with a single click of the **Update** button,
+        and the page is re-parsed once.
+
+        :param filters: Mapping of the filter queries to configure to their options
+        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid filter query in ``filters``
+        :raises FanGraphs.exceptions.InvalidFilterOption: Invalid option in ``filters``
+        """
+        self._validate(filters)
+        self._close_ad()
+        changed = [
+            query for query, option in filters.items()
+            if self._configure(query, option)
+        ]
+        if autoupdate:
+            self.update()
+        elif changed:
+            self._refresh_parser()
 
     def update(self):
         """
@@ -705,6 +302,7 @@ class Splits(ScrapingUtilities):
         if elem is None:
             raise fangraphs.exceptions.FilterUpdateIncapability()
         self._close_ad()
+        self._throttle()
         elem.click()
         self._refresh_parser()
 
@@ -715,26 +313,20 @@ class Splits(ScrapingUtilities):
         :return: Names of the groups of filter queries
         :rtype: list
         """
-        elems = self.soup.select(".fgBin.splits-bin-controller div")
-        groups = [e.getText() for e in elems]
-        return groups
+        return self._parse_filter_groups()
 
     def set_filter_group(self, group="Show All"):
         """
         Configures the available filters to a specified group of filters
 
         :param group: The name of the group of filters
+        :raises FanGraphs.exceptions.InvalidFilterGroup: Invalid argument ``group``
         """
-        selector = ".fgBin.splits-bin-controller div"
-        elems = self.soup.select(selector)
-        options = [e.getText() for e in elems]
-        try:
-            index = options.index(group)
-        except ValueError as err:
-            raise fangraphs.exceptions.InvalidFilterGroup(group) from err
+        index = self._filter_group_index(group)
         self._close_ad()
-        elem = self.page.query_selector_all(selector)[index]
+        elem = self.page.query_selector_all(".fgBin.splits-bin-controller div")[index]
         elem.click()
+        self._mark_stale()
 
     def reset_filters(self):
         """
@@ -756,17 +348,8 @@ class Splits(ScrapingUtilities):
             return
         self._close_ad()
         elem.click()
-
-    @classmethod
-    def list_quick_splits(cls):
-        """
-        Lists all the quick splits which can be used.
-        Quick splits allow for the configuration of multiple filter queries at once.
-
-        :return: All available quick splits
-        :rtype: list
-        """
-        return list(cls.__quick_splits)
+        self._mark_stale()
+        self._forget_reset_filters()
 
     def set_to_quick_split(self, quick_split: str, autoupdate=True):
         """
@@ -778,125 +361,109 @@ class Splits(ScrapingUtilities):
         :param autoupdate: If ``True``, :py:meth:`reset_filters` will be called
         :raises FanGraphs.exceptions.InvalidQuickSplits: Invalid argument ``quick_split``
         """
-        quick_split = quick_split.lower()
-        try:
-            selector = self.__quick_splits[quick_split]
-        except ValueError as err:
-            raise fangraphs.exceptions.InvalidQuickSplit(quick_split) from err
+        quick_split, selector = self._quick_split(quick_split)
         self._close_ad()
+        self._throttle()
         self.page.click(selector)
+        self._forget_reset_filters()
+        self._mark_stale()
+        self._record("quick_split", quick_split)
         if autoupdate:
             self.update()
 
-    def export(self, path=""):
+    def export_quick_splits(self, quick_splits=None, directory="out", *, format=None):
         """
-        Uses the **Export Data** button on the webpage to export the current leaderboard.
-        The data will be exported as a CSV file and the file will be saved to *out/*.
-        The file will be saved to the filepath ``path``, if specified.
-        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
+        Exports the leaderboard of each quick split in one session.
+        Every quick split is validated before the first one is invoked.
+        Quick splits do not require the setup of :py:meth:`__enter__`,
+        so the scraper can be created with ``setup=False``.
 
-        :param path: The path to save the exported data to
+        :param quick_splits: The quick splits to export.
+            If not specified, every quick split is exported.
+        :param directory: The directory to export the leaderboards to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``
+        :return: The quick split and the path of the export, for each quick split,
+            in the order of ``quick_splits``
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidQuickSplit: Invalid quick split in ``quick_splits``
         """
-        self.export_data(".data-export", path)
+        exports = []
+        for quick_split in self._check_quick_splits(quick_splits):
+            self.set_to_quick_split(quick_split)
+            path = export_path(quick_split, directory, format)
+            self.export(path)
+            exports.append((quick_split, path))
+        return exports
 
+    def _set_options(self, query: str, options):
+        """
+        Configures a filter query to exactly the option(s) ``options``.
+        For filter queries which hold multiple options, only the options which differ from
+        the options the filter query is currently set to are toggled.
+        The options which the page holds, e.g. the default season of ``time_filter``
+        or the options of a quick split, are read from the page the first time.
 
-class WAR(ScrapingUtilities):
+        :param query: The filter query
+        :param options: The option, or options, to set the filter query to
+        :return: ``True`` if any option was changed
+        :rtype: bool
+        """
+        query = query.lower()
+        if not self._multiple(query):
+            return self._configure(query, options)
+        if query not in self.filters:
+            self.filters[query] = sorted(
+                str(o).lower() for o in self.current_option(query)
+            )
+        toggled = toggled_options(self.filters[query], options)
+        for option in toggled:
+            self._configure(query, option)
+        return bool(toggled)
+
+    def export_grid(self, grid: dict, directory="out", *, format=None):
+        """
+        Exports the leaderboard of every combination of the options of several filter queries.
+
+        The combinations are ordered so that consecutive combinations differ in exactly one filter query
+        (see :py:func:`fangraphs.leaders.gray_product`).
+        For each combination, only the options which changed are toggled,
+        and the filter queries are submitted with a single click of the **Update** button,
+        which is skipped if no option changed.
+        The option of a split-class filter query may be a list of options, which are all selected at once.
+
+        :param grid: Mapping of filter queries to the options to combine
+        :param directory: The directory to export the leaderboards to
+        :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``
+        :return: The combination of options and the path of the export, for each combination,
+            in export order
+        :rtype: list
+        """
+        exports = []
+        for combination in gray_product(grid):
+            self._close_ad()
+            changed = [
+                query for query, options in combination.items()
+                if self._set_options(query, options)
+            ]
+            if changed:
+                self.update()
+            path = export_path(combination_name(combination), directory, format)
+            self.export(path)
+            exports.append((combination, path))
+        return exports
+
+
+class WAR(WARPage, ScrapingUtilities):
     """
     Scraper for the FanGraphs `Combined WAR Leaderboards`_ page.
 
     .. _Combined WAR Leaderboards: https://www.fangraphs.com/warleaders.aspx
     """
-    __dropdowns = {}
-    __waitfor = leaders_sel.WAR.waitfor
-
-    address = "https://fangraphs.com/warleaders.aspx"
-
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
-
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
+        self._compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
-
-    def __compile_selectors(self):
-        for cat, sel in leaders_sel.WAR.dropdowns.items():
-            options = leaders_sel.WAR.dropdown_options[cat]
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > ul > li", options)
-            )
-
-    @classmethod
-    def list_queries(cls):
-        """
-        Lists the possible filter queries which can be used to modify search results.
-
-        :return: Filter queries which can be used to modify search results
-        :rtype: list
-        """
-        queries = []
-        queries.extend(list(cls.__dropdowns))
-        return queries
-
-    def list_options(self, query: str):
-        """
-        Lists the possible options which a filter query can be configured to.
-
-        :param query: The filter query
-        :return: Options which the filter query can be configured to
-        :rtype: list
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return options
-
-    def current_option(self, query: str):
-        """
-        Retrieves the option which a filter query is currently set to.
-
-        :param query: The filter query being retrieved of its current option
-        :return: The option which the filter query is currently set to
-        :rtype: str
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        if query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=1)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        return option
-
-    def configure(self, query: str, option: str):
-        """
-        Configures a filter query to a specified option.
-
-        :param query: The filter query to be configured
-        :param option: The option to set the filter query to
-        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
-        """
-        query = query.lower()
-        self._close_ad()
-        if query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
-        self._refresh_parser()
-
-    def export(self, path=""):
-        """
-        Uses the **Export Data** button on the webpage to export the current leaderboard.
-        The data will be exported as a CSV file and the file will be saved to *out/*.
-        The file will be saved to the filepath ``path``, if specified.
-        Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
-
-        :param path: The path to save the exported data to
-        """
-        self.export_data("#WARBoard1_cmdCSV", path)
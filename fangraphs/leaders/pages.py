@@ -0,0 +1,428 @@
+#! python3
+# FanGraphs/leaders/pages.py
+
+"""
+The page-independent parts of the scrapers for the webpages under the FanGraphs **Leaders** tab:
+the filter queries of each page, their CSS selectors and how their options are parsed.
+
+Each class is shared by the class of the same name (without the ``Page`` suffix)
+in :py:mod:`fangraphs.leaders.leaders` and :py:mod:`fangraphs.leaders.async_leaders`,
+which only add the page-driving methods.
+"""
+
+import bs4
+
+import fangraphs.exceptions
+from fangraphs import selectors
+from fangraphs.leaders import FilterUtilities
+from fangraphs.selectors import leaders_params, leaders_sel
+
+
+class GameSpanPage(FilterUtilities):
+    """
+    The filter queries of the FanGraphs `60-Game Span Leaderboards`_ page.
+
+    .. _60-Game Span Leaderboards: https://www.fangraphs.com/leaders/special/60-game-span
+    """
+    _sel = leaders_sel.GameSpan
+
+    _coupled = {
+        "single_season": ("season1", "season2"),
+        "season1": ("single_season",),
+        "season2": ("single_season",)
+    }
+
+    _params = leaders_params.GameSpan
+
+    address = "https://fangraphs.com/leaders/special/60-game-span"
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments passed to :py:class:`fangraphs.leaders.ScrapingUtilities`
+            or :py:class:`fangraphs.leaders.AsyncScrapingUtilities`
+        """
+        super().__init__(
+            self.address, waitfor=self._sel.waitfor, api=self._sel.api, **kwargs
+        )
+        self._selectors = {}
+
+    def _compile_selectors(self):
+        for cat, sel in self._sel.selections.items():
+            self._selectors[cat] = selectors.Selections(self, sel)
+        for cat, sel in self._sel.dropdowns.items():
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> div > a")
+
+    def _parse_option(self, query: str):
+        elem = self._filter(query)
+        if isinstance(elem, selectors.Dropdowns):
+            return elem.current_option(opt_type=3)
+        return elem.current_option()
+
+
+class InternationalPage(FilterUtilities):
+    """
+    The filter queries of the FanGraphs `KBO Leaderboards`_ page.
+
+    .. _KBO Leaderboards: https://www.fangraphs.com/leaders/international
+    """
+    _sel = leaders_sel.International
+
+    _coupled = {
+        "single_season": ("season1", "season2"),
+        "season1": ("single_season",),
+        "season2": ("single_season",)
+    }
+
+    _params = leaders_params.International
+
+    address = "https://www.fangraphs.com/leaders/international"
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments passed to :py:class:`fangraphs.leaders.ScrapingUtilities`
+            or :py:class:`fangraphs.leaders.AsyncScrapingUtilities`
+        """
+        super().__init__(
+            self.address, waitfor=self._sel.waitfor, api=self._sel.api, **kwargs
+        )
+        self._selectors = {}
+
+    def _query_params(self, filters):
+        filters = {k.lower(): v for k, v in filters.items()}
+        split_seasons = str(filters.get("split_seasons", "false")).lower()
+        if split_seasons not in ("true", "false"):
+            raise fangraphs.exceptions.InvalidFilterOption(split_seasons)
+        params = super()._query_params(filters)
+        if split_seasons == "true":
+            params["team"] = "0,to"
+        return params
+
+    def _compile_selectors(self):
+        for cat, sel in self._sel.selections.items():
+            self._selectors[cat] = selectors.Selections(self, sel)
+        for cat, sel in self._sel.dropdowns.items():
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> div > a")
+        for cat, sel in self._sel.switches.items():
+            self._selectors[cat] = selectors.Switches(self, sel)
+
+    def _parse_option(self, query: str):
+        elem = self._filter(query)
+        if isinstance(elem, selectors.Switches):
+            return "True" if ",to" in self.page.url else "False"
+        if isinstance(elem, selectors.Dropdowns):
+            return elem.current_option(opt_type=3)
+        return elem.current_option()
+
+
+class MajorLeaguePage(FilterUtilities):
+    """
+    The filter queries of the FanGraphs `Major League Leaderboards`_ page.
+
+    Note that the Splits Leaderboard is not covered.
+    Instead, it is covered by :py:class:`SplitsPage`.
+
+    .. _Major League Leaderboards: https://fangraphs.com/leaders.aspx
+    """
+    _sel = leaders_sel.MajorLeague
+
+    _coupled = {
+        "single_season": ("season1", "season2"),
+        "season1": ("single_season",),
+        "season2": ("single_season",)
+    }
+
+    _export_button = "#LeaderBoard1_cmdCSV"
+
+    _throttle_filters = True
+
+    address = "https://fangraphs.com/leaders.aspx"
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments passed to :py:class:`fangraphs.leaders.ScrapingUtilities`
+            or :py:class:`fangraphs.leaders.AsyncScrapingUtilities`
+        """
+        super().__init__(self.address, waitfor="", **kwargs)
+        self._selectors = {}
+
+    def _compile_selectors(self):
+        for cat, sel in self._sel.selections.items():
+            self._selectors[cat] = selectors.Selections(self, sel, "> div > ul > li")
+        for cat, sel in self._sel.dropdowns.items():
+            options = self._sel.dropdown_options[cat]
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> div > ul > li", options)
+        for cat, sel in self._sel.switches.items():
+            self._selectors[cat] = selectors.Switches(self, sel)
+
+    def _parse_option(self, query: str):
+        elem = self._filter(query)
+        if isinstance(elem, (selectors.Dropdowns, selectors.Switches)):
+            return elem.current_option(opt_type=1)
+        return elem.current_option()
+
+    @classmethod
+    def _buttons(cls, queries):
+        """
+        :param queries: The configured filter queries
+        :return: The buttons attached to the filter queries, each listed once
+        :rtype: list
+        """
+        queries = [q.lower() for q in queries]
+        return list(dict.fromkeys(
+            cls._sel.buttons[q] for q in queries if q in cls._sel.buttons
+        ))
+
+
+class SeasonStatPage(FilterUtilities):
+    """
+    The filter queries of the FanGraphs `Season Stat Grid`_ page.
+
+    .. _Season Stat Grid: https://fangraphs.com/leaders/season-stat-grid
+    """
+    _sel = leaders_sel.SeasonStat
+
+    _coupled = {
+        group: tuple(
+            g for g in leaders_sel.SeasonStat.dropdowns
+            if g not in (group, "start_season", "end_season")
+        )
+        for group in leaders_sel.SeasonStat.dropdowns
+        if group not in ("start_season", "end_season")
+    }
+
+    _params = leaders_params.SeasonStat
+
+    address = "https://fangraphs.com/leaders/season-stat-grid"
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments passed to :py:class:`fangraphs.leaders.ScrapingUtilities`
+            or :py:class:`fangraphs.leaders.AsyncScrapingUtilities`
+        """
+        super().__init__(
+            self.address, waitfor=self._sel.waitfor, api=self._sel.api, **kwargs
+        )
+        self._selectors = {}
+
+    def _compile_selectors(self):
+        for cat, sel in self._sel.selections.items():
+            self._selectors[cat] = selectors.Selections(self, sel)
+        for cat, sel in self._sel.dropdowns.items():
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> ul > li")
+
+    def _parse_option(self, query: str):
+        elem = self._filter(query)
+        if isinstance(elem, selectors.Dropdowns):
+            return elem.current_option(opt_type=2)
+        return elem.current_option()
+
+    def _parse_page_total(self):
+        """
+        :return: The number of pages of the data table shown in :py:attr:`soup`
+        :rtype: int
+        """
+        return int(self.soup.select(self._sel.page_total)[0].getText())
+
+    def _parse_headers(self):
+        """
+        :return: The column headers of the data table shown in :py:attr:`soup`
+        :rtype: list
+        """
+        return [e.getText() for e in self.soup.select(f"{self._sel.table} thead tr th")]
+
+    def _parse_rows(self):
+        """
+        :return: The cells of each row of the page of the data table shown in :py:attr:`soup`
+        :rtype: list
+        """
+        return [
+            [e.getText() for e in row.select("td")]
+            for row in self.soup.select(f"{self._sel.table} tbody tr")
+        ]
+
+    @staticmethod
+    def _table_rows(html):
+        """
+        Parses the data table alone, rather than the entire page.
+
+        :param html: The inner HTML of the data table
+        :return: A generator which yields the column headers, then the cells of each row
+        :rtype: generator
+        """
+        table = bs4.BeautifulSoup(html, features="lxml")
+        yield [e.getText() for e in table.select("thead tr th")]
+        for row in table.select("tbody tr"):
+            yield [e.getText() for e in row.select("td")]
+
+
+class SplitsPage(FilterUtilities):
+    """
+    The filter queries of the FanGraphs `Splits Leaderboards`_ page.
+
+    .. _Splits Leaderboards: https://fangraphs.com/leaders/splits-leaderboards
+    """
+    _sel = leaders_sel.Splits
+
+    __kept_on_reset = (
+        "group", "stat", "type", "groupby", "preset_range", "auto_pt", "split_teams"
+    )
+
+    _coupled = {
+        "time_filter": ("preset_range",),
+        "preset_range": ("time_filter",)
+    }
+
+    address = "https://fangraphs.com/leaders/splits-leaderboards"
+
+    def __init__(self, *, setup=True, **kwargs):
+        """
+        :param setup: If ``True``, the filter group is set to **Show All** and ``auto_pt`` is switched off
+            when the scraper is entered. Not required to invoke quick splits.
+        :param kwargs: Keyword arguments passed to :py:class:`fangraphs.leaders.ScrapingUtilities`
+            or :py:class:`fangraphs.leaders.AsyncScrapingUtilities`
+        """
+        super().__init__(
+            self.address, waitfor=self._sel.waitfor, api=self._sel.api, **kwargs
+        )
+        self.setup = setup
+        self._selectors = {}
+
+    def _compile_selectors(self):
+        for cat, sel in self._sel.selections.items():
+            self._selectors[cat] = selectors.Selections(self, sel)
+        for cat, sel in self._sel.dropdowns.items():
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> ul > li")
+        for cat, sel in self._sel.splits.items():
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> ul > li")
+        for cat, sel in self._sel.switches.items():
+            self._selectors[cat] = selectors.Switches(self, sel)
+
+    def _multiple(self, query):
+        """
+        Split-class filter queries and ``time_filter`` can be configured to multiple options.
+
+        :rtype: bool
+        """
+        return query in self._sel.splits or query == "time_filter"
+
+    def _parse_option(self, query: str):
+        """
+        Retrieves the option(s) which a filter query is set to in :py:attr:`soup`.
+
+        Split-class filter queries and ``time_filter`` can be configured to multiple options.
+        For those filter queries, a list is returned, while other filter queries return a string.
+
+        - Selection-class: ``str``
+        - Dropdown-class: ``list`` for ``time_filter``, otherwise ``str``
+        - Split-class: ``list``
+        - Switch-class: ``str``
+
+        :param query: The filter query being retrieved of its current option
+        :return: The option(s) which the filter query is currently set to
+        :rtype: str or list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        elem = self._filter(query)
+        if isinstance(elem, selectors.Dropdowns):
+            return elem.current_option(opt_type=2, multiple=self._multiple(query))
+        if isinstance(elem, selectors.Switches):
+            return elem.current_option(opt_type=2)
+        return elem.current_option()
+
+    def _parse_filter_groups(self):
+        """
+        :return: Names of the groups of filter queries shown in :py:attr:`soup`
+        :rtype: list
+        """
+        elems = self.soup.select(".fgBin.splits-bin-controller div")
+        return [e.getText() for e in elems]
+
+    def _filter_group_index(self, group):
+        """
+        :return: The index of the group of filter queries ``group``
+        :rtype: int
+        :raises FanGraphs.exceptions.InvalidFilterGroup: Invalid argument ``group``
+        """
+        try:
+            return self._parse_filter_groups().index(group)
+        except ValueError as err:
+            raise fangraphs.exceptions.InvalidFilterGroup(group) from err
+
+    def _forget_reset_filters(self):
+        """
+        Removes the filter queries affected by ``reset_filters``
+        from :py:attr:`filters` and :py:attr:`state`.
+        """
+        for query in list(self.filters):
+            if query not in self.__kept_on_reset:
+                del self.filters[query]
+        for query in list(self.state):
+            if query not in self.__kept_on_reset:
+                del self.state[query]
+
+    @classmethod
+    def list_quick_splits(cls):
+        """
+        Lists all the quick splits which can be used.
+        Quick splits allow for the configuration of multiple filter queries at once.
+
+        :return: All available quick splits
+        :rtype: list
+        """
+        return list(cls._sel.quick_splits)
+
+    @classmethod
+    def _quick_split(cls, quick_split):
+        """
+        :return: The lower-cased quick split and the CSS selector of its button
+        :rtype: tuple
+        :raises FanGraphs.exceptions.InvalidQuickSplit: Invalid argument ``quick_split``
+        """
+        quick_split = quick_split.lower()
+        try:
+            return quick_split, cls._sel.quick_splits[quick_split]
+        except KeyError as err:
+            raise fangraphs.exceptions.InvalidQuickSplit(quick_split) from err
+
+    @classmethod
+    def _check_quick_splits(cls, quick_splits):
+        """
+        :param quick_splits: The quick splits, or ``None`` for every quick split
+        :return: The quick splits, lower-cased
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidQuickSplit: Invalid quick split in ``quick_splits``
+        """
+        if quick_splits is None:
+            return cls.list_quick_splits()
+        return [cls._quick_split(q)[0] for q in quick_splits]
+
+
+class WARPage(FilterUtilities):
+    """
+    The filter queries of the FanGraphs `Combined WAR Leaderboards`_ page.
+
+    .. _Combined WAR Leaderboards: https://www.fangraphs.com/warleaders.aspx
+    """
+    _sel = leaders_sel.WAR
+
+    _export_button = "#WARBoard1_cmdCSV"
+
+    _throttle_filters = True
+
+    address = "https://fangraphs.com/warleaders.aspx"
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments passed to :py:class:`fangraphs.leaders.ScrapingUtilities`
+            or :py:class:`fangraphs.leaders.AsyncScrapingUtilities`
+        """
+        super().__init__(self.address, waitfor=self._sel.waitfor, **kwargs)
+        self._selectors = {}
+
+    def _compile_selectors(self):
+        for cat, sel in self._sel.dropdowns.items():
+            options = self._sel.dropdown_options[cat]
+            self._selectors[cat] = selectors.Dropdowns(self, sel, "> div > ul > li", options)
+
+    def _parse_option(self, query: str):
+        return self._filter(query).current_option(opt_type=1)
@@ -0,0 +1,236 @@
+#! python3
+# FanGraphs/leaders/pool.py
+
+"""
+Process-wide pool of ``Playwright`` browsers shared by the scraper classes.
+
+Launching Chromium is by far the most expensive part of entering a scraper.
+Instead of launching a browser per scraper, :py:class:`ScrapingUtilities` borrows an
+isolated browser context and page from a :py:class:`BrowserPool` and returns it on exit.
+
+*Note: Synchronous* ``Playwright`` *objects are bound to the thread which started them.
+A pool should only be used from the thread which first acquired a page from it.*
+"""
+
+import atexit
+import os
+import time
+
+from playwright.sync_api import sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+
+import fangraphs.exceptions
+
+
+class _PooledBrowser:
+    """
+    Bookkeeping for a single browser launched by :py:class:`BrowserPool`.
+    """
+    def __init__(self, browser):
+        self.browser = browser
+        self.leases = 0
+        self.last_used = time.monotonic()
+
+    def healthy(self):
+        """
+        :return: ``True`` if the browser process is still connected
+        :rtype: bool
+        """
+        try:
+            return self.browser.is_connected()
+        except PlaywrightError:
+            return False
+
+    def close(self):
+        try:
+            self.browser.close()
+        except PlaywrightError:
+            pass
+
+
+class BrowserPool:
+    """
+    Launches and shares ``Playwright`` Chromium browsers between scrapers.
+
+    Each call to :py:meth:`acquire` opens a new browser context (cookies, storage and
+    downloads are isolated) with a single page in an already-running browser.
+    A new browser is only launched when every running browser already holds
+    ``max_pages`` pages.
+    Browsers which have no borrowed pages for longer than ``idle_timeout`` seconds are closed,
+    and browsers which have crashed or disconnected are discarded.
+    """
+    def __init__(self, *, max_browsers=1, max_pages=8, idle_timeout=300.0,
+                 downloads_path="out"):
+        """
+        :param max_browsers: The maximum number of Chromium processes to launch
+        :param max_pages: The maximum number of pages borrowed from a single browser at once
+        :param idle_timeout: Seconds after which a browser without borrowed pages is closed
+        :param downloads_path: The directory which browser downloads are saved to
+        """
+        if max_browsers < 1 or max_pages < 1:
+            raise ValueError("max_browsers and max_pages must be at least 1")
+        self.max_browsers = max_browsers
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self.downloads_path = os.path.abspath(downloads_path)
+
+        self.__play = None
+        self.__browsers = []
+        self.__leases = {}
+
+        self.launches = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.__browsers)
+
+    @property
+    def leased(self):
+        """
+        The number of pages which are currently borrowed from the pool.
+
+        :rtype: int
+        """
+        return len(self.__leases)
+
+    def _launch(self):
+        """
+        Launches a new Chromium browser, starting ``Playwright`` if necessary.
+
+        :rtype: _PooledBrowser
+        """
+        if self.__play is None:
+            self.__play = sync_playwright().start()
+        os.makedirs(self.downloads_path, exist_ok=True)
+        browser = self.__play.chromium.launch(
+            downloads_path=self.downloads_path
+        )
+        self.launches += 1
+        entry = _PooledBrowser(browser)
+        self.__browsers.append(entry)
+        return entry
+
+    def _select_browser(self):
+        """
+        Picks the healthy browser with the fewest borrowed pages,
+        launching a new browser if all running browsers are at capacity.
+
+        :rtype: _PooledBrowser
+        :raises FanGraphs.exceptions.BrowserPoolExhausted: Every browser slot is borrowed
+        """
+        available = [
+            b for b in self.__browsers
+            if b.leases < self.max_pages and b.healthy()
+        ]
+        if available:
+            return min(available, key=lambda b: b.leases)
+        if len(self.__browsers) < self.max_browsers:
+            return self._launch()
+        raise fangraphs.exceptions.BrowserPoolExhausted(
+            self.max_browsers * self.max_pages
+        )
+
+    def acquire(self, **context_options):
+        """
+        Borrows a page in a new, isolated browser context.
+
+        :param context_options: Keyword arguments passed to ``Browser.new_context``
+        :return: The borrowed page
+        :rtype: playwright.sync_api._generated.Page
+        :raises FanGraphs.exceptions.BrowserPoolExhausted: Every browser slot is borrowed
+        """
+        self.evict()
+        entry = self._select_browser()
+        context_options.setdefault("accept_downloads", True)
+        context = entry.browser.new_context(**context_options)
+        page = context.new_page()
+        entry.leases += 1
+        entry.last_used = time.monotonic()
+        self.__leases[page] = (entry, context)
+        return page
+
+    def release(self, page):
+        """
+        Returns a borrowed page to the pool.
+        The browser context of the page is closed; the browser is kept running.
+
+        :param page: A page returned by :py:meth:`acquire`
+        """
+        lease = self.__leases.pop(page, None)
+        if lease is None:
+            return
+        entry, context = lease
+        try:
+            context.close()
+        except PlaywrightError:
+            pass
+        entry.leases -= 1
+        entry.last_used = time.monotonic()
+        self.evict()
+
+    def evict(self):
+        """
+        Closes idle browsers and discards browsers which fail the health check.
+        ``Playwright`` is stopped once no browsers remain.
+        """
+        now = time.monotonic()
+        for entry in list(self.__browsers):
+            if not entry.healthy():
+                self.__browsers.remove(entry)
+                for page, (owner, _) in list(self.__leases.items()):
+                    if owner is entry:
+                        del self.__leases[page]
+            elif not entry.leases and now - entry.last_used >= self.idle_timeout:
+                self.__browsers.remove(entry)
+                entry.close()
+        if not self.__browsers and self.__play is not None:
+            self.__play.stop()
+            self.__play = None
+
+    def close(self):
+        """
+        Closes every browser and terminates ``Playwright``.
+        Pages which are still borrowed are closed along with their browser.
+        """
+        self.__leases.clear()
+        for entry in self.__browsers:
+            entry.close()
+        self.__browsers.clear()
+        if self.__play is not None:
+            self.__play.stop()
+            self.__play = None
+
+
+_default_pool = None
+
+
+def get_pool():
+    """
+    Returns the process-wide :py:class:`BrowserPool` used by scrapers by default.
+    The pool is created on first use and closed when the interpreter exits.
+
+    :rtype: BrowserPool
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = BrowserPool()
+        atexit.register(_default_pool.close)
+    return _default_pool
+
+
+def set_pool(pool):
+    """
+    Replaces the process-wide :py:class:`BrowserPool` used by scrapers by default.
+
+    :param pool: The new default pool
+    :type pool: BrowserPool
+    """
+    global _default_pool
+    if _default_pool is not None and _default_pool is not pool:
+        _default_pool.close()
+    _default_pool = pool
@@ -0,0 +1,133 @@
+#! python3
+# FanGraphs/leaders/processes.py
+
+"""
+Multiprocessing execution mode for large grids of exports.
+
+The jobs of a batch are sharded across worker processes.
+Each worker installs its own :py:class:`fangraphs.leaders.pool.BrowserPool` when it starts,
+so its browser is launched once and kept alive between the jobs it runs.
+The results of every job are gathered into a single JSON manifest.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+
+from fangraphs.leaders import leaders
+from fangraphs.leaders import pool
+
+
+class ShardJob:
+    """
+    A single export of a sharded batch.
+    """
+    def __init__(self, scraper, filters=None, path=""):
+        """
+        :param scraper: A class in :py:mod:`fangraphs.leaders.leaders`, or the name of one
+        :param filters: Mapping of filter queries to the options to configure them to
+        :param path: The path to export the leaderboard to
+        """
+        self.scraper = scraper if isinstance(scraper, str) else scraper.__name__
+        self.filters = dict(filters or {})
+        self.path = path
+
+    def __repr__(self):
+        return f"ShardJob({self.scraper!r}, filters={self.filters!r}, path={self.path!r})"
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Converts a job specification into a :py:class:`ShardJob`.
+        A specification is either a :py:class:`ShardJob`,
+        a ``(scraper, filters, path)`` tuple,
+        or a ``dict`` with the keys ``scraper``, ``filters`` and ``path``.
+
+        :param spec: The job specification
+        :rtype: ShardJob
+        """
+        if isinstance(spec, cls):
+            return spec
+        if isinstance(spec, dict):
+            return cls(spec["scraper"], spec.get("filters"), spec.get("path", ""))
+        return cls(*spec)
+
+
+def _init_worker(max_pages, idle_timeout):
+    """
+    Installs the process-wide browser pool of a worker process.
+    """
+    pool.set_pool(
+        pool.BrowserPool(max_pages=max_pages, idle_timeout=idle_timeout)
+    )
+
+
+def _run_job(item):
+    """
+    Exports a single job in a worker process.
+
+    :param item: The index of the job, the job and the keyword arguments of the scraper
+    :return: The manifest record of the job
+    :rtype: dict
+    """
+    index, job, options = item
+    path = job.path or os.path.join("out", f"{job.scraper}-{index:05d}.csv")
+    record = {
+        "index": index, "scraper": job.scraper, "filters": job.filters,
+        "path": path, "pid": os.getpid(), "error": None
+    }
+    start = time.monotonic()
+    try:
+        scraper = getattr(leaders, job.scraper)
+        with scraper(**options) as leaderboard:
+            for query, option in job.filters.items():
+                leaderboard.configure(query, option)
+            leaderboard.export(path)
+    except Exception as err:
+        record["error"] = f"{type(err).__name__}: {err}"
+    record["elapsed"] = time.monotonic() - start
+    return record
+
+
+def export_sharded(jobs, *, processes=None, manifest="out/manifest.json",
+                   max_pages=1, idle_timeout=600.0, **options):
+    """
+    Exports a batch of jobs across a pool of worker processes.
+
+    A failing job does not stop the batch; its error is recorded in the manifest.
+    Jobs without a path are exported to *out/<ClassName>-<index>.csv*.
+
+    :param jobs: The job specifications, see :py:meth:`ShardJob.from_spec`
+    :param processes: The number of worker processes. Defaults to the number of CPUs.
+    :param manifest: The path to write the JSON manifest to. If empty, no manifest is written.
+    :param max_pages: The number of pages each worker's browser pool may lend out
+    :param idle_timeout: Seconds after which a worker's idle browser is closed
+    :param options: Keyword arguments passed to each scraper, e.g. ``resource_filter``
+    :return: The manifest record of each job, in the order of ``jobs``
+    :rtype: list
+    """
+    jobs = [ShardJob.from_spec(j) for j in jobs]
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (processes * 4))
+    os.makedirs("out", exist_ok=True)
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        processes, initializer=_init_worker, initargs=(max_pages, idle_timeout)
+    ) as workers:
+        records = list(workers.imap_unordered(
+            _run_job, ((i, j, options) for i, j in enumerate(jobs)),
+            chunksize=chunksize
+        ))
+    records.sort(key=lambda r: r["index"])
+
+    if manifest:
+        os.makedirs(os.path.dirname(manifest) or ".", exist_ok=True)
+        with open(manifest, "w") as file:
+            json.dump({
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "processes": processes,
+                "jobs": records
+            }, file, indent=2)
+    return records
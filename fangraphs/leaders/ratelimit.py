@@ -0,0 +1,170 @@
+#! python3
+# FanGraphs/leaders/ratelimit.py
+
+"""
+Token-bucket rate limiting of the requests which the scrapers send to FanGraphs.
+
+Every page load, navigating click and download of a scraper first takes a token from a
+:py:class:`RateLimiter`. The state of the bucket is stored in a file which is locked while
+it is updated, so every process which uses a limiter with the same ``path`` shares one bucket
+and the combined request rate of all the processes stays under ``rate``.
+
+*Note: The file lock requires* ``fcntl`` *(POSIX). Without it, the bucket is only shared
+between the threads of one process.*
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+_default_limiter = None
+
+
+class RateLimiter:
+    """
+    Token bucket which refills at ``rate`` tokens per second, up to ``burst`` tokens.
+    A request which finds the bucket empty reserves the next token and waits until it is due,
+    so concurrent requests are served in the order in which they arrived.
+
+    .. py:attribute:: acquired
+        The number of tokens taken by this process
+        :type: int
+    .. py:attribute:: waited
+        The total seconds which this process waited for tokens
+        :type: float
+    .. py:attribute:: max_wait
+        The longest wait for a single token of this process, in seconds
+        :type: float
+    """
+    def __init__(self, rate=1.0, burst=5, *, path="out/.ratelimit"):
+        """
+        :param rate: The sustained number of requests per second
+        :param burst: The number of requests which can be sent at once after a pause
+        :param path: The file which stores the state of the bucket, shared by every process using it
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate {rate} or burst {burst}")
+        self.rate = rate
+        self.burst = burst
+        self.path = path
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self.acquired = 0
+        self.waited = 0.0
+        self.max_wait = 0.0
+        self.__lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_RateLimiter__lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def _reserve(self, tokens=1):
+        """
+        Takes ``tokens`` tokens from the shared bucket, borrowing against future refills if it is empty.
+
+        :return: The seconds to wait before the tokens are due
+        :rtype: float
+        """
+        with self.__lock, open(self.path, "a+", encoding="utf-8") as file:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                try:
+                    state = json.loads(file.read())
+                except ValueError:
+                    state = {}
+                now = time.time()
+                available = state.get("tokens", float(self.burst))
+                updated = state.get("updated", now)
+                available = min(self.burst, available + max(0.0, now - updated) * self.rate)
+                available -= tokens
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps({"tokens": available, "updated": now}))
+                file.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+        return max(0.0, -available / self.rate)
+
+    def _record(self, wait):
+        self.acquired += 1
+        self.waited += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def acquire(self, tokens=1):
+        """
+        Waits until ``tokens`` tokens are available and takes them.
+
+        :param tokens: The number of tokens to take
+        :return: The seconds waited
+        :rtype: float
+        """
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        self._record(wait)
+        return wait
+
+    async def acquire_async(self, tokens=1):
+        """
+        Coroutine of :py:meth:`acquire`, which waits without blocking the event loop.
+        The locked state file is updated in the default executor of the event loop.
+
+        :param tokens: The number of tokens to take
+        :return: The seconds waited
+        :rtype: float
+        """
+        loop = asyncio.get_running_loop()
+        wait = await loop.run_in_executor(None, self._reserve, tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        self._record(wait)
+        return wait
+
+    def stats(self):
+        """
+        :return: The tokens taken and the total, mean and longest waits of this process
+        :rtype: dict
+        """
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "mean_wait": self.waited / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+def get_limiter():
+    """
+    Returns the process-wide :py:class:`RateLimiter` used by scrapers created without a ``limiter``.
+
+    :return: The default limiter, or ``None`` if requests are not rate limited
+    :rtype: RateLimiter or None
+    """
+    return _default_limiter
+
+
+def set_limiter(limiter):
+    """
+    Replaces the process-wide :py:class:`RateLimiter` used by scrapers created without a ``limiter``.
+
+    :param limiter: The new default limiter, or ``None`` to stop rate limiting
+    :type limiter: RateLimiter or None
+    """
+    global _default_limiter
+    _default_limiter = limiter
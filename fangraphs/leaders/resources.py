@@ -0,0 +1,113 @@
+#! python3
+# FanGraphs/leaders/resources.py
+
+"""
+Network request filtering for the scraper pages.
+
+The FanGraphs pages download ad scripts, trackers, images and fonts,
+none of which are needed to configure or export a leaderboard.
+A :py:class:`ResourceFilter` is installed as a ``Playwright`` route on the scraper page
+and aborts every request which it does not allow.
+"""
+
+from urllib.parse import urlparse
+
+
+#: Resource types which are not needed to scrape a page
+BLOCKED_TYPES = ("image", "media", "font")
+
+#: Ad, tracker and analytics hosts requested by the FanGraphs pages
+BLOCKED_HOSTS = (
+    "ezoic.net", "ezoic.com", "ezodn.com", "ezojs.com", "ezoiccdn.com", "ezmob.com",
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+    "google-analytics.com", "googletagmanager.com", "googletagservices.com",
+    "adsafeprotected.com", "amazon-adsystem.com", "adnxs.com", "moatads.com",
+    "pubmatic.com", "rubiconproject.com", "casalemedia.com", "criteo.com",
+    "scorecardresearch.com", "quantserve.com", "facebook.net", "twitter.com",
+)
+
+
+def _host_matches(host, domains):
+    return any(host == d or host.endswith(f".{d}") for d in domains)
+
+
+class ResourceFilter:
+    """
+    Decides which network requests of a page are allowed.
+
+    A request is aborted if its resource type is in ``block_types``,
+    or if its host is (a subdomain of) a host in ``deny``.
+    Hosts in ``allow`` are never aborted, regardless of the resource type.
+
+    .. py:attribute:: blocked
+        The number of requests which have been aborted
+        :type: int
+    .. py:attribute:: allowed
+        The number of requests which have been allowed
+        :type: int
+    """
+    def __init__(self, *, block_types=BLOCKED_TYPES, deny=BLOCKED_HOSTS, allow=()):
+        """
+        :param block_types: ``Playwright`` resource types to abort, e.g. ``"image"`` or ``"stylesheet"``
+        :param deny: Hosts whose requests are aborted
+        :param allow: Hosts whose requests are never aborted
+        """
+        self.block_types = frozenset(block_types)
+        self.deny = tuple(deny)
+        self.allow = tuple(allow)
+        self.blocked = 0
+        self.allowed = 0
+
+    @property
+    def blocks_ads(self):
+        """
+        ``True`` if the ad hosts are blocked, in which case no ad needs to be closed.
+
+        :rtype: bool
+        """
+        return any(h in self.deny for h in ("ezoic.net", "ezmob.com"))
+
+    def allows(self, url: str, resource_type: str):
+        """
+        :param url: The URL of the request
+        :param resource_type: The ``Playwright`` resource type of the request
+        :return: ``True`` if the request should be sent
+        :rtype: bool
+        """
+        host = (urlparse(url).hostname or "").lower()
+        if _host_matches(host, self.allow):
+            return True
+        if resource_type in self.block_types:
+            return False
+        return not _host_matches(host, self.deny)
+
+    def _allows_route(self, route):
+        request = route.request
+        allowed = self.allows(request.url, request.resource_type)
+        if allowed:
+            self.allowed += 1
+        else:
+            self.blocked += 1
+        return allowed
+
+    def handle(self, route):
+        """
+        Route handler for synchronous ``Playwright`` pages.
+
+        :param route: The intercepted route
+        """
+        if self._allows_route(route):
+            route.continue_()
+        else:
+            route.abort()
+
+    async def handle_async(self, route):
+        """
+        Route handler for asynchronous ``Playwright`` pages.
+
+        :param route: The intercepted route
+        """
+        if self._allows_route(route):
+            await route.continue_()
+        else:
+            await route.abort()
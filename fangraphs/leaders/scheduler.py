@@ -0,0 +1,270 @@
+#! python3
+# FanGraphs/leaders/scheduler.py
+
+"""
+Scheduled exports of many filter configurations of a single **Leaders** page,
+which retry failed jobs and adapt the number of concurrent pages to the load on FanGraphs.
+
+Every job has a deadline, which bounds all of its attempts together.
+A failed attempt is retried after a jittered, exponentially growing delay (:py:class:`RetryPolicy`),
+unless the failure is permanent, e.g. an invalid filter option.
+The number of jobs attempted at once is adjusted after every window of attempts by an
+additive-increase/multiplicative-decrease controller (:py:class:`AdaptiveConcurrency`):
+it grows by one page while the attempts succeed at a steady latency,
+and is cut when attempts fail or slow down.
+"""
+
+import asyncio
+import collections
+import os
+import random
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+import fangraphs.exceptions
+from fangraphs.leaders import batch, catalog
+
+
+#: Exceptions which fail a job without retrying it, since they are raised again by every attempt
+PERMANENT = (
+    fangraphs.exceptions.InvalidFilterGroup,
+    fangraphs.exceptions.InvalidFilterQuery,
+    fangraphs.exceptions.InvalidFilterOption,
+    fangraphs.exceptions.InvalidQuickSplit,
+)
+
+
+class RetryPolicy:
+    """
+    Bounded retries of failed attempts with exponential backoff and full jitter.
+    The delay before retry ``n`` is drawn uniformly between ``0`` and ``min(cap, base * 2 ** (n - 1))``,
+    so jobs which failed together do not retry together.
+    """
+    def __init__(self, retries=3, *, base=1.0, cap=30.0, permanent=PERMANENT):
+        """
+        :param retries: The maximum number of retries of each job after its first attempt
+        :param base: The upper bound of the delay before the first retry, in seconds
+        :param cap: The upper bound of the delay before any retry, in seconds
+        :param permanent: The exception types which are not retried
+        """
+        if retries < 0 or base < 0 or cap < 0:
+            raise ValueError(f"Invalid retries {retries}, base {base} or cap {cap}")
+        self.retries = retries
+        self.base = base
+        self.cap = cap
+        self.permanent = tuple(permanent)
+
+    def should_retry(self, attempts, error):
+        """
+        :param attempts: The number of attempts of the job so far
+        :param error: The exception raised by the last attempt
+        :return: ``True`` if the job should be attempted again
+        :rtype: bool
+        """
+        return attempts <= self.retries and not isinstance(error, self.permanent)
+
+    def delay(self, attempts):
+        """
+        :param attempts: The number of attempts of the job so far
+        :return: The seconds to wait before the next attempt
+        :rtype: float
+        """
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempts - 1)))
+
+
+class AdaptiveConcurrency:
+    """
+    Additive-increase/multiplicative-decrease controller of the number of jobs attempted at once.
+
+    The outcomes of the attempts are collected in windows of ``window`` attempts.
+    After each window, the limit is multiplied by ``decrease`` if the error rate of the window is above
+    ``max_error_rate`` or its median latency is above the latency target; otherwise it grows by one.
+    Without a ``target_latency``, the target is ``tolerance`` times the lowest median latency observed,
+    so the limit stops growing once more pages only make each page slower.
+
+    .. py:attribute:: limit
+        The current maximum number of jobs attempted at once
+        :type: int
+    .. py:attribute:: history
+        The limit after each adjustment, starting with the initial limit
+        :type: list
+    """
+    def __init__(self, initial=2, *, minimum=1, maximum=8, window=8, target_latency=None,
+                 tolerance=2.0, max_error_rate=0.1, decrease=0.5):
+        """
+        :param initial: The limit before the first adjustment
+        :param minimum: The lowest limit
+        :param maximum: The highest limit
+        :param window: The number of attempts between adjustments
+        :param target_latency: The highest median latency of a window, in seconds, at which the limit grows.
+            If not specified, the target is relative to the lowest median latency observed.
+        :param tolerance: The factor of the lowest median latency which is the latency target
+            if ``target_latency`` is not specified
+        :param max_error_rate: The highest fraction of failed attempts of a window at which the limit grows
+        :param decrease: The factor which the limit is multiplied by when it is cut
+        """
+        if not 1 <= minimum <= initial <= maximum or window < 1 or not 0 < decrease < 1:
+            raise ValueError(
+                f"Invalid limits {minimum} <= {initial} <= {maximum}, window {window} or decrease {decrease}"
+            )
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.tolerance = tolerance
+        self.max_error_rate = max_error_rate
+        self.decrease = decrease
+        self.baseline = None
+        self.history = [initial]
+
+        self.__limit = float(initial)
+        self.__samples = collections.deque(maxlen=window)
+
+    @property
+    def limit(self):
+        return int(self.__limit)
+
+    def target(self):
+        """
+        :return: The highest median latency of a window at which the limit grows, in seconds
+        :rtype: float or None
+        """
+        if self.target_latency is not None:
+            return self.target_latency
+        if self.baseline is None:
+            return None
+        return self.baseline * self.tolerance
+
+    def record(self, latency, ok):
+        """
+        Records the outcome of an attempt, adjusting the limit at the end of each window.
+
+        :param latency: The seconds taken by the attempt
+        :param ok: ``True`` if the attempt succeeded
+        """
+        self.__samples.append((latency, ok))
+        if len(self.__samples) < self.__samples.maxlen:
+            return
+        latencies = [latency for latency, succeeded in self.__samples if succeeded]
+        errors = 1 - len(latencies) / len(self.__samples)
+        median = statistics.median(latencies) if latencies else None
+        target = self.target()
+        if errors > self.max_error_rate or (median is not None and target is not None and median > target):
+            self.__limit = max(self.minimum, self.__limit * self.decrease)
+        else:
+            self.__limit = min(self.maximum, self.__limit + 1)
+        if median is not None:
+            self.baseline = median if self.baseline is None else min(self.baseline, median)
+        self.__samples.clear()
+        self.history.append(self.limit)
+
+
+async def schedule_async(scraper, jobs, *, deadline=300.0, retry=None, concurrency=None,
+                         on_result=None, browser=None, **options):
+    """
+    Coroutine of :py:func:`schedule`.
+
+    :param browser: A running asynchronous ``Playwright`` browser.
+        If not specified, a browser is launched for the jobs.
+    """
+    scraper = batch.resolve_scraper(scraper)
+    jobs = [batch.BatchJob.from_spec(j) for j in jobs]
+    retry = retry or RetryPolicy()
+    concurrency = concurrency or AdaptiveConcurrency()
+    slots = asyncio.Condition()
+    active = 0
+
+    async def attempt(job, path, started, browser):
+        nonlocal active
+        async with slots:
+            await slots.wait_for(lambda: active < concurrency.limit)
+            active += 1
+        start = time.monotonic()
+        started = started or start
+        timeout = deadline - (start - started) if deadline else None
+        error = None
+        try:
+            await asyncio.wait_for(batch.run_job(scraper, browser, job, path, **options), timeout)
+        except asyncio.TimeoutError:
+            error = fangraphs.exceptions.DeadlineExceeded(path, deadline)
+        except Exception as err:
+            error = err
+        async with slots:
+            active -= 1
+            concurrency.record(time.monotonic() - start, error is None)
+            slots.notify_all()
+        return error, started
+
+    async def worker(index, job, browser):
+        path = job.path or batch._default_path(scraper, index)
+        start = None
+        attempts = 0
+        try:
+            catalog.validate_filters(scraper.__name__, job.filters)
+        except (fangraphs.exceptions.InvalidFilterQuery, fangraphs.exceptions.InvalidFilterOption) as err:
+            result = batch.BatchResult(index, job, path, err, attempts=0)
+            if on_result is not None:
+                on_result(result)
+            return result
+        while True:
+            attempts += 1
+            error, start = await attempt(job, path, start, browser)
+            if error is None or isinstance(error, fangraphs.exceptions.DeadlineExceeded):
+                break
+            if not retry.should_retry(attempts, error):
+                break
+            delay = retry.delay(attempts)
+            if deadline and time.monotonic() - start + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+        result = batch.BatchResult(index, job, path, error, time.monotonic() - start, attempts)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    if browser is not None:
+        return list(await asyncio.gather(
+            *(worker(i, j, browser) for i, j in enumerate(jobs))
+        ))
+    async with async_playwright() as play:
+        browser = await play.chromium.launch(
+            downloads_path=os.path.abspath("out")
+        )
+        try:
+            return list(await asyncio.gather(
+                *(worker(i, j, browser) for i, j in enumerate(jobs))
+            ))
+        finally:
+            await browser.close()
+
+
+def schedule(scraper, jobs, *, deadline=300.0, retry=None, concurrency=None, on_result=None, **options):
+    """
+    Exports the leaderboard of ``scraper`` once for each job, like :py:func:`fangraphs.leaders.batch.export_batch`,
+    retrying failed jobs and adapting the number of concurrent browser contexts to the observed
+    latency and error rate of the jobs.
+
+    A job which fails after its retries, or which does not finish before its deadline,
+    does not stop the other jobs; its exception is recorded in its :py:class:`fangraphs.leaders.batch.BatchResult`.
+    A job whose filters are invalid according to the option catalog
+    (see :py:func:`fangraphs.leaders.catalog.validate_filters`) fails without being attempted.
+
+    :param scraper: A leaders class, or the name of one
+    :param jobs: The job specifications, see :py:meth:`fangraphs.leaders.batch.BatchJob.from_spec`
+    :param deadline: The seconds which each job is allowed for all of its attempts, from the start of its first attempt.
+        If ``0`` or ``None``, jobs have no deadline.
+    :param retry: The retries of failed attempts. If not specified, each job is retried up to 3 times.
+    :type retry: RetryPolicy or None
+    :param concurrency: The controller of the number of jobs attempted at once.
+        If not specified, the limit starts at 2 and adapts between 1 and 8.
+    :type concurrency: AdaptiveConcurrency or None
+    :param on_result: Called with the :py:class:`fangraphs.leaders.batch.BatchResult` of each job as soon as it finishes
+    :param options: Keyword arguments passed to each scraper, e.g. ``timeout`` or ``limiter``
+    :return: The result of each job, in the order of ``jobs``
+    :rtype: list
+    """
+    return asyncio.run(schedule_async(
+        scraper, jobs, deadline=deadline, retry=retry, concurrency=concurrency,
+        on_result=on_result, **options
+    ))
@@ -0,0 +1,182 @@
+#! python3
+# FanGraphs/leaders/seasons.py
+
+"""
+Per-season sharding of exports which span a range of seasons.
+
+An export of a long range of seasons is one large request, which is slow and fails as a whole.
+Instead, the range is split into shards of one season (or of one decade, with ``span=10``),
+the shards are exported concurrently by :py:mod:`fangraphs.leaders.batch`,
+and the shards are merged into a single file with a consistent set of columns.
+
+With an :py:class:`fangraphs.leaders.cache.ExportCache`, the shards of completed seasons
+are stored once and reused, so later exports of the range only fetch the current season.
+"""
+
+import asyncio
+import os
+
+import fangraphs.exceptions
+from fangraphs.leaders import batch, tables
+
+
+#: The filter queries of the first and last season of the range of each scraper class which can be sharded,
+#: and the filter query which splits its leaderboard by season.
+#: Leaderboards which cannot be split by season (e.g. ``GameSpan`` and ``SeasonStat``) cannot be sharded,
+#: since the shards of a multi-season leaderboard do not add up to the leaderboard.
+SEASON_RANGES = {
+    "International": ("season1", "season2", "split_seasons"),
+    "MajorLeague": ("season1", "season2", "split_seasons"),
+}
+
+
+def season_shards(start, end, span=1):
+    """
+    Splits a range of seasons into shards.
+    Shards of more than one season are aligned to multiples of ``span`` (e.g. decades).
+
+    :param start: The first season of the range
+    :param end: The last season of the range
+    :param span: The number of seasons in each shard
+    :return: The first and last season of each shard
+    :rtype: list
+    :raises ValueError: ``start`` is after ``end``, or ``span`` is not positive
+    """
+    start, end = int(start), int(end)
+    if start > end or span < 1:
+        raise ValueError(f"Invalid season range {start}-{end} with span {span}")
+    shards = []
+    first = start
+    while first <= end:
+        last = min(end, (first // span + 1) * span - 1)
+        shards.append((first, last))
+        first = last + 1
+    return shards
+
+
+def shard_jobs(scraper, filters, start, end, *, span=1, directory="out/shards"):
+    """
+    Creates a batch job for each shard of a range of seasons.
+    Every shard is split by season, so the rows of the shards make up the leaderboard of the range.
+
+    :param scraper: A leaders class, or the name of one
+    :param filters: Mapping of the other filter queries to their options
+    :param start: The first season of the range
+    :param end: The last season of the range
+    :param span: The number of seasons in each shard
+    :param directory: The directory to export the shards to
+    :rtype: list
+    :raises ValueError: ``scraper`` has no range of seasons which can be split by season
+    """
+    name = scraper if isinstance(scraper, str) else scraper.__name__
+    try:
+        first_query, last_query, split_query = SEASON_RANGES[name]
+    except KeyError as err:
+        raise ValueError(f"{name} has no range of seasons which can be split by season") from err
+    jobs = []
+    for first, last in season_shards(start, end, span):
+        shard = dict(filters)
+        shard[first_query], shard[last_query] = str(first), str(last)
+        shard[split_query] = "True"
+        path = os.path.join(directory, f"{name}-{first}-{last}.csv")
+        jobs.append(batch.BatchJob(shard, path))
+    return jobs
+
+
+def merge(paths, path=""):
+    """
+    Merges CSV files into a single table.
+    The columns of the merged table are the union of the columns of every file, in order of appearance.
+    Cells of columns which a file does not have are left empty.
+
+    :param paths: The paths of the CSV files, in the order of their rows in the merged table
+    :param path: The path to save the merged table to. The format is given by its extension.
+    :return: The path which the merged table was saved to
+    :rtype: str
+    """
+    headers = []
+    for shard in paths:
+        reader = tables.iter_csv(shard)
+        for header in next(reader, []):
+            if header not in headers:
+                headers.append(header)
+        reader.close()
+
+    def rows():
+        for shard in paths:
+            reader = tables.iter_csv(shard)
+            columns = next(reader, [])
+            index = [columns.index(h) if h in columns else None for h in headers]
+            for row in reader:
+                yield [row[i] if i is not None and i < len(row) else "" for i in index]
+
+    return tables.write(headers, rows(), tables.resolve_path(path))
+
+
+async def export_seasons_async(scraper, filters, start, end, path="", *, span=1, contexts=4,
+                               cache=None, browser=None, directory="out/shards", **options):
+    """
+    Coroutine of :py:func:`export_seasons`.
+
+    :param browser: A running asynchronous ``Playwright`` browser.
+        If not specified, a browser is launched for the shards which are not cached.
+    """
+    name = scraper if isinstance(scraper, str) else scraper.__name__
+    jobs = shard_jobs(name, filters, start, end, span=span, directory=directory)
+    os.makedirs(directory, exist_ok=True)
+    capture = options.get("capture", False)
+    pending = [
+        job for job in jobs
+        if cache is None or cache.get(name, job.filters, job.path, capture=capture) is None
+    ]
+    try:
+        results = []
+        if pending:
+            results = await batch.export_batch_async(
+                name, pending, contexts=contexts, browser=browser, **options
+            )
+        failures = {}
+        for result in results:
+            if not result.ok:
+                failures[result.path] = result.error
+            elif cache is not None:
+                cache.put(name, result.job.filters, result.path, capture=capture)
+        if failures:
+            raise fangraphs.exceptions.ShardsFailed(failures)
+        return merge([job.path for job in jobs], path)
+    finally:
+        for job in jobs:
+            if os.path.exists(job.path):
+                os.remove(job.path)
+
+
+def export_seasons(scraper, filters, start, end, path="", *, span=1, contexts=4,
+                   cache=None, directory="out/shards", **options):
+    """
+    Exports the leaderboard of a range of seasons in shards of ``span`` seasons,
+    which are exported concurrently and merged into a single file.
+
+    A failing shard does not stop the other shards.
+    If any shard fails, :py:class:`fangraphs.exceptions.ShardsFailed` is raised after
+    the other shards have finished; with a ``cache``, they are not exported again by the next attempt.
+
+    :param scraper: A leaders class, or the name of one
+    :param filters: Mapping of the other filter queries to their options
+    :param start: The first season of the range
+    :param end: The last season of the range
+    :param path: The path to save the merged leaderboard to
+    :param span: The number of seasons in each shard, e.g. ``10`` for a shard per decade
+    :param contexts: The maximum number of shards exported at once
+    :param cache: The cache to reuse the shards of completed seasons from
+    :type cache: fangraphs.leaders.cache.ExportCache or None
+    :param directory: The directory to export the shards to before they are merged
+    :param options: Keyword arguments passed to each scraper, e.g. ``resource_filter``
+    :return: The path which the merged leaderboard was saved to
+    :rtype: str
+    :raises ValueError: ``scraper`` has no range of seasons which can be split by season
+    :raises FanGraphs.exceptions.ShardsFailed: At least one shard could not be exported
+    """
+    return asyncio.run(export_seasons_async(
+        scraper, filters, start, end, path, span=span, contexts=contexts,
+        cache=cache, directory=directory, **options
+    ))
@@ -0,0 +1,464 @@
+#! python3
+# FanGraphs/leaders/tables.py
+
+"""
+Helpers for the tabular data exported by the scrapers.
+A table is represented by a list of column headers and an iterable of rows.
+
+Besides CSV, tables can be written as typed, compressed columnar files (Parquet or Arrow IPC).
+The columnar formats require the optional ``pyarrow`` dependency (``pip install fangraphs[arrow]``).
+"""
+
+import csv
+import datetime
+import io
+import os
+import re
+
+#: File extensions of the supported export formats
+FORMATS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+#: Compression codec of the columnar formats
+COMPRESSION = "zstd"
+
+
+def export_path(path="", extension=".csv"):
+    """
+    Returns ``path`` if it has the extension ``extension``.
+    Otherwise, returns the filepath *out/%d.%m.%y %H.%M.%S* with the extension ``extension``.
+
+    :param path: The requested path
+    :param extension: The extension of the exported file
+    :rtype: str
+    """
+    if not path or os.path.splitext(path)[1] != extension:
+        path = "out/{}{}".format(
+            datetime.datetime.now().strftime("%d.%m.%y %H.%M.%S"), extension
+        )
+    return path
+
+
+def resolve_path(path="", format=None):
+    """
+    Returns the path to export a table in the format ``format`` to.
+    If ``format`` is not specified, it is inferred from the extension of ``path``, defaulting to CSV.
+
+    :param path: The requested path
+    :param format: ``"csv"``, ``"parquet"`` or ``"arrow"``
+    :rtype: str
+    :raises ValueError: Unsupported argument ``format``
+    """
+    if format is None:
+        extension = os.path.splitext(path)[1]
+        format = next((f for f, e in FORMATS.items() if e == extension), "csv")
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported export format '{format}'")
+    return export_path(path, FORMATS[format])
+
+
+def write_csv(headers, rows, path=""):
+    """
+    Writes a table to a CSV file.
+    The file will be saved to the filepath ``path``, if specified.
+    Otherwise, the file will be saved to the filepath *out/%d.%m.%y %H.%M.%S.csv*.
+
+    :param headers: The column headers
+    :param rows: The rows of the table
+    :param path: The path to save the exported file to
+    :return: The path which the file was saved to
+    :rtype: str
+    """
+    path = export_path(path)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    return path
+
+
+_TAGS = re.compile(r"<[^>]+>")
+
+
+def json_rows(payload):
+    """
+    Decodes the rows of a leaderboard from the JSON payload of a FanGraphs data endpoint.
+    The payload is either a list of records or an object holding the list of records
+    (e.g. under ``data``). HTML markup in values, such as player links, is removed.
+
+    :param payload: The decoded JSON payload
+    :return: The column headers and the rows of the leaderboard
+    :rtype: tuple
+    """
+    records = payload
+    if isinstance(payload, dict):
+        records = payload.get("data")
+        if not isinstance(records, list):
+            records = next(
+                (v for v in payload.values() if isinstance(v, list)), []
+            )
+    headers = []
+    seen = set()
+    for record in records:
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                headers.append(key)
+    rows = []
+    for record in records:
+        row = []
+        for key in headers:
+            value = record.get(key, "")
+            if value is None:
+                value = ""
+            elif isinstance(value, str):
+                value = _TAGS.sub("", value)
+            row.append(value)
+        rows.append(row)
+    return headers, rows
+
+
+_NUMBER = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+_INTEGER = re.compile(r"^[+-]?\d+$")
+
+
+def _parse_number(value):
+    """
+    Parses a number as displayed by FanGraphs, e.g. ``17``, ``.281``, ``12.5 %``,
+    ``$4.2`` or ``($1.3)``. Percentages are converted to fractions.
+
+    :return: The number, or ``None`` if ``value`` is not a number
+    :rtype: int or float or None
+    """
+    text = value.strip().replace(",", "")
+    negative = text.startswith("(") and text.endswith(")")
+    if negative:
+        text = text[1:-1].strip()
+    text = text.lstrip("$")
+    percent = text.endswith("%")
+    if percent:
+        text = text[:-1].strip()
+    if not _NUMBER.match(text):
+        return None
+    number = int(text) if _INTEGER.match(text) and not percent else float(text)
+    if percent:
+        number /= 100
+    return -number if negative else number
+
+
+def infer_column(values):
+    """
+    Infers the type of a column and converts its values.
+    Empty values become ``None``. A column is numeric only if every non-empty value is a number.
+
+    :param values: The values of the column
+    :return: The converted values and their type (``int``, ``float`` or ``str``)
+    :rtype: tuple
+    """
+    parsed = []
+    kind = int
+    for value in values:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            parsed.append(None)
+            continue
+        if isinstance(value, bool):
+            number = None
+        elif isinstance(value, (int, float)):
+            number = value
+        else:
+            number = _parse_number(str(value))
+        if number is None:
+            return [None if v is None else str(v) for v in values], str
+        if isinstance(number, float):
+            kind = float
+        parsed.append(number)
+    if all(v is None for v in parsed):
+        return [None] * len(parsed), str
+    if kind is float:
+        parsed = [None if v is None else float(v) for v in parsed]
+    return parsed, kind
+
+
+def to_columns(headers, rows):
+    """
+    Transposes the rows of a table into typed columns.
+
+    :param headers: The column headers
+    :param rows: The rows of the table
+    :return: Mapping of the column headers to the converted values and type of each column
+    :rtype: dict
+    """
+    if not isinstance(rows, list):
+        rows = list(rows)
+    columns = {}
+    for index, header in enumerate(headers):
+        values = [row[index] if index < len(row) else None for row in rows]
+        columns[header] = infer_column(values)
+    return columns
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as err:
+        raise ImportError(
+            "Parquet and Arrow exports require pyarrow: pip install fangraphs[arrow]"
+        ) from err
+    return pyarrow
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as err:
+        raise ImportError(
+            "NumPy tables require numpy: pip install fangraphs[numpy]"
+        ) from err
+    return numpy
+
+
+def _arrow_arrays(headers, rows):
+    """
+    :return: The column headers and a typed ``pyarrow.Array`` of each column
+    :rtype: tuple
+    """
+    pa = _pyarrow()
+    types = {int: pa.int64(), float: pa.float64(), str: pa.string()}
+    columns = to_columns(headers, rows)
+    return list(columns), [
+        pa.array(values, type=types[kind]) for values, kind in columns.values()
+    ]
+
+
+def arrow_table(headers, rows):
+    """
+    Converts a table into a ``pyarrow.Table`` with inferred column types.
+
+    :param headers: The column headers
+    :param rows: The rows of the table
+    :rtype: pyarrow.Table
+    """
+    names, arrays = _arrow_arrays(headers, rows)
+    return _pyarrow().table(arrays, names=names)
+
+
+#: In-memory representations of a table returned by :py:func:`columnar`
+KINDS = ("columns", "numpy", "arrow")
+
+
+def columnar(headers, rows, kind="columns"):
+    """
+    Converts a table into an in-memory, column-oriented structure with inferred column types.
+
+    - ``"columns"``: Mapping of the column headers to lists of ``int``, ``float``, ``str`` or ``None``
+    - ``"numpy"``: Mapping of the column headers to NumPy arrays.
+      Numeric columns are ``int64``, or ``float64`` with ``nan`` for missing values.
+      Other columns are ``object`` arrays.
+    - ``"arrow"``: A ``pyarrow.RecordBatch``
+
+    :param headers: The column headers
+    :param rows: The rows of the table
+    :param kind: ``"columns"``, ``"numpy"`` or ``"arrow"``
+    :raises ValueError: Unsupported argument ``kind``
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unsupported table kind '{kind}'")
+    if kind == "arrow":
+        names, arrays = _arrow_arrays(headers, rows)
+        return _pyarrow().record_batch(arrays, names=names)
+    columns = to_columns(headers, rows)
+    if kind == "columns":
+        return {header: values for header, (values, _) in columns.items()}
+    np = _numpy()
+    arrays = {}
+    for header, (values, kind_) in columns.items():
+        if kind_ is str:
+            arrays[header] = np.array(values, dtype=object)
+        elif kind_ is int and None not in values:
+            arrays[header] = np.array(values, dtype=np.int64)
+        else:
+            arrays[header] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+    return arrays
+
+
+def write_columnar(headers, rows, path, compression=COMPRESSION):
+    """
+    Writes a table to a compressed Parquet (*.parquet*) or Arrow IPC (*.arrow*) file.
+
+    :param headers: The column headers
+    :param rows: The rows of the table
+    :param path: The path to save the exported file to
+    :param compression: The compression codec
+    :return: The path which the file was saved to
+    :rtype: str
+    """
+    pa = _pyarrow()
+    table = arrow_table(headers, rows)
+    if path.endswith(FORMATS["parquet"]):
+        pa.parquet.write_table(table, path, compression=compression)
+    else:
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+    return path
+
+
+def write(headers, rows, path):
+    """
+    Writes a table in the format given by the extension of ``path``.
+
+    :param headers: The column headers
+    :param rows: The rows of the table
+    :param path: The path to save the exported file to
+    :return: The path which the file was saved to
+    :rtype: str
+    """
+    if path.endswith(FORMATS["csv"]):
+        return write_csv(headers, rows, path)
+    return write_columnar(headers, rows, path)
+
+
+#: Number of rows handed to a :py:class:`TableWriter` at once by :py:func:`write_async`
+CHUNK_SIZE = 500
+
+
+class TableWriter:
+    """
+    Writes a table chunk by chunk, in the format given by the extension of ``path``.
+    CSV rows are written to the file as they are received.
+    The columnar formats infer the type of each column from the whole table,
+    so their rows are kept until the writer is closed.
+
+    :param headers: The column headers
+    :param path: The path to save the exported file to
+    """
+    def __init__(self, headers, path):
+        self.headers = list(headers)
+        self.path = path
+        self.__rows = []
+        self.__file = None
+        if path.endswith(FORMATS["csv"]):
+            self.path = export_path(path)
+            self.__file = open(self.path, "w", newline="", encoding="utf-8")
+            self.__writer = csv.writer(self.__file)
+            self.__writer.writerow(self.headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self.__file is not None:
+            self.__file.close()
+
+    def write(self, rows):
+        """
+        :param rows: The next rows of the table
+        """
+        if self.__file is None:
+            self.__rows.extend(rows)
+        else:
+            self.__writer.writerows(rows)
+
+    def close(self):
+        """
+        Finishes writing the table.
+
+        :return: The path which the file was saved to
+        :rtype: str
+        """
+        if self.__file is None:
+            write_columnar(self.headers, self.__rows, self.path)
+            self.__rows = []
+        else:
+            self.__file.close()
+        return self.path
+
+
+async def write_async(rows, path, chunk_size=CHUNK_SIZE):
+    """
+    Writes a table read from an asynchronous iterator, without collecting its rows first.
+    The rows are handed to a :py:class:`TableWriter` in chunks of ``chunk_size``.
+
+    :param rows: An asynchronous iterator which yields the column headers, then each row
+    :param path: The path to save the exported file to
+    :param chunk_size: The number of rows written at once
+    :return: The path which the file was saved to
+    :rtype: str
+    """
+    rows = rows.__aiter__()
+    try:
+        headers = await rows.__anext__()
+    except StopAsyncIteration:
+        headers = []
+    with TableWriter(headers, path) as writer:
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                writer.write(chunk)
+                chunk = []
+        writer.write(chunk)
+    return writer.path
+
+
+async def collect_async(rows):
+    """
+    Reads a table from an asynchronous iterator into memory.
+
+    :param rows: An asynchronous iterator which yields the column headers, then each row
+    :return: The column headers and the rows of the table
+    :rtype: tuple
+    """
+    rows = rows.__aiter__()
+    try:
+        headers = await rows.__anext__()
+    except StopAsyncIteration:
+        return [], []
+    return headers, [row async for row in rows]
+
+
+def read_csv(data):
+    """
+    Reads the headers and rows of a CSV file.
+
+    :param data: The contents of the CSV file
+    :type data: bytes or str
+    :return: The column headers and the rows of the table
+    :rtype: tuple
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8-sig")
+    reader = csv.reader(io.StringIO(data, newline=""))
+    headers = next(reader, [])
+    return headers, list(reader)
+
+
+def iter_csv(path):
+    """
+    Reads a CSV file lazily, one row at a time.
+
+    :param path: The path of the CSV file
+    :return: A generator which yields the column headers, then each row
+    :rtype: generator
+    """
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        yield from csv.reader(file)
+
+
+def convert(source, path):
+    """
+    Converts a CSV file into the format given by the extension of ``path``.
+
+    :param source: The path of the CSV file
+    :param path: The path to save the converted file to
+    :return: The path which the file was saved to
+    :rtype: str
+    """
+    with open(source, "rb") as file:
+        headers, rows = read_csv(file.read())
+    return write(headers, rows, path)
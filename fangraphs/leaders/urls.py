@@ -0,0 +1,55 @@
+#! python3
+# FanGraphs/leaders/urls.py
+
+"""
+Builds the URLs which encode a filter configuration in the query string,
+from the classes in :py:mod:`fangraphs.selectors.leaders_params`.
+"""
+
+from urllib.parse import urlencode
+
+import fangraphs.exceptions
+
+
+def query_params(params, filters):
+    """
+    Translates a filter configuration into the query-string parameters of a page.
+    This is the only URL builder: both the browser scrapers and the scrapers in
+    :py:mod:`fangraphs.leaders.http_leaders` build their query strings with it.
+    Options are matched case-insensitively; options which are passed through keep their case.
+    The ``composite`` filter queries of ``params`` are left to the scraper, which folds them into the result.
+
+    :param params: The class in :py:mod:`fangraphs.selectors.leaders_params` of the page
+    :param filters: Mapping of filter queries to options
+    :return: The query-string parameters
+    :rtype: dict
+    :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query cannot be expressed in the URL
+    :raises FanGraphs.exceptions.InvalidFilterOption: An option is not in the mapping of its filter query
+    """
+    filters = {k.lower(): str(v) for k, v in filters.items()}
+    for alias, queries in params.aliases.items():
+        if alias in filters:
+            option = filters.pop(alias)
+            for query in queries:
+                filters.setdefault(query, option)
+    result = dict(params.defaults)
+    for query, option in filters.items():
+        if query in params.composite:
+            continue
+        if query not in params.params:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        name, values = params.params[query]
+        if values and option.lower() not in values:
+            raise fangraphs.exceptions.InvalidFilterOption(option)
+        result[name] = values.get(option.lower(), option)
+    return result
+
+
+def build_url(address, params):
+    """
+    :param address: The base URL address of the page
+    :param params: The query-string parameters
+    :return: The URL of the page with the query string
+    :rtype: str
+    """
+    return f"{address}?{urlencode(params)}" if params else address
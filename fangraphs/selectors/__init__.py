@@ -4,12 +4,26 @@
 import fangraphs.exceptions
 
 
-class Selections:
+class _Selector:
+    """
+    Base class of the filter query classes.
+    The ``bs4.BeautifulSoup`` object is always read from the scraper which owns the selector,
+    so the selector never holds on to an outdated parser.
+    """
+    def __init__(self, scraper):
+        self.scraper = scraper
+
+    @property
+    def soup(self):
+        return self.scraper.soup
+
+
+class Selections(_Selector):
     """
     Manages selection-class filter queries.
     """
-    def __init__(self, soup, selector, descendant=""):
-        self.soup = soup
+    def __init__(self, scraper, selector, descendant=""):
+        super().__init__(scraper)
         self.selector = selector
         self.descendant = descendant
 
@@ -28,7 +42,7 @@ class Selections:
 
     def current_option(self):
         if isinstance(self.selector, str):
-            elem = self.soup.select(f"{self.selector} .rtsLink.rtsSelected")
+            elem = self.soup.select(f"{self.selector} .rtsLink.rtsSelected")[0]
             option = elem.getText()
         elif isinstance(self.selector, list):
             option = ""
@@ -40,30 +54,47 @@ class Selections:
             raise Exception
         return option
 
-    async def configure(self, page, option: str):
-        option = option.lower()
-        options = [o.lower() for o in self.list_options()]
+    def _option_index(self, option: str):
+        options = self.list_options()
         try:
-            index = options.index(option)
+            index = [o.lower() for o in options].index(option.lower())
         except ValueError as err:
             raise fangraphs.exceptions.InvalidFilterOption(option) from err
+        return index, options[index]
+
+    def configure(self, page, option: str):
+        index, option = self._option_index(option)
         if isinstance(self.selector, str):
-            elem = await page.query_selector_all(
+            elem = page.query_selector_all(
                 f"{self.selector} {self.descendant}"
             )[index]
-            await elem.click()
+            elem.click()
+        elif isinstance(self.selector, list):
+            page.click(self.selector[index])
+        else:
+            raise Exception
+        return option
+
+    async def configure_async(self, page, option: str):
+        index, option = self._option_index(option)
+        if isinstance(self.selector, str):
+            elems = await page.query_selector_all(
+                f"{self.selector} {self.descendant}"
+            )
+            await elems[index].click()
         elif isinstance(self.selector, list):
             await page.click(self.selector[index])
         else:
             raise Exception
+        return option
 
 
-class Dropdowns:
+class Dropdowns(_Selector):
     """
     Manage dropdown-class filter queries.
     """
-    def __init__(self, soup, selector, descendants="", dd_options=None):
-        self.soup = soup
+    def __init__(self, scraper, selector, descendants="", dd_options=None):
+        super().__init__(scraper)
         self.selector = selector
         self.descendants = descendants
         self.dd_options = dd_options
@@ -96,25 +127,39 @@ class Dropdowns:
             raise Exception
         return option
 
-    async def configure(self, page, option: str):
-        options = [o.lower() for o in self.list_options()]
+    def _option_index(self, option: str):
+        options = self.list_options()
         try:
-            index = options.index(option.lower())
+            index = [o.lower() for o in options].index(option.lower())
         except ValueError as err:
             raise fangraphs.exceptions.InvalidFilterOption(option) from err
-        await page.click(self.selector)
-        elem = await page.query_selector_all(
+        return index, options[index]
+
+    def configure(self, page, option: str):
+        index, option = self._option_index(option)
+        page.click(self.selector)
+        elem = page.query_selector_all(
             f"{self.selector} {self.descendants}"
         )[index]
-        await elem.click()
+        elem.click()
+        return option
+
+    async def configure_async(self, page, option: str):
+        index, option = self._option_index(option)
+        await page.click(self.selector)
+        elems = await page.query_selector_all(
+            f"{self.selector} {self.descendants}"
+        )
+        await elems[index].click()
+        return option
 
 
-class Switches:
+class Switches(_Selector):
     """
     Manages checkbox-class filter queries.
     """
-    def __init__(self, soup, selector):
-        self.soup = soup
+    def __init__(self, scraper, selector):
+        super().__init__(scraper)
         self.selector = selector
 
     def current_option(self, opt_type):
@@ -0,0 +1,151 @@
+#! python3
+# FanGraphs/selectors/leaders_params.py
+
+"""
+Query-string parameters for the classes in :py:mod:`FanGraphs.leaders`.
+
+Every class has the same attributes, which :py:func:`fangraphs.leaders.urls.query_params` reads:
+
+- ``params`` maps the filter queries of the corresponding scraper to the URL parameter which encodes it,
+  and the (lower-cased) options of the filter query to the parameter values.
+  Only filter queries whose options are free-form (e.g. seasons and minimum plate appearances)
+  have an empty mapping, and their options are passed through unchanged.
+- ``aliases`` maps filter queries which stand for several other filter queries to those queries
+  (e.g. ``single_season`` sets both ``season1`` and ``season2``).
+- ``composite`` lists the filter queries which are folded into other parameters by the scraper.
+- ``unsupported`` lists the filter queries whose options have no known encoding in the query string.
+  They cannot be expressed in a URL.
+- ``defaults`` are the parameters of every URL.
+"""
+
+_TEAMS = {
+    "all teams": "0",
+    "angels": "1", "laa": "1", "orioles": "2", "bal": "2", "red sox": "3", "bos": "3",
+    "white sox": "4", "chw": "4", "indians": "5", "cle": "5", "tigers": "6", "det": "6",
+    "royals": "7", "kcr": "7", "twins": "8", "min": "8", "yankees": "9", "nyy": "9",
+    "athletics": "10", "oak": "10", "mariners": "11", "sea": "11", "rays": "12", "tbr": "12",
+    "rangers": "13", "tex": "13", "blue jays": "14", "tor": "14", "diamondbacks": "15",
+    "ari": "15", "braves": "16", "atl": "16", "cubs": "17", "chc": "17", "reds": "18",
+    "cin": "18", "rockies": "19", "col": "19", "marlins": "20", "mia": "20", "astros": "21",
+    "hou": "21", "dodgers": "22", "lad": "22", "brewers": "23", "mil": "23",
+    "nationals": "24", "wsn": "24", "mets": "25", "nym": "25", "phillies": "26",
+    "phi": "26", "pirates": "27", "pit": "27", "cardinals": "28", "stl": "28",
+    "padres": "29", "sdp": "29", "giants": "30", "sfg": "30",
+}
+
+
+class GameSpan:
+    """
+    Query-string parameters for :py:class:`fangraphs.leaders.leaders.GameSpan`.
+    """
+    params = {
+        "stat": ("stats", {"batting": "bat", "pitching": "pit"}),
+        "min_pa": ("qual", {"qualified": "y"}),
+        "season1": ("season1", {}),
+        "season2": ("season", {}),
+        "determine": ("determine", {}),
+    }
+    aliases = {"single_season": ("season1", "season2")}
+    composite = ()
+    unsupported = ("type",)
+    defaults = {}
+
+
+class International:
+    """
+    Query-string parameters for :py:class:`fangraphs.leaders.leaders.International`.
+    The ``split_seasons`` filter query is appended to the ``team`` parameter by the scraper.
+    """
+    params = {
+        "stat": ("stats", {"batting": "bat", "pitching": "pit"}),
+        "min": ("qual", {"qualified": "y"}),
+        "season1": ("season1", {}),
+        "season2": ("season", {}),
+    }
+    aliases = {"single_season": ("season1", "season2")}
+    composite = ("split_seasons",)
+    unsupported = ("type", "position", "league", "team")
+    defaults = {}
+
+
+class MajorLeague:
+    """
+    Query-string parameters for :py:class:`fangraphs.leaders.leaders.MajorLeague`.
+    """
+    params = {
+        "stat": ("stats", {"batting": "bat", "pitching": "pit", "fielding": "fld"}),
+        "position": ("pos", {
+            "all": "all", "p": "p", "c": "c", "1b": "1b", "2b": "2b", "ss": "ss",
+            "3b": "3b", "rf": "rf", "cf": "cf", "lf": "lf", "of": "of", "dh": "dh",
+            "no p": "np"
+        }),
+        "type": ("type", {
+            "dashboard": "8", "standard": "0", "advanced": "1", "batted ball": "2",
+            "win probability": "3", "pitch type": "4", "plate discipline": "5",
+            "value": "6", "pitch value": "7", "statcast": "24"
+        }),
+        "league": ("lg", {"all leagues": "all", "al": "al", "nl": "nl"}),
+        "team": ("team", _TEAMS),
+        "split": ("month", {
+            "full season": "0", "past 7 days": "1", "past 14 days": "2",
+            "past 30 days": "3", "march/april": "4", "may": "5", "june": "6",
+            "july": "7", "august": "8", "sept/oct": "9", "vs l": "13", "vs r": "14",
+            "home": "15", "away": "16", "first half": "30", "second half": "31"
+        }),
+        "min_pa": ("qual", {"qualified": "y"}),
+        "season1": ("season1", {}),
+        "season2": ("season", {}),
+        "split_seasons": ("ind", {"true": "1", "false": "0"}),
+        "active_roster": ("rost", {"true": "1", "false": "0"}),
+    }
+    aliases = {"single_season": ("season1", "season2")}
+    composite = ("group", "age1", "age2", "split_teams")
+    unsupported = ("hof", "rookies")
+    defaults = {
+        "pos": "all", "stats": "bat", "lg": "all", "qual": "y", "type": "8",
+        "month": "0", "ind": "0", "team": "0", "rost": "0", "age": "0",
+        "filter": "", "players": "0", "page": "1_100000"
+    }
+    groups = {"player stats": "", "team stats": ",ts", "league stats": ",ss"}
+    table = "#LeaderBoard1_dg1_ctl00"
+    postback = "LeaderBoard1$cmdCSV"
+
+
+class SeasonStat:
+    """
+    Query-string parameters for :py:class:`fangraphs.leaders.leaders.SeasonStat`.
+    Every stat dropdown selects the ``stat`` parameter, whose values are the names of the stats.
+    """
+    params = {
+        "stat": ("position", {"batting": "B", "pitching": "P"}),
+        "start_season": ("seasonStart", {}),
+        "end_season": ("seasonEnd", {}),
+        "popular": ("stat", {}),
+        "standard": ("stat", {}),
+        "advanced": ("stat", {}),
+        "statcast": ("stat", {}),
+        "batted_ball": ("stat", {}),
+        "win_probability": ("stat", {}),
+        "pitch_type": ("stat", {}),
+        "plate_discipline": ("stat", {}),
+        "value": ("stat", {}),
+    }
+    aliases = {}
+    composite = ()
+    unsupported = ("type",)
+    defaults = {}
+
+
+class WAR:
+    """
+    Query-string parameters for :py:class:`fangraphs.leaders.leaders.WAR`.
+    """
+    params = {
+        "season": ("season", {}),
+    }
+    aliases = {}
+    composite = ()
+    unsupported = ("team", "type")
+    defaults = {}
+    table = ".rgMasterTable"
+    postback = "WARBoard1$cmdCSV"
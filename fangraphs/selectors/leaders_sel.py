@@ -29,6 +29,7 @@ class GameSpan:
         "determine": ".controls-stats.stat-determined > div:nth-child(1) > .fg-selection-box__selection"
     }
     waitfor = ".fg-data-grid.table-type"
+    api = "/api/leaders/special/"
 
 
 class International:
@@ -58,6 +59,7 @@ class International:
         "split_seasons": ".controls-stats > .fg-checkbox"
     }
     waitfor = ".fg-data-grid.table-type"
+    api = "/api/leaders/international/"
 
 
 class MajorLeague:
@@ -136,6 +138,11 @@ class SeasonStat:
         "value": ".season-grid-controls-dropdown-row-stats > div:nth-child(9)"
     }
     waitfor = ".fg-data-grid.undefined"
+    api = "/api/leaders/season-stat"
+    table = ".table-scroll"
+    page_total = ".table-page-control:nth-last-child(1) > .table-control-total"
+    page_size = ".table-page-control:nth-last-child(1) select"
+    next_page = ".table-page-control:nth-last-child(1) > .next"
 
 
 class Splits:
@@ -211,6 +218,7 @@ class Splits:
         "auto_pt": "#stack-buttons > div:nth-child(3)"
     }
     waitfor = ".fg-data-grid.undefined"
+    api = "/api/leaders/splits/"
 
 
 class WAR:
@@ -0,0 +1,57 @@
+#! python3
+# tests/test_batch.py
+
+"""
+The docstring in each test identifies the function(s) of
+:py:mod:`FanGraphs.leaders.batch` being tested.
+"""
+
+import asyncio
+
+import pytest
+
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import batch
+from fangraphs.leaders import leaders
+
+
+class TestExportBatch:
+    """
+    :py:func:`FanGraphs.leaders.batch.export_batch_async`
+    """
+    def test_resolve_scraper(self):
+        """
+        Function ``resolve_scraper``.
+        """
+        assert batch.resolve_scraper(leaders.Splits) is async_leaders.Splits
+        assert batch.resolve_scraper("WAR") is async_leaders.WAR
+        with pytest.raises(ValueError):
+            batch.resolve_scraper("Projections")
+
+    def test_results_and_concurrency(self, monkeypatch):
+        """
+        Function ``export_batch_async``.
+        """
+        running = []
+        peak = []
+
+        async def fake_run_job(scraper, browser, job, path, **options):
+            running.append(path)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(path)
+            if job.filters.get("season") == "bad":
+                raise ValueError(job.filters["season"])
+
+        monkeypatch.setattr(batch, "run_job", fake_run_job)
+        jobs = [{"season": str(year)} for year in range(2010, 2020)]
+        jobs.append({"filters": {"season": "bad"}, "path": "out/bad.csv"})
+        results = asyncio.run(
+            batch.export_batch_async("WAR", jobs, contexts=3, browser=object())
+        )
+        assert max(peak) == 3
+        assert [r.index for r in results] == list(range(11))
+        assert all(r.ok for r in results[:-1])
+        assert results[0].path.endswith("WAR-00000.csv")
+        assert isinstance(results[-1].error, ValueError)
+        assert results[-1].path == "out/bad.csv"
@@ -0,0 +1,120 @@
+#! python3
+# tests/test_cache.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:class:`FanGraphs.leaders.cache.ExportCache` being tested.
+"""
+
+import os
+
+import pytest
+
+from fangraphs.leaders import cache
+
+
+@pytest.fixture
+def export_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("out")
+    return cache.ExportCache(ttl=1.0, max_size=100, current_season=2021)
+
+
+def _export(path, content="Name,WAR\nA,1\n"):
+    with open(path, "w") as file:
+        file.write(content)
+    return path
+
+
+class TestExportCache:
+    """
+    :py:class:`FanGraphs.leaders.cache.ExportCache`
+    """
+    def test_get_put(self, export_cache):
+        """
+        Instance methods ``ExportCache.get`` and ``ExportCache.put``.
+        """
+        filters = {"season1": "2019", "Stat": "Pitching"}
+        assert export_cache.get("MajorLeague", filters, "out/a.csv") is None
+        export_cache.put("MajorLeague", filters, _export("out/export.csv"))
+
+        same = {"stat": "pitching", "season1": 2019}
+        assert export_cache.get("MajorLeague", same, "out/a.csv") == "out/a.csv"
+        with open("out/a.csv") as file:
+            assert file.read() == "Name,WAR\nA,1\n"
+        assert export_cache.get("WAR", same, "out/b.csv") is None
+        assert export_cache.get("MajorLeague", same, "out/a.parquet") is None
+        assert export_cache.get("MajorLeague", same, "out/a.csv", capture=True) is None
+
+        stats = export_cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 4, 1)
+
+        reopened = cache.ExportCache(current_season=2021)
+        assert reopened.get("MajorLeague", same, "out/c.csv") == "out/c.csv"
+
+    def test_expiry(self, export_cache, monkeypatch):
+        """
+        Instance methods ``ExportCache.expiry`` and ``ExportCache.get``.
+        """
+        completed = {"season1": "2015", "season2": "2020"}
+        current = {"season1": "2015", "season2": "2021"}
+        assert export_cache.expiry(completed) is None
+        assert export_cache.expiry(current) is not None
+        assert export_cache.expiry({"stat": "batting"}) is not None
+
+        assert export_cache.expiry(completed, "MajorLeague") is None
+        assert export_cache.expiry({"season1": "2010"}, "MajorLeague") is not None
+        assert export_cache.expiry({"single_season": "2010"}, "MajorLeague") is None
+        assert export_cache.expiry({"stat": "batting"}, "WAR") is not None
+        assert export_cache.seasons({"end_season": "2015"}, "SeasonStat") == [2015, 2021]
+
+        export_cache.put("MajorLeague", completed, _export("out/export.csv"))
+        export_cache.put("MajorLeague", current, _export("out/export.csv"))
+        now = cache.time.time()
+        monkeypatch.setattr(cache.time, "time", lambda: now + 120)
+        assert export_cache.get("MajorLeague", completed, "out/a.csv") == "out/a.csv"
+        assert export_cache.get("MajorLeague", current, "out/b.csv") is None
+        assert export_cache.stats()["entries"] == 1
+
+    def test_evict(self, export_cache, monkeypatch):
+        """
+        Instance method ``ExportCache.evict``.
+        """
+        clock = iter(range(1000))
+        monkeypatch.setattr(cache.time, "time", lambda: next(clock))
+        content = "x" * 40
+        for season in ("2017", "2018"):
+            export_cache.put("WAR", {"season": season}, _export("out/e.csv", content))
+        assert export_cache.get("WAR", {"season": "2017"}, "out/a.csv")
+        export_cache.put("WAR", {"season": "2019"}, _export("out/e.csv", content))
+
+        assert export_cache.evictions == 1
+        assert export_cache.size == 80
+        assert export_cache.get("WAR", {"season": "2018"}, "out/b.csv") is None
+        assert export_cache.get("WAR", {"season": "2017"}, "out/b.csv")
+        assert len(os.listdir("out/.cache")) == 4  # two exports, the index and its lock file
+
+        export_cache.clear()
+        assert sorted(os.listdir("out/.cache")) == ["index.json", "index.lock"]
+
+    def test_shared_directory(self, export_cache):
+        """
+        Instance methods ``ExportCache.put``, ``ExportCache.get`` and ``ExportCache.evict``
+        of two caches sharing a directory.
+        """
+        other = cache.ExportCache(ttl=1.0, max_size=100, current_season=2021)
+        export_cache.put("WAR", {"season": "2019"}, _export("out/2019.csv"))
+        other.put("WAR", {"season": "2020"}, _export("out/2020.csv"))
+        export_cache.put("WAR", {"season": "2018"}, _export("out/2018.csv"))
+
+        reopened = cache.ExportCache(current_season=2021)
+        assert reopened.stats()["entries"] == 3
+        for season in ("2018", "2019", "2020"):
+            assert other.get("WAR", {"season": season}, f"out/{season}-copy.csv") is not None
+
+        other.max_size = 14
+        other.evict()
+        assert export_cache.stats()["entries"] == 1
+        assert export_cache.get("WAR", {"season": "2019"}, "out/missing.csv") is None
+        assert export_cache.get("WAR", {"season": "2020"}, "out/2020-copy.csv") is not None
+        assert len([f for f in os.listdir("out/.cache") if f.endswith(".csv")]) == 1
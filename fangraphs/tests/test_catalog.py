@@ -0,0 +1,172 @@
+#! python3
+# tests/test_catalog.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:mod:`FanGraphs.leaders.catalog` being tested.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import async_leaders, batch, catalog, leaders, scheduler
+
+
+@pytest.fixture
+def saved(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saved = catalog.Catalog(
+        {"MajorLeague": {"stat": ["Batting", "Pitching", "Fielding"]}}, created="2021-05-01"
+    )
+    saved.save("out/catalog.json")
+    yield saved
+    catalog.set_catalog(None)
+
+
+class TestCatalog:
+    """
+    :py:class:`FanGraphs.leaders.catalog.Catalog`
+    """
+    def test_load(self, saved):
+        """
+        Class method ``Catalog.load``.
+        Instance method ``Catalog.save``.
+        """
+        loaded = catalog.Catalog.load("out/catalog.json")
+        assert loaded.classes == saved.classes
+        assert loaded.created == "2021-05-01"
+        assert catalog.Catalog.load("out/missing.json") is None
+
+        with open("out/catalog.json", "r+") as file:
+            data = json.load(file)
+            data["version"] = catalog.VERSION + 1
+            file.seek(0)
+            json.dump(data, file)
+            file.truncate()
+        assert catalog.Catalog.load("out/catalog.json") is None
+
+    def test_options(self, saved):
+        """
+        Instance methods ``Catalog.options`` and ``Catalog.validate``.
+        """
+        assert saved.options("MajorLeague", "Stat") == ["Batting", "Pitching", "Fielding"]
+        saved.validate("MajorLeague", "stat", "pitching")
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            saved.validate("MajorLeague", "stat", "running")
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            saved.options("MajorLeague", "position")
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            saved.options("WAR", "stat")
+
+    def test_refresh(self, saved, monkeypatch):
+        """
+        Function ``refresh``.
+        """
+        monkeypatch.setattr(
+            catalog, "snapshot", lambda cls, **kwargs: {"season": ["2020", "2019"]}
+        )
+        refreshed = catalog.refresh("out/catalog.json", ["WAR"])
+        assert refreshed.classes["WAR"] == {"season": ["2020", "2019"]}
+        assert refreshed.classes["MajorLeague"] == saved.classes["MajorLeague"]
+        assert catalog.get_catalog() is refreshed
+        assert catalog.Catalog.load("out/catalog.json").classes == refreshed.classes
+
+    def test_get_catalog(self, saved):
+        """
+        Function ``get_catalog``.
+        """
+        other = catalog.Catalog({"WAR": {"season": ["2021"]}})
+        other.save("out/other.json")
+        assert catalog.get_catalog().classes == saved.classes
+        assert catalog.get_catalog("out/other.json").classes == other.classes
+        assert catalog.get_catalog("out/other.json") is catalog.get_catalog("out/other.json")
+        assert catalog.get_catalog("out/catalog.json") is catalog.get_catalog()
+        with pytest.raises(fangraphs.exceptions.CatalogNotFound):
+            catalog.get_catalog("out/missing.json")
+
+
+class TestListOptions:
+    """
+    ``list_options`` of the classes in :py:mod:`FanGraphs.leaders.leaders` while no page is open.
+    """
+    def test_list_options(self, saved):
+        """
+        Instance method ``MajorLeague.list_options``.
+        """
+        catalog.set_catalog(catalog.Catalog.load("out/catalog.json"))
+        scraper = leaders.MajorLeague()
+        assert scraper.list_options("stat") == ["Batting", "Pitching", "Fielding"]
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            scraper.list_options("position")
+
+    def test_list_options_async(self, saved):
+        """
+        Instance method ``async_leaders.MajorLeague.list_options``.
+        """
+        scraper = async_leaders.MajorLeague()
+        options = asyncio.run(scraper.list_options("stat"))
+        assert options == ["Batting", "Pitching", "Fielding"]
+
+    def test_catalog_not_found(self, tmp_path, monkeypatch):
+        """
+        Function ``get_catalog``.
+        """
+        monkeypatch.chdir(tmp_path)
+        catalog.set_catalog(None)
+        with pytest.raises(fangraphs.exceptions.CatalogNotFound):
+            leaders.WAR().list_options("season")
+
+
+class TestValidateFilters:
+    """
+    :py:func:`FanGraphs.leaders.catalog.validate_filters`
+    """
+    def test_validate_filters(self, saved):
+        """
+        Function ``validate_filters``.
+        """
+        catalog.validate_filters("MajorLeague", {"stat": "Pitching"})
+        catalog.validate_filters("MajorLeague", {"stat": ["batting", "Fielding"]})
+        catalog.validate_filters("WAR", {"season": "1066"})
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            catalog.validate_filters("MajorLeague", {"stat": ["Batting", "Running"]})
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            catalog.validate_filters("MajorLeague", {"position": "P"})
+
+        catalog.set_catalog(None)
+        os.remove("out/catalog.json")
+        catalog.validate_filters("MajorLeague", {"stat": "Running"})
+
+    def test_configure_many(self, saved):
+        """
+        Instance method ``MajorLeague.configure_many`` while no page is open.
+        """
+        scraper = leaders.MajorLeague()
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            scraper.configure_many({"stat": "Running"})
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            asyncio.run(async_leaders.MajorLeague().configure_many({"stat": "Running"}))
+
+    def test_batch(self, saved, monkeypatch):
+        """
+        Function ``batch.export_batch_async`` and ``scheduler.schedule_async`` with an invalid job.
+        """
+        exported = []
+
+        async def fake_run_job(scraper, browser, job, path, **options):
+            exported.append(job.filters["stat"])
+
+        monkeypatch.setattr(batch, "run_job", fake_run_job)
+        jobs = [{"stat": "Pitching"}, {"stat": "Running"}]
+        results = asyncio.run(batch.export_batch_async("MajorLeague", jobs, browser=object()))
+        assert [r.ok for r in results] == [True, False]
+        assert isinstance(results[1].error, fangraphs.exceptions.InvalidFilterOption)
+        assert results[1].attempts == 0
+
+        results = asyncio.run(scheduler.schedule_async("MajorLeague", jobs, browser=object()))
+        assert [r.attempts for r in results] == [1, 0]
+        assert exported == ["Pitching", "Pitching"]
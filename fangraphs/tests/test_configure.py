@@ -0,0 +1,326 @@
+#! python3
+# tests/test_configure.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+the classes in :py:mod:`FanGraphs.leaders.leaders` being tested.
+"""
+
+import asyncio
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import async_leaders, leaders, pages, ratelimit
+from fangraphs.selectors import leaders_sel
+
+
+class FakeElement:
+    """
+    Stand-in for a ``Playwright`` element handle which records clicks on the page.
+    """
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    def click(self):
+        self.page.click(self.selector)
+
+
+class FakePage:
+    """
+    Stand-in for a synchronous ``Playwright`` page which records clicks.
+    """
+    def __init__(self):
+        self.clicks = []
+
+    def click(self, selector):
+        self.clicks.append(selector)
+
+    def query_selector(self, selector):
+        return FakeElement(self, selector) if selector == "#button-update" else None
+
+    def wait_for_selector(self, selector):
+        pass
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    configured = []
+
+    def _configure(self, query, option):
+        configured.append((query, option))
+        return True
+
+    for cls in (leaders.MajorLeague, leaders.Splits):
+        monkeypatch.setattr(cls, "_configure", _configure)
+    return configured
+
+
+class TestConfigureMany:
+    """
+    Instance method ``configure_many``.
+    """
+    def test_major_league(self, tmp_path, monkeypatch, configured):
+        """
+        Instance method ``MajorLeague.configure_many``.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = leaders.MajorLeague()
+        scraper.page = FakePage()
+        filters = {"season1": "2015", "Season2": "2019", "age1": "25", "age2": "30", "stat": "Pitching"}
+        scraper.configure_many(filters)
+        assert configured == list(filters.items())
+        assert scraper.page.clicks == ["#LeaderBoard1_btnMSeason", "#LeaderBoard1_cmdAge"]
+        assert scraper.refreshes == 1
+
+        scraper.page.clicks.clear()
+        scraper.configure_many({"season1": "2015"}, autoupdate=False)
+        assert scraper.page.clicks == []
+
+    def test_splits(self, tmp_path, monkeypatch, configured):
+        """
+        Instance method ``Splits.configure_many``.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = leaders.Splits()
+        scraper.page = FakePage()
+        scraper.configure_many({"handedness": "vs LHP", "home_away": "Home", "stat": "Pitching"})
+        assert len(configured) == 3
+        assert scraper.page.clicks == ["#button-update"]
+        assert scraper.refreshes == 1
+
+
+class TestExportGrid:
+    """
+    Function ``gray_product``.
+    Instance method ``Splits.export_grid``.
+    """
+    def test_gray_product(self):
+        """
+        Function ``gray_product``.
+        """
+        grid = {"a": [1, 2], "b": ["x", "y", "z"], "c": [True, False]}
+        combinations = leaders.gray_product(grid)
+        assert len(combinations) == 12
+        assert len({tuple(c.items()) for c in combinations}) == 12
+        for previous, current in zip(combinations, combinations[1:]):
+            assert sum(previous[q] != current[q] for q in grid) == 1
+        assert leaders.gray_product({}) == [{}]
+
+    def test_export_grid(self, tmp_path, monkeypatch):
+        """
+        Instance method ``Splits.export_grid``.
+        """
+        monkeypatch.chdir(tmp_path)
+        toggles = []
+        exports = []
+
+        def _configure(self, query, option):
+            toggles.append((query, option))
+            self._record(query, option, multiple=query in leaders_sel.Splits.splits)
+            return True
+
+        monkeypatch.setattr(leaders.Splits, "_configure", _configure)
+        monkeypatch.setattr(leaders.Splits, "_read_option", lambda self, query: [])
+        monkeypatch.setattr(leaders.Splits, "export", lambda self, path: exports.append(path))
+        scraper = leaders.Splits()
+        scraper.page = FakePage()
+        grid = {
+            "handedness": [["vs L", "as R"], ["vs R"]],
+            "home_away": ["Home", "Away"],
+        }
+        results = scraper.export_grid(grid, "out/grid", format="parquet")
+
+        assert [c for c, _ in results] == [
+            {"handedness": ["vs L", "as R"], "home_away": "Home"},
+            {"handedness": ["vs L", "as R"], "home_away": "Away"},
+            {"handedness": ["vs R"], "home_away": "Away"},
+            {"handedness": ["vs R"], "home_away": "Home"},
+        ]
+        assert toggles == [
+            ("handedness", "vs L"), ("handedness", "as R"), ("home_away", "Home"),
+            ("home_away", "Away"), ("home_away", "home"),
+            ("handedness", "vs R"), ("handedness", "as r"), ("handedness", "vs l"),
+            ("home_away", "Home"), ("home_away", "away"),
+        ]
+        assert scraper.page.clicks.count("#button-update") == 4
+        assert exports == [p for _, p in results]
+        assert exports[0] == "out/grid/handedness-vs-L+as-R_home_away-Home.parquet"
+
+    def test_export_grid_page_options(self, tmp_path, monkeypatch):
+        """
+        Instance method ``Splits.export_grid`` with options selected by the page.
+        """
+        monkeypatch.chdir(tmp_path)
+        toggles = []
+        page_options = {"time_filter": ["2021"], "home_away": ["Home"]}
+
+        def _configure(self, query, option):
+            toggles.append((query, option))
+            self._record(query, option, multiple=True)
+            return True
+
+        monkeypatch.setattr(leaders.Splits, "_configure", _configure)
+        monkeypatch.setattr(leaders.Splits, "_read_option", lambda self, query: page_options[query])
+        monkeypatch.setattr(leaders.Splits, "export", lambda self, path: None)
+        scraper = leaders.Splits()
+        scraper.page = FakePage()
+
+        scraper.export_grid({"time_filter": [["2019"]]})
+        assert toggles == [("time_filter", "2019"), ("time_filter", "2021")]
+        assert scraper.filters["time_filter"] == ["2019"]
+        assert scraper.page.clicks.count("#button-update") == 1
+
+        toggles.clear()
+        scraper.export_grid({"home_away": ["Home"]})
+        assert toggles == []
+        assert scraper.page.clicks.count("#button-update") == 1
+
+
+class TestQuickSplits:
+    """
+    Instance method ``Splits.export_quick_splits``.
+    """
+    def test_setup(self, monkeypatch):
+        """
+        Instance method ``Splits.__enter__`` with ``setup=False``.
+        """
+        calls = []
+        monkeypatch.setattr(leaders.Splits, "_browser_init", lambda self: None)
+        monkeypatch.setattr(leaders.Splits, "reset", lambda self: None)
+        monkeypatch.setattr(leaders.Splits, "quit", lambda self: None)
+        monkeypatch.setattr(leaders.Splits, "set_filter_group", lambda self, g: calls.append(g))
+        monkeypatch.setattr(
+            leaders.Splits, "configure", lambda self, q, o, autoupdate: calls.append(q)
+        )
+        with leaders.Splits(setup=False):
+            pass
+        assert calls == []
+        with leaders.Splits():
+            pass
+        assert calls == ["Show All", "auto_pt"]
+
+    def test_export_quick_splits(self, tmp_path, monkeypatch):
+        """
+        Instance method ``Splits.export_quick_splits``.
+        """
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        monkeypatch.setattr(
+            leaders.Splits, "set_to_quick_split", lambda self, q: calls.append(("set", q))
+        )
+        monkeypatch.setattr(leaders.Splits, "export", lambda self, path: calls.append(("export", path)))
+        scraper = leaders.Splits(setup=False)
+        quick_splits = leaders.Splits.list_quick_splits()[:2]
+        with pytest.raises(fangraphs.exceptions.InvalidQuickSplit):
+            scraper.export_quick_splits([quick_splits[0], "vs Martians"])
+        assert calls == []
+
+        exports = scraper.export_quick_splits(quick_splits, "out/quick", format="arrow")
+        assert [q for q, _ in exports] == quick_splits
+        assert all(p.startswith("out/quick/") and p.endswith(".arrow") for _, p in exports)
+        assert calls == [
+            ("set", quick_splits[0]), ("export", exports[0][1]),
+            ("set", quick_splits[1]), ("export", exports[1][1]),
+        ]
+
+    def test_set_to_quick_split_throttle(self, tmp_path, monkeypatch):
+        """
+        Instance method ``Splits.set_to_quick_split`` taking a token of the rate limiter.
+        """
+        monkeypatch.chdir(tmp_path)
+        limiter = ratelimit.RateLimiter(path=str(tmp_path / "bucket"))
+        scraper = leaders.Splits(setup=False, limiter=limiter)
+        clicks = []
+        scraper.page = type("Page", (), {
+            "click": lambda page, selector: clicks.append(selector),
+            "query_selector": lambda page, selector: None,
+        })()
+        scraper.set_to_quick_split("vs_lhp", autoupdate=False)
+        assert len(clicks) == 1
+        assert limiter.acquired == 1
+
+    def test_export_quick_splits_pages(self, tmp_path, monkeypatch):
+        """
+        Instance method ``Splits.export_quick_splits`` of :py:mod:`FanGraphs.leaders.async_leaders`.
+        """
+        monkeypatch.chdir(tmp_path)
+        sessions = []
+        Splits = async_leaders.Splits
+
+        async def noop(self, *args):
+            pass
+
+        async def aenter(self):
+            sessions.append(self)
+            self.exported = []
+            return self
+
+        async def export(self, path):
+            self.exported.append(path)
+            await asyncio.sleep(0)
+
+        for name in ("set_to_quick_split", "__aexit__"):
+            monkeypatch.setattr(Splits, name, noop)
+        monkeypatch.setattr(Splits, "__aenter__", aenter)
+        monkeypatch.setattr(Splits, "export", export)
+
+        limiter = object()
+
+        async def run():
+            async with Splits(browser=object(), limiter=limiter, timeout=5, verify=True) as scraper:
+                return await scraper.export_quick_splits(pages=3)
+
+        exports = asyncio.run(run())
+        assert [q for q, _ in exports] == Splits.list_quick_splits()
+        assert len(sessions) == 3
+        assert all(not s.setup for s in sessions[1:])
+        assert all((s.limiter, s.timeout, s.verify) == (limiter, 5, True) for s in sessions)
+        assert sorted(p for s in sessions for p in s.exported) == sorted(p for _, p in exports)
+
+
+class TestPages:
+    """
+    :py:mod:`FanGraphs.leaders.pages`
+    """
+    def test_shared(self):
+        """
+        The classes of :py:mod:`FanGraphs.leaders.pages`, shared by
+        :py:mod:`FanGraphs.leaders.leaders` and :py:mod:`FanGraphs.leaders.async_leaders`.
+        """
+        for name in ("GameSpan", "International", "MajorLeague", "SeasonStat", "Splits", "WAR"):
+            sync, async_ = getattr(leaders, name), getattr(async_leaders, name)
+            assert sync.__mro__[1] is async_.__mro__[1] is getattr(pages, f"{name}Page")
+            assert sync.list_queries() == async_.list_queries()
+
+    def test_filter(self, tmp_path, monkeypatch):
+        """
+        Instance methods ``FilterUtilities._filter`` and ``FilterUtilities._switch_option``.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = leaders.Splits()
+        scraper._compile_selectors()
+        assert scraper._filter("Split_Teams").selector == leaders_sel.Splits.switches["split_teams"]
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            scraper._filter("color")
+        assert scraper._switch_option("true") == "True"
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            scraper._switch_option("maybe")
+
+    def test_buttons(self):
+        """
+        Class method ``MajorLeaguePage._buttons``.
+        """
+        assert pages.MajorLeaguePage._buttons(["Season1", "season2", "age1", "stat"]) == [
+            "#LeaderBoard1_btnMSeason", "#LeaderBoard1_cmdAge"
+        ]
+
+    def test_quick_splits(self):
+        """
+        Class methods ``SplitsPage._quick_split`` and ``SplitsPage._check_quick_splits``.
+        """
+        assert pages.SplitsPage._check_quick_splits(["Batting_Home"]) == ["batting_home"]
+        assert pages.SplitsPage._quick_split("batting_home")[1] == leaders_sel.Splits.quick_splits["batting_home"]
+        with pytest.raises(fangraphs.exceptions.InvalidQuickSplit):
+            pages.SplitsPage._check_quick_splits(["vs Martians"])
@@ -0,0 +1,240 @@
+#! python3
+# tests/test_http_leaders.py
+
+"""
+The docstring in each class identifies the class in :py:mod:`FanGraphs.leaders.http_leaders` being tested.
+The docstring in each test identifies the class attribute(s)/method(s) being tested.
+
+The scrapers are tested against a local HTTP stand-in serving recorded pages from *tests/data/*.
+"""
+
+import csv
+import http.server
+import os
+import threading
+from urllib.parse import urlparse, parse_qs, parse_qsl
+
+import pytest
+import requests
+
+import fangraphs.exceptions
+from fangraphs.leaders import cache, http_leaders, ratelimit, urls
+from fangraphs.selectors import leaders_params
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+class RecordedPages(http.server.BaseHTTPRequestHandler):
+    """
+    Serves the recorded page named by the path of each request.
+    """
+    requests = []
+    viewstate = "dDwtMTA4NzIzNzE="
+    #: The status which rejects a postback with stale state, or ``None`` to answer with the page itself
+    reject_status = None
+
+    def _send(self, body, content_type, headers=()):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for header in headers:
+            self.send_header(*header)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path))
+        path = os.path.join(DATA, f"{urlparse(self.path).path.strip('/')}.html")
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as file:
+            self._send(file.read(), "text/html; charset=utf-8")
+
+    def do_POST(self):
+        """
+        Answers a valid **Export Data** postback with a CSV file,
+        and any other postback with the page itself.
+        """
+        self.requests.append(("POST", self.path))
+        length = int(self.headers["Content-Length"])
+        form = dict(parse_qsl(self.rfile.read(length).decode()))
+        if (form.get("__VIEWSTATE") != self.viewstate
+                or form.get("__EVENTTARGET") != "LeaderBoard1$cmdCSV"):
+            if self.reject_status is not None:
+                self.send_error(self.reject_status)
+                return
+            self.do_GET()
+            return
+        self._send(
+            b"Name,Team,HR,AVG,playerid\r\nMike Trout,Angels,17,.281,10155\r\n",
+            "text/csv", [("Content-Disposition", "attachment; filename=FanGraphs.csv")]
+        )
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RecordedPages)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+class TestMajorLeague:
+    """
+    :py:class:`FanGraphs.leaders.http_leaders.MajorLeague`
+    """
+    def test_query_params(self):
+        """
+        Class method ``MajorLeague.query_params``.
+        """
+        params = http_leaders.MajorLeague.query_params({
+            "stat": "Pitching", "team": "LAD", "group": "Team Stats",
+            "season1": 2015, "season2": 2020, "split_seasons": "True", "age2": 30
+        })
+        assert params["stats"] == "pit"
+        assert params["team"] == "22,ts"
+        assert (params["season1"], params["season"]) == ("2015", "2020")
+        assert params["ind"] == "1"
+        assert params["age"] == "14,30"
+        assert params["page"] == "1_100000"
+        assert http_leaders.MajorLeague.query_params({"single_season": 2019})["season1"] == "2019"
+        assert http_leaders.WAR.query_params({"season": 2020}) == urls.query_params(
+            leaders_params.WAR, {"season": 2020}
+        )
+
+    def test_configure(self):
+        """
+        Instance method ``MajorLeague.configure``.
+        """
+        scraper = http_leaders.MajorLeague()
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            scraper.configure("hof", "True")
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            scraper.configure("stat", "Running")
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            http_leaders.WAR().configure("team", "Angels")
+        scraper.configure("Stat", "Pitching")
+        assert scraper.current_option("stat") == "pitching"
+        assert scraper.current_option("team") is None
+
+    def test_export(self, server, tmp_path, monkeypatch):
+        """
+        Instance method ``MajorLeague.export``.
+        """
+        monkeypatch.chdir(tmp_path)
+        with http_leaders.MajorLeague(address=f"{server}/leaders.aspx") as scraper:
+            scraper.configure("team", "Angels")
+            path = scraper.export("out/angels.csv")
+        query = parse_qs(urlparse(RecordedPages.requests[-1][1]).query)
+        assert query["team"] == ["1"]
+        with open(path, newline="") as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == ["Name", "Team", "HR", "AVG", "playerid"]
+        assert rows[1] == ["Mike Trout", "Angels", "17", ".281", "10155"]
+        assert len(rows) == 3
+
+    def test_export_cached(self, server, tmp_path, monkeypatch):
+        """
+        Instance method ``MajorLeague.export`` with a ``cache``.
+        """
+        monkeypatch.chdir(tmp_path)
+        RecordedPages.requests.clear()
+        export_cache = cache.ExportCache(current_season=2021)
+        scraper = http_leaders.MajorLeague(address=f"{server}/leaders.aspx", cache=export_cache)
+        scraper.configure("single_season", "2019")
+        scraper.export("out/first.csv")
+        scraper.export("out/second.csv")
+        assert len(RecordedPages.requests) == 1
+        assert (export_cache.hits, export_cache.misses) == (1, 1)
+        with open("out/first.csv") as first, open("out/second.csv") as second:
+            assert first.read() == second.read()
+
+    def test_rate_limited(self, server, tmp_path):
+        """
+        Instance method ``MajorLeague.export`` with a ``limiter``.
+        """
+        limiter = ratelimit.RateLimiter(rate=100, burst=1, path=str(tmp_path / "bucket"))
+        scraper = http_leaders.MajorLeague(address=f"{server}/leaders.aspx", limiter=limiter)
+        for _ in range(3):
+            scraper.export(str(tmp_path / "out.csv"))
+        assert limiter.acquired == 3
+        assert limiter.waited > 0.0
+
+    def test_table_not_found(self, server):
+        """
+        Function ``parse_table``.
+        """
+        with pytest.raises(fangraphs.exceptions.TableNotFound):
+            http_leaders.parse_table("<html></html>", "#LeaderBoard1_dg1_ctl00")
+
+    def test_export_postback(self, server, tmp_path, monkeypatch):
+        """
+        Instance method ``MajorLeague.export`` with ``postback=True``.
+        The hidden-field state is requested once and reused by successive exports,
+        including exports of other filter configurations.
+        """
+        monkeypatch.chdir(tmp_path)
+        RecordedPages.requests.clear()
+        scraper = http_leaders.MajorLeague(address=f"{server}/leaders.aspx", postback=True)
+        paths = []
+        for stat in ("Batting", "Pitching", "Fielding"):
+            scraper.configure("stat", stat)
+            paths.append(scraper.export(f"out/{stat}.csv"))
+        methods = [method for method, _ in RecordedPages.requests]
+        assert methods == ["GET", "POST", "POST", "POST"]
+        assert [parse_qs(urlparse(p).query)["stats"] for _, p in RecordedPages.requests[1:]] == [
+            ["bat"], ["pit"], ["fld"]
+        ]
+        assert (scraper.state_requests, scraper.postbacks) == (1, 3)
+        with open(paths[-1], newline="") as file:
+            rows = list(csv.reader(file))
+        assert rows[1] == ["Mike Trout", "Angels", "17", ".281", "10155"]
+
+    def test_fetch_table(self, server):
+        """
+        Instance method ``MajorLeague.fetch_table``.
+        """
+        for postback in (False, True):
+            scraper = http_leaders.MajorLeague(address=f"{server}/leaders.aspx", postback=postback)
+            columns = scraper.fetch_table()
+            assert columns["Name"][0] == "Mike Trout"
+            assert columns["HR"][0] == 17
+            assert columns["AVG"][0] == 0.281
+
+    def test_export_postback_stale_state(self, server, tmp_path, monkeypatch):
+        """
+        Instance method ``MajorLeague.export`` with ``postback=True``.
+        Rejected hidden-field state is requested again before the postback is retried.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = http_leaders.MajorLeague(address=f"{server}/leaders.aspx", postback=True)
+        scraper.export("out/first.csv")
+        monkeypatch.setattr(RecordedPages, "viewstate", "changed")
+        with pytest.raises(fangraphs.exceptions.PostbackRejected):
+            scraper.export("out/second.csv")
+        assert scraper.state_requests == 2
+
+    def test_export_postback_error_status(self, server, tmp_path, monkeypatch):
+        """
+        Instance method ``MajorLeague.export`` with ``postback=True``.
+        Stale hidden-field state rejected with an error status is requested again before the postback is retried.
+        """
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(RecordedPages, "reject_status", 500)
+        RecordedPages.requests.clear()
+        scraper = http_leaders.MajorLeague(address=f"{server}/leaders.aspx", postback=True)
+        scraper._HTTPScrapingUtilities__form_state = {"__VIEWSTATE": "stale"}
+        path = scraper.export("out/refreshed.csv")
+        assert [method for method, _ in RecordedPages.requests] == ["POST", "GET", "POST"]
+        assert (scraper.state_requests, scraper.postbacks) == (1, 2)
+        with open(path, newline="") as file:
+            assert list(csv.reader(file))[1][0] == "Mike Trout"
+
+        monkeypatch.setattr(RecordedPages, "viewstate", "changed")
+        with pytest.raises(requests.HTTPError):
+            scraper.export("out/rejected.csv")
@@ -0,0 +1,110 @@
+#! python3
+# tests/test_incremental.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:mod:`FanGraphs.leaders.incremental` being tested.
+"""
+
+import csv
+import os
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import batch, incremental
+
+
+@pytest.fixture
+def board(tmp_path, monkeypatch):
+    """
+    Replaces the browser export of each partition with a CSV file of the current ``WAR`` of each season.
+    """
+    monkeypatch.chdir(tmp_path)
+    state = {"war": {2019: "1.0", 2020: "2.0", 2021: "3.0"}, "jobs": [], "fail": set()}
+
+    async def fake_run_job(scraper, browser, job, path, **options):
+        season = int(job.filters["season1"])
+        state["jobs"].append(season)
+        if season in state["fail"]:
+            raise ValueError(season)
+        with open(path, "w", newline="") as file:
+            csv.writer(file).writerows([["Season", "WAR"], [str(season), state["war"][season]]])
+
+    monkeypatch.setattr(batch, "run_job", fake_run_job)
+    return state
+
+
+def _read(path):
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+
+class TestIncremental:
+    """
+    :py:mod:`FanGraphs.leaders.incremental`
+    """
+    def test_refresh(self, board):
+        """
+        Function ``refresh_async``.
+        Instance methods ``PartitionStore.is_open`` and ``PartitionStore.put``.
+        """
+        store = incremental.PartitionStore(current_season=2021)
+
+        def refresh():
+            return incremental.refresh(
+                "MajorLeague", {"stat": "Pitching"}, 2019, 2021, "out/mlb.csv",
+                store=store, browser=object()
+            )
+
+        result = refresh()
+        assert result["fetched"] == result["changed"] == [2019, 2020, 2021]
+        assert result["rewritten"]
+        assert _read("out/mlb.csv") == [["Season", "WAR"], ["2019", "1.0"], ["2020", "2.0"], ["2021", "3.0"]]
+
+        modified = os.path.getmtime("out/mlb.csv")
+        result = refresh()
+        assert (result["fetched"], result["changed"], result["rewritten"]) == ([2021], [], False)
+        assert os.path.getmtime("out/mlb.csv") == modified
+
+        board["war"][2021] = "3.5"
+        result = refresh()
+        assert (result["fetched"], result["changed"], result["rewritten"]) == ([2021], [2021], True)
+        assert _read("out/mlb.csv")[-1] == ["2021", "3.5"]
+        assert board["jobs"] == [2019, 2020, 2021, 2021, 2021]
+
+        reopened = incremental.PartitionStore(current_season=2021)
+        assert len(reopened.manifest["partitions"]) == 3
+        assert not reopened.is_open("MajorLeague", {"stat": "pitching"}, 2020)
+        assert reopened.is_open("MajorLeague", {"stat": "Pitching"}, 2021)
+        assert reopened.is_open("MajorLeague", {"stat": "Batting"}, 2020)
+
+    def test_refresh_failed(self, board):
+        """
+        Function ``refresh_async`` with a failing partition.
+        """
+        store = incremental.PartitionStore(current_season=2022)
+        board["fail"].add(2020)
+        with pytest.raises(fangraphs.exceptions.ShardsFailed):
+            incremental.refresh("International", {}, 2019, 2021, "out/kbo.csv", store=store, browser=object())
+        board["fail"].clear()
+        result = incremental.refresh("International", {}, 2019, 2021, "out/kbo.csv", store=store, browser=object())
+        assert result["fetched"] == [2020]
+        assert len(_read(result["path"])) == 4
+
+    def test_refresh_default_path(self, board):
+        """
+        Function ``refresh_async`` without a path.
+        Instance method ``PartitionStore.output_path``.
+        """
+        store = incremental.PartitionStore(current_season=2021)
+        results = [
+            incremental.refresh("MajorLeague", {"stat": "Pitching"}, 2019, 2021, store=store, browser=object())
+            for _ in range(2)
+        ]
+        path = store.output_path("MajorLeague", {"Stat": "pitching"}, 2019, 2021)
+        assert results[0]["path"] == results[1]["path"] == path
+        assert os.path.dirname(path) == os.path.join(store.directory, "outputs")
+        assert (results[0]["rewritten"], results[1]["rewritten"]) == (True, False)
+        assert list(store.manifest["outputs"]) == [os.path.abspath(path)]
+        assert path != store.output_path("MajorLeague", {"stat": "Pitching"}, 2020, 2021)
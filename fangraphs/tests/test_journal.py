@@ -0,0 +1,121 @@
+#! python3
+# tests/test_journal.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s)/function(s) of
+:py:mod:`FanGraphs.leaders.journal` being tested.
+"""
+
+import asyncio
+import os
+
+from fangraphs.leaders import batch
+from fangraphs.leaders import journal
+from fangraphs.leaders import scheduler
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+    return path
+
+
+class TestJobJournal:
+    """
+    :py:class:`FanGraphs.leaders.journal.JobJournal`
+    """
+    def test_partial_path(self):
+        """
+        Function ``partial_path``.
+        """
+        assert journal.partial_path("out/a.csv") == "out/a.partial.csv"
+        assert journal.partial_path("out/a.parquet") == "out/a.partial.parquet"
+
+    def test_complete(self, tmp_path):
+        """
+        Methods ``add``, ``complete``, ``is_complete`` and ``entries``.
+        """
+        path = str(tmp_path / "pitching.csv")
+        filters = {"stat": "Pitching"}
+        with journal.JobJournal(str(tmp_path / "journal.sqlite3")) as jobs:
+            jobs.add("MajorLeague", filters, path)
+            jobs.add("MajorLeague", {"Stat": "pitching"}, path)
+            assert len(jobs.entries()) == 1
+            assert jobs.get("MajorLeague", filters, path)["status"] == "pending"
+            assert not jobs.is_complete("MajorLeague", filters, path)
+
+            source = _write(journal.partial_path(path), "Name,WAR\nGerrit Cole,6.9\n")
+            jobs.complete("MajorLeague", filters, path, source, attempts=2)
+            assert not os.path.exists(source)
+            assert jobs.is_complete("MajorLeague", filters, path)
+            assert jobs.entries("complete")[0]["attempts"] == 2
+
+            _write(path, "Name,WAR\n")
+            assert not jobs.is_complete("MajorLeague", filters, path)
+
+    def test_persistence(self, tmp_path):
+        """
+        Method ``fail`` and reopening the database.
+        """
+        database = str(tmp_path / "journal.sqlite3")
+        with journal.JobJournal(database) as jobs:
+            jobs.add("Splits", {"split_teams": "True"}, "out/a.csv")
+            jobs.fail("Splits", {"split_teams": "True"}, "out/a.csv", RuntimeError("Stalled"), attempts=3)
+        with journal.JobJournal(database) as jobs:
+            entry = jobs.get("Splits", {"split_teams": "True"}, "out/a.csv")
+            assert entry["status"] == "failed"
+            assert entry["attempts"] == 3
+            assert "Stalled" in entry["error"]
+
+
+class TestExportResumable:
+    """
+    :py:func:`FanGraphs.leaders.journal.export_resumable_async`
+    """
+    def test_resume(self, tmp_path, monkeypatch):
+        """
+        Function ``export_resumable_async`` interrupted and run again.
+        """
+        exported = []
+        broken = {"2015"}
+
+        async def fake_run_job(scraper, browser, job, path, **options):
+            if job.filters["season"] in broken:
+                _write(path, "Name,")
+                raise RuntimeError("Connection reset")
+            exported.append(job.filters["season"])
+            _write(path, f"Season\n{job.filters['season']}\n")
+
+        monkeypatch.setattr(batch, "run_job", fake_run_job)
+        jobs = [
+            {"filters": {"season": str(year)}, "path": str(tmp_path / f"{year}.csv")}
+            for year in range(2013, 2018)
+        ]
+        database = str(tmp_path / "journal.sqlite3")
+        retry = scheduler.RetryPolicy(0)
+
+        with journal.JobJournal(database) as jobs_journal:
+            results = asyncio.run(journal.export_resumable_async(
+                "MajorLeague", jobs, journal=jobs_journal, retry=retry, browser=object()
+            ))
+        assert [r.ok for r in results] == [True, True, False, True, True]
+        assert not os.path.exists(tmp_path / "2015.csv")
+        assert not os.path.exists(tmp_path / "2015.partial.csv")
+        assert sorted(os.listdir(tmp_path)) == [
+            "2013.csv", "2014.csv", "2016.csv", "2017.csv", "journal.sqlite3"
+        ]
+
+        broken.clear()
+        exported.clear()
+        with journal.JobJournal(database) as jobs_journal:
+            results = asyncio.run(journal.export_resumable_async(
+                "MajorLeague", jobs, journal=jobs_journal, retry=retry, browser=object()
+            ))
+            assert exported == ["2015"]
+            assert [r.attempts for r in results] == [0, 0, 1, 0, 0]
+            assert all(r.ok for r in results)
+            assert [r.path for r in results] == [j["path"] for j in jobs]
+            assert len(jobs_journal.entries("complete")) == 5
+            assert jobs_journal.entries()[2]["attempts"] == 2
+        with open(tmp_path / "2015.csv", encoding="utf-8") as file:
+            assert file.read() == "Season\n2015\n"
@@ -0,0 +1,117 @@
+#! python3
+# tests/test_pool.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:class:`FanGraphs.leaders.pool.BrowserPool` being tested.
+"""
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import pool
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    def new_page(self):
+        return object()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+        self.browsers = []
+        self.stopped = False
+
+    def start(self):
+        return self
+
+    def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_play(monkeypatch, tmp_path):
+    play = FakePlaywright()
+    monkeypatch.setattr(pool, "sync_playwright", lambda: play)
+    monkeypatch.chdir(tmp_path)
+    return play
+
+
+class TestBrowserPool:
+    """
+    :py:class:`FanGraphs.leaders.pool.BrowserPool`
+    """
+    def test_acquire_reuses_browser(self, fake_play):
+        """
+        Instance methods ``BrowserPool.acquire`` and ``BrowserPool.release``.
+        """
+        browsers = pool.BrowserPool(max_pages=4)
+        pages = [browsers.acquire() for _ in range(4)]
+        assert browsers.launches == 1
+        assert browsers.leased == 4
+        for page in pages:
+            browsers.release(page)
+        assert browsers.leased == 0
+        assert all(c.closed for c in fake_play.browsers[0].contexts)
+        browsers.acquire()
+        assert browsers.launches == 1
+
+    def test_size_limits(self, fake_play):
+        """
+        Instance method ``BrowserPool.acquire``.
+        """
+        browsers = pool.BrowserPool(max_browsers=2, max_pages=2)
+        for _ in range(4):
+            browsers.acquire()
+        assert browsers.launches == 2
+        with pytest.raises(fangraphs.exceptions.BrowserPoolExhausted):
+            browsers.acquire()
+
+    def test_idle_eviction(self, fake_play):
+        """
+        Instance method ``BrowserPool.evict``.
+        """
+        browsers = pool.BrowserPool(idle_timeout=0)
+        browsers.release(browsers.acquire())
+        assert len(browsers) == 0
+        assert fake_play.stopped
+
+    def test_health_check(self, fake_play):
+        """
+        Instance method ``BrowserPool.evict``.
+        """
+        browsers = pool.BrowserPool()
+        browsers.acquire()
+        fake_play.browsers[0].connected = False
+        browsers.acquire()
+        assert browsers.launches == 2
+        assert browsers.leased == 1
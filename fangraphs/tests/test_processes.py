@@ -0,0 +1,44 @@
+#! python3
+# tests/test_processes.py
+
+"""
+The docstring in each test identifies the function(s) of
+:py:mod:`FanGraphs.leaders.processes` being tested.
+"""
+
+import json
+
+from fangraphs.leaders import leaders
+from fangraphs.leaders import processes
+
+
+class TestExportSharded:
+    """
+    :py:func:`FanGraphs.leaders.processes.export_sharded`
+    """
+    def test_from_spec(self):
+        """
+        Class method ``ShardJob.from_spec``.
+        """
+        job = processes.ShardJob.from_spec(
+            (leaders.WAR, {"season": "2019"}, "out/war.csv")
+        )
+        assert job.scraper == "WAR"
+        job = processes.ShardJob.from_spec({"scraper": "Splits"})
+        assert job.filters == {} and job.path == ""
+
+    def test_manifest(self, tmp_path, monkeypatch):
+        """
+        Function ``export_sharded``.
+        Jobs which fail are recorded in the manifest without stopping the batch.
+        """
+        monkeypatch.chdir(tmp_path)
+        jobs = [("Projections", {"season": str(y)}, "") for y in range(3)]
+        records = processes.export_sharded(
+            jobs, processes=2, manifest="out/manifest.json"
+        )
+        assert [r["index"] for r in records] == [0, 1, 2]
+        assert all(r["error"].startswith("AttributeError") for r in records)
+        with open("out/manifest.json") as file:
+            manifest = json.load(file)
+        assert manifest["jobs"] == records
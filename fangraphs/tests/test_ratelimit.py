@@ -0,0 +1,105 @@
+#! python3
+# tests/test_ratelimit.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:mod:`FanGraphs.leaders.ratelimit` being tested.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import threading
+import time
+
+import pytest
+
+from fangraphs.leaders import ratelimit
+
+
+def _acquire_many(limiter, count):
+    for _ in range(count):
+        limiter.acquire()
+    return limiter.waited
+
+
+class TestRateLimiter:
+    """
+    :py:class:`FanGraphs.leaders.ratelimit.RateLimiter`
+    """
+    def test_acquire(self, tmp_path):
+        """
+        Instance methods ``RateLimiter.acquire`` and ``RateLimiter.stats``.
+        """
+        limiter = ratelimit.RateLimiter(rate=20, burst=2, path=str(tmp_path / "bucket"))
+        assert limiter.acquire() == limiter.acquire() == 0.0
+        start = time.monotonic()
+        wait = limiter.acquire()
+        assert 0.0 < wait <= 0.05
+        assert time.monotonic() - start >= wait * 0.9
+        stats = limiter.stats()
+        assert stats["acquired"] == 3
+        assert stats["max_wait"] == stats["waited"] == wait
+
+    def test_acquire_async(self, tmp_path):
+        """
+        Instance method ``RateLimiter.acquire_async``.
+        """
+        limiter = ratelimit.RateLimiter(rate=50, burst=1, path=str(tmp_path / "bucket"))
+
+        async def run():
+            return await asyncio.gather(*(limiter.acquire_async() for _ in range(5)))
+
+        start = time.monotonic()
+        waits = asyncio.run(run())
+        assert sorted(waits)[0] == 0.0
+        assert max(waits) == pytest.approx(4 / 50, abs=0.02)
+        assert time.monotonic() - start >= 3 / 50
+
+    def test_acquire_async_executor(self, tmp_path, monkeypatch):
+        """
+        Instance method ``RateLimiter.acquire_async`` updating the state file off the event loop.
+        """
+        limiter = ratelimit.RateLimiter(path=str(tmp_path / "bucket"))
+        threads = []
+        reserve = limiter._reserve
+
+        def record(tokens):
+            threads.append(threading.current_thread())
+            return reserve(tokens)
+
+        monkeypatch.setattr(limiter, "_reserve", record)
+        asyncio.run(limiter.acquire_async())
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_shared_between_processes(self, tmp_path):
+        """
+        Instance method ``RateLimiter.acquire`` from several processes.
+        """
+        limiter = ratelimit.RateLimiter(rate=50, burst=1, path=str(tmp_path / "bucket"))
+        limiter = pickle.loads(pickle.dumps(limiter))
+        context = multiprocessing.get_context("spawn")
+        start = time.monotonic()
+        with context.Pool(2) as workers:
+            waited = workers.starmap(_acquire_many, [(limiter, 5), (limiter, 5)])
+        assert time.monotonic() - start >= 9 / 50
+        assert sum(waited) > 0.0
+
+    def test_invalid(self, tmp_path):
+        """
+        Instance method ``RateLimiter.__init__``.
+        """
+        with pytest.raises(ValueError):
+            ratelimit.RateLimiter(rate=0, path=str(tmp_path / "bucket"))
+
+    def test_default_limiter(self, tmp_path):
+        """
+        Functions ``get_limiter`` and ``set_limiter``.
+        """
+        assert ratelimit.get_limiter() is None
+        limiter = ratelimit.RateLimiter(path=str(tmp_path / "bucket"))
+        ratelimit.set_limiter(limiter)
+        try:
+            assert ratelimit.get_limiter() is limiter
+        finally:
+            ratelimit.set_limiter(None)
@@ -0,0 +1,71 @@
+#! python3
+# tests/test_resources.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:class:`FanGraphs.leaders.resources.ResourceFilter` being tested.
+"""
+
+import pytest
+
+from fangraphs.leaders import resources
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = self
+        self.url = url
+        self.resource_type = resource_type
+        self.outcome = None
+
+    def continue_(self):
+        self.outcome = "continue"
+
+    def abort(self):
+        self.outcome = "abort"
+
+
+class TestResourceFilter:
+    """
+    :py:class:`FanGraphs.leaders.resources.ResourceFilter`
+    """
+    @pytest.mark.parametrize(
+        "url, resource_type, allowed",
+        [
+            ("https://www.fangraphs.com/leaders.aspx", "document", True),
+            ("https://cdn.fangraphs.com/app.js", "script", True),
+            ("https://www.fangraphs.com/logo.png", "image", False),
+            ("https://fonts.gstatic.com/font.woff2", "font", False),
+            ("https://g.ezoic.net/ezosuigeneris.js", "script", False),
+            ("https://securepubads.g.doubleclick.net/tag.js", "script", False),
+            ("https://notdoubleclick.net/app.js", "script", True),
+        ]
+    )
+    def test_allows(self, url, resource_type, allowed):
+        """
+        Instance method ``ResourceFilter.allows``.
+        """
+        assert resources.ResourceFilter().allows(url, resource_type) is allowed
+
+    def test_allow_list(self):
+        """
+        Instance method ``ResourceFilter.allows``.
+        """
+        res_filter = resources.ResourceFilter(allow=["fangraphs.com"])
+        assert res_filter.allows("https://www.fangraphs.com/logo.png", "image")
+
+    def test_handle(self):
+        """
+        Instance method ``ResourceFilter.handle``.
+        """
+        res_filter = resources.ResourceFilter()
+        routes = [
+            FakeRoute("https://www.fangraphs.com/leaders.aspx", "document"),
+            FakeRoute("https://www.fangraphs.com/logo.png", "image")
+        ]
+        for route in routes:
+            res_filter.handle(route)
+        assert [r.outcome for r in routes] == ["continue", "abort"]
+        assert (res_filter.allowed, res_filter.blocked) == (1, 1)
+        assert res_filter.blocks_ads
+        assert not resources.ResourceFilter(deny=()).blocks_ads
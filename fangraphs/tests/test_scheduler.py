@@ -0,0 +1,155 @@
+#! python3
+# tests/test_scheduler.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s)/function(s) of
+:py:mod:`FanGraphs.leaders.scheduler` being tested.
+"""
+
+import asyncio
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import batch
+from fangraphs.leaders import scheduler
+
+
+class TestRetryPolicy:
+    """
+    :py:class:`FanGraphs.leaders.scheduler.RetryPolicy`
+    """
+    def test_should_retry(self):
+        """
+        Method ``should_retry``.
+        """
+        retry = scheduler.RetryPolicy(2)
+        assert retry.should_retry(1, ValueError())
+        assert retry.should_retry(2, ValueError())
+        assert not retry.should_retry(3, ValueError())
+        assert not retry.should_retry(1, fangraphs.exceptions.InvalidFilterOption("Fielding"))
+
+    def test_delay(self):
+        """
+        Method ``delay``.
+        """
+        retry = scheduler.RetryPolicy(base=1.0, cap=5.0)
+        for attempts, bound in ((1, 1.0), (2, 2.0), (3, 4.0), (10, 5.0)):
+            delays = [retry.delay(attempts) for _ in range(50)]
+            assert all(0 <= d <= bound for d in delays)
+            assert len(set(delays)) > 1
+
+
+class TestAdaptiveConcurrency:
+    """
+    :py:class:`FanGraphs.leaders.scheduler.AdaptiveConcurrency`
+    """
+    def test_increase(self):
+        """
+        Method ``record`` with successful attempts at a steady latency.
+        """
+        controller = scheduler.AdaptiveConcurrency(2, maximum=4, window=2)
+        for _ in range(8):
+            controller.record(1.0, True)
+        assert controller.history == [2, 3, 4, 4, 4]
+        assert controller.limit == 4
+
+    def test_decrease(self):
+        """
+        Method ``record`` with failed and slow attempts.
+        """
+        controller = scheduler.AdaptiveConcurrency(4, maximum=8, window=2)
+        controller.record(1.0, True)
+        controller.record(1.0, False)
+        assert controller.limit == 2
+        controller.record(1.0, True)
+        controller.record(1.0, True)
+        assert controller.limit == 3
+        assert controller.target() == 2.0
+        controller.record(3.0, True)
+        controller.record(3.0, True)
+        assert controller.limit == 1
+        assert controller.history == [4, 2, 3, 1]
+
+    def test_target_latency(self):
+        """
+        Method ``record`` with a ``target_latency``.
+        """
+        controller = scheduler.AdaptiveConcurrency(2, window=1, target_latency=0.5)
+        controller.record(0.4, True)
+        controller.record(0.6, True)
+        assert controller.history == [2, 3, 1]
+        with pytest.raises(ValueError):
+            scheduler.AdaptiveConcurrency(4, maximum=2)
+
+
+class TestSchedule:
+    """
+    :py:func:`FanGraphs.leaders.scheduler.schedule_async`
+    """
+    def test_retries(self, monkeypatch):
+        """
+        Function ``schedule_async`` with failed attempts.
+        """
+        calls = {}
+
+        async def fake_run_job(scraper, browser, job, path, **options):
+            calls[path] = calls.get(path, 0) + 1
+            await asyncio.sleep(0.001)
+            if job.filters["season"] == "flaky" and calls[path] < 3:
+                raise RuntimeError("Stalled download")
+            if job.filters["season"] == "broken":
+                raise RuntimeError("Stalled download")
+            if job.filters["season"] == "invalid":
+                raise fangraphs.exceptions.InvalidFilterOption("invalid")
+
+        monkeypatch.setattr(batch, "run_job", fake_run_job)
+        jobs = [{"season": s} for s in ("2020", "flaky", "broken", "invalid")]
+        results = asyncio.run(scheduler.schedule_async(
+            "WAR", jobs, retry=scheduler.RetryPolicy(2, base=0.001), browser=object()
+        ))
+        assert [r.attempts for r in results] == [1, 3, 3, 1]
+        assert [r.ok for r in results] == [True, True, False, False]
+        assert isinstance(results[2].error, RuntimeError)
+        assert isinstance(results[3].error, fangraphs.exceptions.InvalidFilterOption)
+
+    def test_deadline(self, monkeypatch):
+        """
+        Function ``schedule_async`` with a job which does not finish before its deadline.
+        """
+        async def fake_run_job(scraper, browser, job, path, **options):
+            await asyncio.sleep(float(job.filters["delay"]))
+
+        monkeypatch.setattr(batch, "run_job", fake_run_job)
+        jobs = [{"delay": "0"}, {"filters": {"delay": "10"}, "path": "out/slow.csv"}]
+        results = asyncio.run(scheduler.schedule_async(
+            "WAR", jobs, deadline=0.05, browser=object()
+        ))
+        assert results[0].ok
+        assert isinstance(results[1].error, fangraphs.exceptions.DeadlineExceeded)
+        assert results[1].attempts == 1
+        assert results[1].elapsed < 1
+
+    def test_adaptive_concurrency(self, monkeypatch):
+        """
+        Function ``schedule_async`` with an adaptive concurrency limit.
+        """
+        running = []
+        peak = []
+
+        async def fake_run_job(scraper, browser, job, path, **options):
+            running.append(path)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(path)
+
+        monkeypatch.setattr(batch, "run_job", fake_run_job)
+        controller = scheduler.AdaptiveConcurrency(1, maximum=3, window=2, tolerance=10)
+        jobs = [{"season": str(year)} for year in range(2000, 2020)]
+        results = asyncio.run(scheduler.schedule_async(
+            "WAR", jobs, concurrency=controller, browser=object()
+        ))
+        assert all(r.ok for r in results)
+        assert peak[0] == 1
+        assert max(peak) == 3
+        assert controller.history[:3] == [1, 2, 3]
@@ -0,0 +1,122 @@
+#! python3
+# tests/test_seasons.py
+
+"""
+The docstring in each test identifies the function(s) of
+:py:mod:`FanGraphs.leaders.seasons` being tested.
+"""
+
+import csv
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import batch, cache, leaders, seasons
+
+
+def _read(path):
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+
+def _write(path, rows):
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows(rows)
+
+
+@pytest.fixture
+def exported(tmp_path, monkeypatch):
+    """
+    Replaces the browser export of each shard with a CSV file of one row per season.
+    The column ``wOBA`` only exists from 2020.
+    """
+    monkeypatch.chdir(tmp_path)
+    jobs = []
+
+    async def fake_run_job(scraper, browser, job, path, **options):
+        jobs.append(job)
+        first, last = int(job.filters["season1"]), int(job.filters["season2"])
+        if job.filters.get("team") == "bad" and last == 2021:
+            raise ValueError(last)
+        headers = ["Season", "Name", "WAR"] + (["wOBA"] if last >= 2020 else [])
+        _write(path, [headers] + [
+            [str(s), "A", "1.0"] + ([".400"] if last >= 2020 else [])
+            for s in range(first, last + 1)
+        ])
+
+    monkeypatch.setattr(batch, "run_job", fake_run_job)
+    return jobs
+
+
+class TestSeasons:
+    """
+    :py:mod:`FanGraphs.leaders.seasons`
+    """
+    def test_season_shards(self):
+        """
+        Function ``season_shards``.
+        """
+        assert seasons.season_shards(2019, 2021) == [(2019, 2019), (2020, 2020), (2021, 2021)]
+        assert seasons.season_shards("1995", "2021", span=10) == [
+            (1995, 1999), (2000, 2009), (2010, 2019), (2020, 2021)
+        ]
+        assert seasons.season_shards(2000, 2000, span=10) == [(2000, 2000)]
+        with pytest.raises(ValueError):
+            seasons.season_shards(2021, 2019)
+
+    def test_shard_jobs(self):
+        """
+        Function ``shard_jobs``.
+        """
+        jobs = seasons.shard_jobs(leaders.MajorLeague, {"stat": "Pitching"}, 2019, 2020)
+        assert [j.filters for j in jobs] == [
+            {"stat": "Pitching", "season1": "2019", "season2": "2019", "split_seasons": "True"},
+            {"stat": "Pitching", "season1": "2020", "season2": "2020", "split_seasons": "True"},
+        ]
+        assert jobs[0].path.endswith("MajorLeague-2019-2019.csv")
+        jobs = seasons.shard_jobs("International", {}, 2010, 2019, span=5)
+        assert jobs[1].filters == {"season1": "2015", "season2": "2019", "split_seasons": "True"}
+        for name in ("Splits", "GameSpan", "SeasonStat"):
+            with pytest.raises(ValueError):
+                seasons.shard_jobs(name, {}, 2019, 2020)
+
+    def test_merge(self, tmp_path):
+        """
+        Function ``merge``.
+        """
+        _write(tmp_path / "a.csv", [["Name", "WAR"], ["A", "1"]])
+        _write(tmp_path / "b.csv", [["Name", "wOBA", "WAR"], ["B", ".3", "2"]])
+        path = seasons.merge(
+            [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")], str(tmp_path / "merged.csv")
+        )
+        assert _read(path) == [["Name", "WAR", "wOBA"], ["A", "1", ""], ["B", "2", ".3"]]
+
+    def test_export_seasons(self, exported):
+        """
+        Function ``export_seasons_async``.
+        """
+        export_cache = cache.ExportCache(ttl=0, current_season=2021)
+        for _ in range(2):
+            path = seasons.export_seasons(
+                "International", {}, 2019, 2021, "out/kbo.csv", cache=export_cache, browser=object()
+            )
+            assert _read(path) == [
+                ["Season", "Name", "WAR", "wOBA"],
+                ["2019", "A", "1.0", ""], ["2020", "A", "1.0", ".400"], ["2021", "A", "1.0", ".400"],
+            ]
+        assert [j.filters["season1"] for j in exported] == ["2019", "2020", "2021", "2021"]
+        assert all(j.filters["split_seasons"] == "True" for j in exported)
+
+    def test_export_seasons_failed(self, exported, tmp_path):
+        """
+        Function ``export_seasons_async`` with a failing shard.
+        """
+        export_cache = cache.ExportCache(current_season=2022)
+        with pytest.raises(fangraphs.exceptions.ShardsFailed) as err:
+            seasons.export_seasons(
+                "MajorLeague", {"team": "bad"}, 2019, 2021, "out/mlb.csv",
+                cache=export_cache, browser=object()
+            )
+        assert list(err.value.failures) == ["out/shards/MajorLeague-2021-2021.csv"]
+        assert not list((tmp_path / "out" / "shards").iterdir())
+        assert export_cache.stats()["entries"] == 2
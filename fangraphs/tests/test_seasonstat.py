@@ -0,0 +1,182 @@
+#! python3
+# tests/test_seasonstat.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:class:`FanGraphs.leaders.leaders.SeasonStat` being tested.
+"""
+
+import asyncio
+import csv
+
+import pytest
+
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders.cache import ExportCache
+from fangraphs.leaders.leaders import SeasonStat
+
+
+def _table(rows):
+    body = "".join(
+        "<tr>{}</tr>".format("".join(f"<td>{c}</td>" for c in row)) for row in rows
+    )
+    return f"<table><thead><tr><th>Name</th><th>WAR</th></tr></thead><tbody>{body}</tbody></table>"
+
+
+class FakeGridPage:
+    """
+    Stand-in for a synchronous ``Playwright`` page showing a paginated data grid.
+    """
+    def __init__(self, rows, sizes=("10", "30", "100")):
+        self.rows = rows
+        self.sizes = list(sizes)
+        self.size = int(self.sizes[0]) if self.sizes else 10
+        self.current = 0
+        self.clicks = 0
+        self.contents = 0
+        self.shown_total = self.total
+        self.waits = 0
+
+    @property
+    def total(self):
+        return -(-len(self.rows) // self.size)
+
+    def _visible(self):
+        return self.rows[self.current * self.size:(self.current + 1) * self.size]
+
+    def content(self):
+        self.contents += 1
+        return (
+            f"<div class='table-scroll'>{_table(self._visible())}</div>"
+            "<div class='table-page-control'>"
+            f"<span class='table-control-total'>{self.total}</span></div>"
+        )
+
+    def inner_html(self, selector):
+        return _table(self._visible())
+
+    def inner_text(self, selector):
+        return str(self.shown_total)
+
+    def input_value(self, selector):
+        return str(self.size)
+
+    def query_selector(self, selector):
+        return object() if self.sizes else None
+
+    def eval_on_selector_all(self, selector, expression):
+        if selector.endswith("tr"):
+            return len(self._visible())
+        return self.sizes
+
+    def select_option(self, selector, value):
+        self.size, self.current = int(value), 0
+
+    def wait_for_function(self, expression, arg=None, timeout=None):
+        """
+        The pager shows the new total only once the grid has re-rendered.
+        """
+        assert len(self._visible()) != arg[1]
+        self.waits += 1
+        self.shown_total = self.total
+
+    def click(self, selector):
+        self.clicks += 1
+        self.current += 1
+
+    def wait_for_selector(self, selector):
+        pass
+
+
+@pytest.fixture
+def rows():
+    return [[f"Player {i}", str(i)] for i in range(50)]
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SeasonStat()
+
+
+def _read(path):
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+
+class TestSeasonStat:
+    """
+    :py:class:`FanGraphs.leaders.leaders.SeasonStat`
+    """
+    def test_export_single_pass(self, scraper, rows):
+        """
+        Instance method ``SeasonStat.export``.
+        """
+        scraper.page = FakeGridPage(rows)
+        assert scraper.export("out/grid.csv") == "out/grid.csv"
+        assert _read("out/grid.csv") == [["Name", "WAR"]] + rows
+        assert scraper.page.clicks == 0
+        assert scraper.page.contents == 0
+        assert scraper.page.waits == 1
+
+        scraper.page = FakeGridPage(rows, sizes=("100",))
+        scraper.export("out/grid.csv")
+        assert scraper.page.waits == 0
+
+    def test_export_pages(self, scraper, rows):
+        """
+        Instance method ``SeasonStat.export``.
+        """
+        scraper.page = FakeGridPage(rows, sizes=())
+        scraper.export("out/grid.csv")
+        assert _read("out/grid.csv") == [["Name", "WAR"]] + rows
+        assert scraper.page.clicks == 4
+
+    def test_export_single_pass_fallback(self, scraper, rows):
+        """
+        Instance method ``SeasonStat.export``.
+        """
+        scraper.page = FakeGridPage(rows, sizes=("10", "20"))
+        scraper.export("out/grid.csv")
+        assert _read("out/grid.csv") == [["Name", "WAR"]] + rows
+        assert scraper.page.clicks == 2
+
+    def test_export_cached(self, scraper, rows):
+        """
+        Instance method ``SeasonStat.export``.
+        """
+        scraper.cache = ExportCache(current_season=2021)
+        scraper.page = FakeGridPage(rows)
+        assert scraper.export("out/grid.csv") == "out/grid.csv"
+        scraper.page = None
+        assert scraper.export("out/copy.csv") == "out/copy.csv"
+        assert _read("out/copy.csv") == [["Name", "WAR"]] + rows
+
+        cached = async_leaders.SeasonStat(cache=scraper.cache)
+        exported = asyncio.run(cached.export("out/async.csv"))
+        assert exported == "out/async.csv"
+        assert _read("out/async.csv") == [["Name", "WAR"]] + rows
+
+    def test_fetch_table(self, scraper, rows):
+        """
+        Instance method ``SeasonStat.fetch_table``.
+        """
+        scraper.page = FakeGridPage(rows, sizes=())
+        columns = scraper.fetch_table()
+        assert columns == {
+            "Name": [r[0] for r in rows], "WAR": list(range(50))
+        }
+
+    def test_iter_rows(self, scraper, rows):
+        """
+        Instance method ``SeasonStat.iter_rows``.
+        """
+        scraper.page = FakeGridPage(rows, sizes=())
+        iterator = scraper.iter_rows()
+        assert next(iterator) == ["Name", "WAR"]
+        assert [next(iterator) for _ in range(10)] == rows[:10]
+        assert scraper.page.clicks == 0
+        assert next(iterator) == rows[10]
+        assert scraper.page.clicks == 1
+        assert list(iterator) == rows[11:]
+        assert scraper.page.clicks == 4
@@ -0,0 +1,312 @@
+#! python3
+# tests/test_state.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+the tracked filter-state model of :py:class:`FanGraphs.leaders.ScrapingUtilities`
+and :py:class:`FanGraphs.leaders.AsyncScrapingUtilities` being tested.
+"""
+
+import asyncio
+
+import bs4
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import async_leaders, leaders
+
+
+HTML = """
+<div class="controls-stats">
+    <div class="fgButton active">Batting</div><div class="fgButton">Pitching</div>
+</div>
+<div class="controls-board-view">
+    <div class="fgButton active">Dashboard</div><div class="fgButton">Standard</div>
+    <div class="fgButton">Advanced</div>
+</div>
+"""
+
+SPLITS_HTML = """
+<div id="root-menu-time-filter">
+    <div class="fg-dropdown splits multi-choice"><ul>
+        <li class="option">2019</li><li class="option">2020</li>
+    </ul></div>
+    <div class="fg-dropdown splits single-choice"><ul>
+        <li class="option">Last 7 days</li><li class="option highlight-selection">Last 30 days</li>
+    </ul></div>
+</div>
+<div id="stack-buttons">
+    <div class="fgButton"></div><div class="fgButton">Split Teams</div><div class="fgButton">Auto PT</div>
+</div>
+"""
+
+
+class FakeButtonsPage:
+    """
+    Stand-in for a synchronous ``Playwright`` page whose buttons become active when clicked.
+    """
+    def __init__(self):
+        self.soup = bs4.BeautifulSoup(HTML, features="lxml")
+        self.clicks = 0
+        self.contents = 0
+
+    def content(self):
+        self.contents += 1
+        return str(self.soup)
+
+    def click(self, selector):
+        self.clicks += 1
+        elem = self.soup.select_one(selector)
+        for sibling in elem.parent.select(".fgButton"):
+            sibling["class"] = ["fgButton"]
+        elem["class"] = ["fgButton", "active"]
+
+    def query_selector(self, selector):
+        return None
+
+    def wait_for_selector(self, selector):
+        pass
+
+
+class FakeElement:
+    """
+    Stand-in for a ``Playwright`` element handle.
+    """
+    def __init__(self, page, elem):
+        self.page = page
+        self.elem = elem
+
+    def click(self):
+        self.page.click_elem(self.elem)
+
+
+class FakeSplitsPage(FakeButtonsPage):
+    """
+    Stand-in for the splits page, with single- and multi-choice dropdowns and switches.
+    """
+    def __init__(self):
+        super().__init__()
+        self.soup = bs4.BeautifulSoup(SPLITS_HTML, features="lxml")
+
+    def click(self, selector):
+        self.click_elem(self.soup.select_one(selector))
+
+    def click_elem(self, elem):
+        if elem.name == "li":
+            self.clicks += 1
+            if "single-choice" in elem.find_parent("div")["class"]:
+                for sibling in elem.parent.select("li"):
+                    sibling["class"] = ["option"]
+            if "highlight-selection" in elem["class"]:
+                elem["class"].remove("highlight-selection")
+            else:
+                elem["class"].append("highlight-selection")
+        elif elem.parent.get("id") == "stack-buttons":
+            self.clicks += 1
+            if "isActive" in elem["class"]:
+                elem["class"].remove("isActive")
+            else:
+                elem["class"].append("isActive")
+
+    def query_selector_all(self, selector):
+        return [FakeElement(self, e) for e in self.soup.select(selector)]
+
+
+class AsyncFakePage:
+    """
+    Stand-in for an asynchronous ``Playwright`` page, which awaits the methods of a synchronous stand-in.
+    """
+    def __init__(self, page):
+        self.sync = page
+
+    async def content(self):
+        return self.sync.content()
+
+    async def click(self, selector):
+        self.sync.click(selector)
+
+    async def query_selector(self, selector):
+        return self.sync.query_selector(selector)
+
+    async def query_selector_all(self, selector):
+        return [AsyncFakeElement(e) for e in self.sync.query_selector_all(selector)]
+
+    async def wait_for_selector(self, selector):
+        self.sync.wait_for_selector(selector)
+
+
+class AsyncFakeElement:
+    """
+    Stand-in for an asynchronous ``Playwright`` element handle.
+    """
+    def __init__(self, elem):
+        self.elem = elem
+
+    async def click(self):
+        self.elem.click()
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper = leaders.GameSpan()
+    scraper.page = FakeButtonsPage()
+    scraper._compile_selectors()
+    return scraper
+
+
+class TestState:
+    """
+    :py:attr:`FanGraphs.leaders.ScrapingUtilities.state`
+    """
+    def test_current_option(self, scraper):
+        """
+        Instance method ``ScrapingUtilities.current_option``.
+        """
+        assert scraper.current_option("stat") == "Batting"
+        assert scraper.current_option("Stat") == "Batting"
+        assert scraper.page.contents == 1
+        assert scraper.state == {"stat": "Batting"}
+
+    def test_configure(self, scraper):
+        """
+        Instance method ``GameSpan.configure``.
+        """
+        scraper.configure("stat", "batting")
+        assert (scraper.page.clicks, scraper.refreshes) == (0, 0)
+
+        scraper.configure("stat", "pitching")
+        assert (scraper.page.clicks, scraper.refreshes) == (1, 1)
+        parses = scraper.parses
+        assert scraper.current_option("stat") == "Pitching"
+        assert scraper.parses == parses
+
+        scraper.configure_many({"stat": "Pitching", "type": "Standard"})
+        assert (scraper.page.clicks, scraper.refreshes) == (2, 2)
+        assert scraper.state == {"stat": "Pitching", "type": "Standard"}
+
+    def test_configure_marks_stale(self, scraper):
+        """
+        Instance method ``GameSpan._configure``, before the page is re-parsed.
+        """
+        assert scraper.current_option("stat") == "Batting"
+        assert scraper._configure("stat", "Pitching")
+        assert scraper.refreshes == 0
+        scraper.state.clear()
+        assert scraper.current_option("stat") == "Pitching"
+        assert scraper.page.contents == 2
+
+    def test_verify_state(self, scraper):
+        """
+        Instance method ``ScrapingUtilities.verify_state``.
+        """
+        scraper.configure("stat", "Pitching")
+        assert scraper.verify_state() == {}
+
+        scraper.page.click(".controls-stats > .fgButton:nth-child(1)")
+        scraper._refresh_parser()
+        assert scraper.verify_state() == {"stat": ("Pitching", "Batting")}
+
+        scraper.verify = True
+        with pytest.raises(fangraphs.exceptions.StateMismatch):
+            scraper.configure("type", "Advanced")
+
+    def test_verify_splits(self, tmp_path, monkeypatch):
+        """
+        Instance methods ``Splits.configure`` and ``Splits.current_option`` with ``verify=True``.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = leaders.Splits(verify=True)
+        scraper.page = FakeSplitsPage()
+        scraper._compile_selectors()
+
+        assert scraper.current_option("preset_range") == "Last 30 days"
+        scraper.configure("preset_range", "last 7 days")
+        assert scraper.current_option("preset_range") == "Last 7 days"
+        scraper.configure("preset_range", "Last 7 days")
+        assert scraper.page.clicks == 1
+
+        scraper.configure("time_filter", "2019")
+        scraper.configure("time_filter", "2020")
+        assert scraper.current_option("time_filter") == ["2019", "2020"]
+
+        scraper.configure("split_teams", "true")
+        assert scraper.state["split_teams"] == "True"
+        scraper.configure("split_teams", "True")
+        assert scraper.page.clicks == 4
+        assert scraper.verify_state() == {}
+
+
+class TestAsyncState:
+    """
+    :py:attr:`FanGraphs.leaders.AsyncScrapingUtilities.state`
+    """
+    def test_configure(self, tmp_path, monkeypatch):
+        """
+        Instance methods ``GameSpan.configure``, ``GameSpan.configure_many`` and ``GameSpan.current_option``
+        of :py:mod:`FanGraphs.leaders.async_leaders`.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = async_leaders.GameSpan()
+        scraper.page = AsyncFakePage(FakeButtonsPage())
+        scraper._compile_selectors()
+
+        async def run():
+            assert await scraper.current_option("Stat") == "Batting"
+            await scraper.configure("stat", "batting")
+            assert (scraper.page.sync.clicks, scraper.refreshes) == (0, 0)
+
+            await scraper.configure("stat", "pitching")
+            assert (scraper.page.sync.clicks, scraper.refreshes) == (1, 1)
+            parses = scraper.parses
+            assert await scraper.current_option("stat") == "Pitching"
+            assert scraper.parses == parses
+
+            await scraper.configure_many({"stat": "Pitching", "type": "Standard"})
+            assert (scraper.page.sync.clicks, scraper.refreshes) == (2, 2)
+            assert scraper.state == {"stat": "Pitching", "type": "Standard"}
+            assert scraper.filters == {"stat": "pitching", "type": "standard"}
+            assert await scraper.verify_state() == {}
+
+            scraper.page.sync.click(".controls-stats > .fgButton:nth-child(1)")
+            await scraper._refresh_parser()
+            assert await scraper.verify_state() == {"stat": ("Pitching", "Batting")}
+            scraper.verify = True
+            with pytest.raises(fangraphs.exceptions.StateMismatch):
+                await scraper.configure("type", "Advanced")
+
+            scraper.verify = False
+            assert await scraper._configure("type", "Standard")
+            scraper.state.clear()
+            assert await scraper.current_option("type") == "Standard"
+
+        asyncio.run(run())
+
+    def test_verify_splits(self, tmp_path, monkeypatch):
+        """
+        Instance methods ``Splits.configure`` and ``Splits.current_option``
+        of :py:mod:`FanGraphs.leaders.async_leaders` with ``verify=True``.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = async_leaders.Splits(verify=True)
+        scraper.page = AsyncFakePage(FakeSplitsPage())
+        scraper._compile_selectors()
+
+        async def run():
+            assert await scraper.current_option("preset_range") == "Last 30 days"
+            await scraper.configure("preset_range", "last 7 days")
+            assert await scraper.current_option("preset_range") == "Last 7 days"
+            await scraper.configure("preset_range", "Last 7 days")
+            assert scraper.page.sync.clicks == 1
+
+            await scraper.configure("time_filter", "2019")
+            await scraper.configure("time_filter", "2020")
+            assert await scraper.current_option("time_filter") == ["2019", "2020"]
+
+            await scraper.configure("split_teams", "true")
+            assert scraper.state["split_teams"] == "True"
+            await scraper.configure("split_teams", "True")
+            assert scraper.page.sync.clicks == 4
+            assert await scraper.verify_state() == {}
+
+        asyncio.run(run())
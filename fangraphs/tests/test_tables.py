@@ -0,0 +1,196 @@
+#! python3
+# tests/test_tables.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:mod:`FanGraphs.leaders.tables` being tested.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from fangraphs.leaders import tables
+
+
+HEADERS = ["Name", "Team", "G", "AVG", "K%", "Dollars"]
+ROWS = [
+    ["Mike Trout", "LAA", "134", ".291", "20.0 %", "$35.2"],
+    ["Juan Soto", "WSN", "150", ".282", "", "($1.5)"],
+    ["Mookie Betts", "LAD", "1,020", "0.3", "15.5 %", "$4"],
+]
+
+
+class TestTables:
+    """
+    :py:mod:`FanGraphs.leaders.tables`
+    """
+    def test_resolve_path(self):
+        """
+        Function ``resolve_path``.
+        """
+        assert tables.resolve_path("out/a.csv") == "out/a.csv"
+        assert tables.resolve_path("out/a.parquet") == "out/a.parquet"
+        assert tables.resolve_path("out/a.arrow", "arrow") == "out/a.arrow"
+        assert tables.resolve_path("out/a.csv", "parquet").endswith(".parquet")
+        assert tables.resolve_path(format="arrow").endswith(".arrow")
+        assert tables.resolve_path().endswith(".csv")
+        with pytest.raises(ValueError):
+            tables.resolve_path("out/a.csv", "xlsx")
+
+    def test_infer_column(self):
+        """
+        Function ``infer_column``.
+        """
+        assert tables.infer_column(["1", "2", ""]) == ([1, 2, None], int)
+        assert tables.infer_column(["1", ".5"]) == ([1.0, 0.5], float)
+        assert tables.infer_column(["20.0 %", "($1.5)"]) == ([0.2, -1.5], float)
+        assert tables.infer_column(["1,020", "3"]) == ([1020, 3], int)
+        assert tables.infer_column(["LAA", "1"]) == (["LAA", "1"], str)
+        assert tables.infer_column(["", None]) == ([None, None], str)
+        assert tables.infer_column([3, 1.5]) == ([3.0, 1.5], float)
+
+    def test_to_columns(self):
+        """
+        Function ``to_columns``.
+        """
+        columns = tables.to_columns(HEADERS, ROWS)
+        assert list(columns) == HEADERS
+        assert columns["Team"] == (["LAA", "WSN", "LAD"], str)
+        assert columns["G"] == ([134, 150, 1020], int)
+        assert columns["K%"][0] == [0.2, None, 0.155]
+        assert columns["Dollars"] == ([35.2, -1.5, 4.0], float)
+
+    def test_read_csv(self, tmp_path):
+        """
+        Functions ``write_csv`` and ``read_csv``.
+        """
+        path = tables.write_csv(HEADERS, ROWS, str(tmp_path / "table.csv"))
+        with open(path, "rb") as file:
+            assert tables.read_csv(file.read()) == (HEADERS, ROWS)
+        assert tables.read_csv("\ufeffA,B\r\n1,2\r\n".encode("utf-8")) == (["A", "B"], [["1", "2"]])
+        assert tables.read_csv("") == ([], [])
+
+    def test_iter_csv(self, tmp_path):
+        """
+        Function ``iter_csv``.
+        """
+        path = tables.write_csv(HEADERS, ROWS, str(tmp_path / "table.csv"))
+        rows = tables.iter_csv(path)
+        assert next(rows) == HEADERS
+        assert list(rows) == ROWS
+
+    def test_write_async(self, tmp_path, monkeypatch):
+        """
+        Functions ``write_async`` and ``collect_async``.
+        """
+        read = []
+
+        async def rows():
+            for row in [HEADERS, *ROWS]:
+                read.append(row)
+                yield row
+
+        writes = []
+        write = tables.TableWriter.write
+
+        def record(writer, chunk):
+            writes.append((len(chunk), len(read)))
+            write(writer, chunk)
+
+        monkeypatch.setattr(tables.TableWriter, "write", record)
+        path = asyncio.run(tables.write_async(rows(), str(tmp_path / "table.csv"), 2))
+        assert writes == [(2, 3), (1, 4)]
+        with open(path, "rb") as file:
+            assert tables.read_csv(file.read()) == (HEADERS, ROWS)
+        assert asyncio.run(tables.collect_async(rows())) == (HEADERS, ROWS)
+
+        async def empty():
+            return
+            yield
+
+        assert asyncio.run(tables.collect_async(empty())) == ([], [])
+
+    def test_json_rows(self):
+        """
+        Function ``json_rows``.
+        """
+        payload = {"data": [
+            {"Name": "<a href='/players/1'>Mike Trout</a>", "WAR": 8.3},
+            {"Name": "Juan Soto", "WAR": None, "Team": "WSN"},
+        ]}
+        headers, rows = tables.json_rows(payload)
+        assert headers == ["Name", "WAR", "Team"]
+        assert rows == [["Mike Trout", 8.3, ""], ["Juan Soto", "", "WSN"]]
+
+    def test_columnar(self):
+        """
+        Function ``columnar``.
+        """
+        columns = tables.columnar(HEADERS, ROWS)
+        assert columns["Name"] == ["Mike Trout", "Juan Soto", "Mookie Betts"]
+        assert columns["G"] == [134, 150, 1020]
+        assert columns["K%"] == [0.2, None, 0.155]
+        assert tables.columnar(["A"], []) == {"A": []}
+        with pytest.raises(ValueError):
+            tables.columnar(HEADERS, ROWS, "frame")
+
+    def test_columnar_numpy(self):
+        """
+        Function ``columnar`` with ``kind="numpy"``.
+        """
+        np = pytest.importorskip("numpy")
+        columns = tables.columnar(HEADERS, ROWS, "numpy")
+        assert columns["G"].dtype == np.int64
+        assert columns["AVG"].dtype == np.float64
+        assert np.isnan(columns["K%"][1])
+        assert columns["Team"].dtype == object
+
+    def test_columnar_arrow(self):
+        """
+        Function ``columnar`` with ``kind="arrow"``.
+        """
+        pa = pytest.importorskip("pyarrow")
+        batch = tables.columnar(HEADERS, ROWS, "arrow")
+        assert isinstance(batch, pa.RecordBatch)
+        assert batch.num_rows == 3
+        assert batch.schema.field("G").type == pa.int64()
+
+    @pytest.mark.parametrize("extension", [".parquet", ".arrow"])
+    def test_write_columnar(self, tmp_path, extension):
+        """
+        Functions ``write`` and ``convert`` with the columnar formats.
+        """
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        source = tables.write_csv(HEADERS, ROWS, str(tmp_path / "table.csv"))
+        path = tables.convert(source, str(tmp_path / f"table{extension}"))
+        assert os.path.exists(path)
+        if extension == ".parquet":
+            table = pa.parquet.read_table(path)
+        else:
+            table = pa.ipc.open_file(path).read_all()
+        assert table.column_names == HEADERS
+        assert table.schema.field("G").type == pa.int64()
+        assert table.schema.field("AVG").type == pa.float64()
+        assert table.column("G").to_pylist() == [134, 150, 1020]
+        assert table.column("K%").to_pylist()[1] is None
+
+    def test_write_columnar_without_pyarrow(self, tmp_path, monkeypatch):
+        """
+        Function ``write`` without the optional ``pyarrow`` dependency.
+        """
+        monkeypatch.setitem(__import__("sys").modules, "pyarrow", None)
+        with pytest.raises(ImportError, match="fangraphs\\[arrow\\]"):
+            tables.write(HEADERS, ROWS, str(tmp_path / "table.parquet"))
+
+    def test_columnar_without_numpy(self, monkeypatch):
+        """
+        Function ``columnar`` without the optional ``numpy`` dependency.
+        """
+        monkeypatch.setitem(__import__("sys").modules, "numpy", None)
+        with pytest.raises(ImportError, match="fangraphs\\[numpy\\]"):
+            tables.columnar(HEADERS, ROWS, "numpy")
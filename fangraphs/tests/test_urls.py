@@ -0,0 +1,92 @@
+#! python3
+# tests/test_urls.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:mod:`FanGraphs.leaders.urls` and the URL navigation of the scrapers being tested.
+"""
+
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import leaders, urls
+from fangraphs.selectors import leaders_params
+
+
+class FakePage:
+    """
+    Stand-in for a synchronous ``Playwright`` page which records navigations.
+    """
+    def __init__(self):
+        self.visited = []
+
+    def goto(self, url, **kwargs):
+        self.visited.append(url)
+
+    def wait_for_selector(self, selector):
+        pass
+
+
+class TestURLs:
+    """
+    :py:mod:`FanGraphs.leaders.urls`
+    """
+    def test_query_params(self):
+        """
+        Function ``query_params``.
+        """
+        params = urls.query_params(
+            leaders_params.GameSpan, {"Stat": "Pitching", "single_season": 2019, "season1": "2017"}
+        )
+        assert params == {"stats": "pit", "season1": "2017", "season": "2019"}
+        params = urls.query_params(leaders_params.SeasonStat, {"value": "WAR"})
+        assert params == {"stat": "WAR"}
+
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            urls.query_params(leaders_params.GameSpan, {"hof": "True"})
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            urls.query_params(leaders_params.International, {"team": "LG"})
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            urls.query_params(leaders_params.GameSpan, {"stat": "Fielding"})
+
+    def test_navigate(self, tmp_path, monkeypatch):
+        """
+        Instance methods ``International.url`` and ``International.navigate``.
+        """
+        monkeypatch.chdir(tmp_path)
+        scraper = leaders.International()
+        scraper.page = FakePage()
+        scraper.state["stat"] = "Batting"
+        scraper.navigate({"stat": "Pitching", "single_season": "2019", "split_seasons": "True"})
+
+        url = urlparse(scraper.page.visited[-1])
+        assert url.path == "/leaders/international"
+        assert parse_qs(url.query) == {
+            "stats": ["pit"], "season1": ["2019"], "season": ["2019"], "team": ["0,to"]
+        }
+        assert scraper.filters == {"stat": "pitching", "single_season": "2019", "split_seasons": "true"}
+        assert scraper.state == {}
+        assert scraper.refreshes == 1
+
+    def test_url_unsupported(self, tmp_path, monkeypatch):
+        """
+        Instance method ``MajorLeague.url``.
+        """
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(fangraphs.exceptions.URLStateUnsupported):
+            leaders.MajorLeague().url({"stat": "Pitching"})
+
+    def test_schema(self):
+        """
+        Attributes of the classes in :py:mod:`FanGraphs.selectors.leaders_params`.
+        """
+        for name in ("GameSpan", "International", "MajorLeague", "SeasonStat", "WAR"):
+            params = getattr(leaders_params, name)
+            for attr in ("params", "aliases", "composite", "unsupported", "defaults"):
+                assert hasattr(params, attr), (name, attr)
+            assert not set(params.unsupported) & set(params.params)
+            for query in ("type", "team", "league", "position"):
+                if query in params.params:
+                    assert params.params[query][1], (name, query)
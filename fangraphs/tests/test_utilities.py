@@ -0,0 +1,189 @@
+#! python3
+# tests/test_utilities.py
+
+"""
+The docstring in each test identifies the attribute(s)/method(s) of
+:py:class:`FanGraphs.leaders.ScrapingUtilities` being tested.
+"""
+
+import csv
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import ScrapingUtilities, ratelimit
+
+
+class FakePage:
+    """
+    Stand-in for a synchronous ``Playwright`` page serving static HTML.
+    """
+    def __init__(self, html):
+        self.html = html
+        self.url = "about:blank"
+        self.contents = 0
+
+    def content(self):
+        self.contents += 1
+        return self.html
+
+    def wait_for_selector(self, selector):
+        pass
+
+    def query_selector(self, selector):
+        return None
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+
+class FakeDownload:
+    """
+    Stand-in for a ``Playwright`` download, stored in a temporary file.
+    """
+    def __init__(self, path):
+        self._path = path
+        self.deleted = False
+
+    def path(self):
+        return self._path
+
+    def delete(self):
+        self.deleted = True
+
+
+class FakeDownloadInfo:
+    """
+    Stand-in for the event info of ``Page.expect_download``.
+    """
+    def __init__(self, download):
+        self.value = download
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeMessage:
+    """
+    Stand-in for a ``Playwright`` request or response of the data endpoint.
+    """
+    def __init__(self, url, payload=None, ok=True):
+        self.url = url
+        self.payload = payload
+        self.ok = ok
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper = ScrapingUtilities("https://fangraphs.com", waitfor=".table")
+    scraper.page = FakePage("<div class='table'><span>1</span></div>")
+    return scraper
+
+
+class TestScrapingUtilities:
+    """
+    :py:class:`FanGraphs.leaders.ScrapingUtilities`
+    """
+    def test_lazy_parser(self, scraper):
+        """
+        Instance attribute ``ScrapingUtilities.soup``.
+        Instance method ``ScrapingUtilities._refresh_parser``.
+        """
+        for _ in range(3):
+            scraper._refresh_parser()
+        assert scraper.page.contents == 0
+        assert scraper.soup.select_one("span").getText() == "1"
+        assert scraper.soup.select_one("span").getText() == "1"
+        assert scraper.page.contents == 1
+        assert (scraper.refreshes, scraper.parses, scraper.parses_avoided) == (3, 1, 2)
+
+        scraper.page.html = "<div class='table'><span>2</span></div>"
+        scraper._refresh_parser()
+        assert scraper.soup.select_one("span").getText() == "2"
+        assert scraper.parses == 2
+
+    def test_captured_rows(self, scraper):
+        """
+        Instance method ``ScrapingUtilities.captured_rows``.
+        Instance method ``ScrapingUtilities.export_captured``.
+        """
+        scraper.api = "/api/leaders/"
+        with pytest.raises(fangraphs.exceptions.ResponseNotCaptured):
+            scraper.captured_rows()
+
+        url = "https://fangraphs.com/api/leaders/special/60-game-span?pos=all"
+        payload = {"data": [
+            {"Name": "<a href='/players/1'>A</a>", "WAR": 1.5},
+            {"Name": "B", "WAR": None, "Team": "NYY"}
+        ]}
+        scraper._on_request(FakeMessage(url))
+        scraper._on_response(FakeMessage("https://fangraphs.com/ads.js"))
+        scraper._on_response(FakeMessage(url, payload={"data": []}, ok=False))
+        scraper._on_response(FakeMessage(url, payload=payload))
+        scraper._on_request_done(FakeMessage(url))
+        assert scraper.captures == 1
+        assert scraper.captured_rows() == (
+            ["Name", "WAR", "Team"], [["A", 1.5, ""], ["B", "", "NYY"]]
+        )
+
+        path = scraper.export_captured("out/captured.csv")
+        with open(path, newline="") as file:
+            assert list(csv.reader(file)) == [
+                ["Name", "WAR", "Team"], ["A", "1.5", ""], ["B", "", "NYY"]
+            ]
+
+    def test_download_rows(self, scraper, tmp_path, monkeypatch):
+        """
+        Instance method ``ScrapingUtilities.download_rows``.
+        Instance method ``ScrapingUtilities.fetch_table``.
+        """
+        source = tmp_path / "download"
+        source.write_bytes("\ufeffName,HR,AVG\r\nA,17,.281\r\nB,3,\r\n".encode("utf-8"))
+        download = FakeDownload(str(source))
+        scraper.page.expect_download = lambda: FakeDownloadInfo(download)
+        scraper.page.click = lambda selector: None
+        monkeypatch.setattr(
+            scraper, "iter_rows", lambda: scraper._iter_download(".data-export"), raising=False
+        )
+
+        assert scraper.download_rows(".data-export") == (
+            ["Name", "HR", "AVG"], [["A", "17", ".281"], ["B", "3", ""]]
+        )
+        assert download.deleted
+        assert scraper.fetch_table() == {"Name": ["A", "B"], "HR": [17, 3], "AVG": [0.281, None]}
+
+    def test_iter_download(self, scraper, tmp_path):
+        """
+        Instance method ``ScrapingUtilities._iter_download``.
+        """
+        source = tmp_path / "download"
+        source.write_text("Name,HR\nA,17\nB,3\n")
+        download = FakeDownload(str(source))
+        scraper.page.expect_download = lambda: FakeDownloadInfo(download)
+        scraper.page.click = lambda selector: None
+
+        rows = scraper._iter_download(".data-export")
+        assert next(rows) == ["Name", "HR"]
+        assert next(rows) == ["A", "17"]
+        assert not download.deleted
+        assert list(rows) == [["B", "3"]]
+        assert download.deleted
+
+    def test_throttle(self, scraper, tmp_path):
+        """
+        Instance method ``ScrapingUtilities._throttle``.
+        """
+        assert scraper._throttle() == 0.0
+        scraper.limiter = ratelimit.RateLimiter(rate=100, burst=1, path=str(tmp_path / "bucket"))
+        scraper.page.goto = lambda url, **kwargs: None
+        scraper.reset()
+        scraper.reset()
+        assert scraper.limiter.acquired == 2
+        assert scraper.limiter.waited > 0.0